@@ -0,0 +1,10 @@
+"""
+API Clients
+Connection-pooled clients for the DemoQA BookStore and Account APIs
+"""
+from api_tests.clients.account_client import AccountClient
+from api_tests.clients.base_client import BaseClient
+from api_tests.clients.bookstore_client import BookStoreClient
+from api_tests.clients.response_cache import ResponseCache
+
+__all__ = ["AccountClient", "BaseClient", "BookStoreClient", "ResponseCache"]
@@ -0,0 +1,31 @@
+"""
+Account API Client
+Typed helpers for the DemoQA /Account/v1 endpoints
+"""
+from api_tests.clients.base_client import BaseClient, bearer
+
+
+class AccountClient(BaseClient):
+    """Client for /Account/v1/*"""
+
+    def create_user(self, username: str, password: str, **kwargs):
+        return self.post("/Account/v1/User", json=_credentials(username, password), **kwargs)
+
+    def generate_token(self, username: str, password: str, **kwargs):
+        return self.post("/Account/v1/GenerateToken", json=_credentials(username, password), **kwargs)
+
+    def authorized(self, username: str, password: str, **kwargs):
+        return self.post("/Account/v1/Authorized", json=_credentials(username, password), **kwargs)
+
+    def login(self, username: str, password: str, **kwargs):
+        return self.post("/Account/v1/Login", json=_credentials(username, password), **kwargs)
+
+    def get_user(self, user_id: str, token: str, **kwargs):
+        return self.get(f"/Account/v1/User/{user_id}", headers=bearer(token), **kwargs)
+
+    def delete_user(self, user_id: str, token: str, **kwargs):
+        return self.delete(f"/Account/v1/User/{user_id}", headers=bearer(token), **kwargs)
+
+
+def _credentials(username: str, password: str) -> dict:
+    return {"userName": username, "password": password}
@@ -0,0 +1,110 @@
+"""
+Base API Client
+Keep-alive connection pool, default timeouts, retries for idempotent methods,
+optional response cache and per-call latency recording, shared by all API clients
+"""
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.helpers import url_pattern
+
+# Safe to send twice: retried on connection errors and 502/503/504
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class BaseClient:
+    """
+    requests.Session based API client bound to one base URL
+
+    - connections are reused (HTTP keep-alive) from a pool of `pool_size`
+    - every request gets `timeout` unless the call passes its own
+    - only idempotent methods are retried, with exponential backoff
+    - wall time of every call is recorded per endpoint in `latencies`
+    """
+
+    def __init__(self, base_url: str, pool_size: int = 10, timeout: float = 30.0,
+                 retries: int = 2, backoff_factor: float = 0.2, latencies: dict = None,
+                 cache=None):
+        """
+        Initialize the client
+        Args:
+            base_url: Scheme and host, e.g. https://demoqa.com
+            pool_size: Keep-alive connections kept per host
+            timeout: Default (connect, read) timeout in seconds
+            retries: Retries for idempotent methods
+            backoff_factor: Backoff between retries (0.2 -> 0.2s, 0.4s, ...)
+            latencies: Shared endpoint -> [ms] store (default: one per client)
+            cache: ResponseCache answering GET/HEAD calls (None = always send)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.latencies = latencies if latencies is not None else defaultdict(list)
+        self.cache = cache
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=IDEMPOTENT_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """
+        Send a request relative to the base URL
+        Args:
+            method: HTTP method
+            path: Path starting with /
+            kwargs: Passed to requests (json, params, headers, timeout, ...)
+        Returns:
+            requests.Response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        url = f"{self.base_url}{path}"
+        if self.cache is not None and self.cache.accepts(method, kwargs):
+            return self.cache.fetch(method, url, kwargs, lambda sent: self._send(method, url, path, sent))
+        return self._send(method, url, path, kwargs)
+
+    def _send(self, method: str, url: str, path: str, kwargs: dict) -> requests.Response:
+        # Only network calls are timed: cache hits would drown the endpoint percentiles
+        start = time.perf_counter()
+        try:
+            return self.session.request(method, url, **kwargs)
+        finally:
+            self._record(method, path, (time.perf_counter() - start) * 1000)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def _record(self, method: str, path: str, elapsed_ms: float):
+        # /Account/v1/User/<uuid> and friends are grouped as one endpoint
+        endpoint = f"{method} {url_pattern(path)}"
+        with self._lock:
+            self.latencies.setdefault(endpoint, []).append(round(elapsed_ms, 2))
+
+
+def bearer(token: str) -> dict:
+    """Authorization header for a DemoQA token"""
+    return {"Authorization": f"Bearer {token}"}
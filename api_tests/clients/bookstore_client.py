@@ -0,0 +1,42 @@
+"""
+BookStore API Client
+Typed helpers for the DemoQA /BookStore/v1 endpoints
+"""
+from api_tests.clients.base_client import BaseClient, bearer
+
+
+class BookStoreClient(BaseClient):
+    """Client for /BookStore/v1/*"""
+
+    def get_books(self, **kwargs):
+        return self.get("/BookStore/v1/Books", **kwargs)
+
+    def get_book(self, isbn: str, **kwargs):
+        return self.get("/BookStore/v1/Book", params={"ISBN": isbn}, **kwargs)
+
+    def add_books(self, user_id: str, isbns: list, token: str, **kwargs):
+        return self.post(
+            "/BookStore/v1/Books",
+            json={"userId": user_id, "collectionOfIsbns": [{"isbn": isbn} for isbn in isbns]},
+            headers=bearer(token),
+            **kwargs,
+        )
+
+    def replace_book(self, user_id: str, old_isbn: str, new_isbn: str, token: str, **kwargs):
+        return self.put(
+            f"/BookStore/v1/Books/{old_isbn}",
+            json={"userId": user_id, "isbn": new_isbn},
+            headers=bearer(token),
+            **kwargs,
+        )
+
+    def remove_book(self, user_id: str, isbn: str, token: str, **kwargs):
+        return self.delete(
+            "/BookStore/v1/Book",
+            json={"userId": user_id, "isbn": isbn},
+            headers=bearer(token),
+            **kwargs,
+        )
+
+    def clear_books(self, user_id: str, token: str, **kwargs):
+        return self.delete("/BookStore/v1/Books", params={"UserId": user_id}, headers=bearer(token), **kwargs)
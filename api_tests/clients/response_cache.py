@@ -0,0 +1,224 @@
+"""
+API Response Cache
+Caches safe GET/HEAD responses in memory (LRU) and on disk (shared by xdist
+workers), serving them while fresh and revalidating them with ETag /
+Last-Modified once their TTL has passed
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+# Headers describing the stored (already decoded) body incorrectly or not at all
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+# Headers a 304 carries that replace the stored ones (RFC 9111 4.3.4)
+_REVALIDATION_HEADERS = ("etag", "last-modified", "cache-control", "expires", "date")
+
+
+class ResponseCache:
+    """
+    Cache for read-only API calls
+
+    - only GET/HEAD without an Authorization header and with a 2xx answer are stored
+    - an entry is served without a request for `ttl_s` seconds (or the response's
+      Cache-Control max-age); `no-store` responses are never kept
+    - a stale entry with an ETag or Last-Modified is revalidated with a conditional
+      request; 304 renews it (and its validators and Cache-Control) without
+      transferring the body
+    - stored header names are lower case, whatever casing the server used
+    - memory holds the `max_entries` most recently used entries; the disk store is
+      trimmed to `max_disk_entries` least recently used ones on close()
+    """
+
+    def __init__(self, store_dir: str = None, ttl_s: float = 300.0, max_entries: int = 256,
+                 max_disk_entries: int = 1024):
+        """
+        Initialize the cache
+        Args:
+            store_dir: Folder shared by all workers (None = memory only)
+            ttl_s: Seconds a response is used without revalidation
+            max_entries: Entries kept in memory
+            max_disk_entries: Entries kept on disk after close()
+        """
+        self.store_dir = Path(store_dir) if store_dir else None
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def accepts(self, method: str, kwargs: dict) -> bool:
+        """Whether a request may be answered from the cache"""
+        headers = CaseInsensitiveDict(kwargs.get("headers") or {})
+        return method.upper() in CACHEABLE_METHODS and "Authorization" not in headers and not kwargs.get("stream")
+
+    def fetch(self, method: str, url: str, kwargs: dict, send) -> requests.Response:
+        """
+        Answer a request from the cache, revalidating or fetching as needed
+        Args:
+            method: GET or HEAD
+            url: Absolute URL (without params)
+            kwargs: requests keyword arguments (params, headers, timeout ...)
+            send: Callable(kwargs) -> requests.Response that performs the network call
+        Returns:
+            requests.Response: Cached (response.from_cache is True) or fresh response
+        """
+        full_url = requests.Request(method, url, params=kwargs.get("params")).prepare().url
+        key = hashlib.sha1(f"{method.upper()} {full_url}".encode()).hexdigest()
+        entry = self._get(key)
+
+        if entry and time.time() < entry["expires"]:
+            self._count("hits")
+            return _to_response(entry, full_url)
+
+        request_kwargs = kwargs
+        if entry:
+            validators = {}
+            if entry["headers"].get("etag"):
+                validators["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                validators["If-Modified-Since"] = entry["headers"]["last-modified"]
+            if validators:
+                request_kwargs = {**kwargs, "headers": {**(kwargs.get("headers") or {}), **validators}}
+
+        response = send(request_kwargs)
+        if entry and response.status_code == 304:
+            self._count("revalidated")
+            entry["headers"].update(_headers(response.headers, _REVALIDATION_HEADERS))
+            entry["expires"] = time.time() + self._lifetime(response.headers)
+            self._put(key, entry)
+            return _to_response(entry, full_url)
+
+        self._count("misses")
+        if 200 <= response.status_code < 300 and "no-store" not in response.headers.get("Cache-Control", ""):
+            self._put(key, {
+                "method": method.upper(),
+                "url": full_url,
+                "status": response.status_code,
+                "headers": _headers(response.headers),
+                "encoding": response.encoding,
+                "body": response.content,
+                "expires": time.time() + self._lifetime(response.headers),
+            })
+            self._count("stored")
+        return response
+
+    def clear(self):
+        """Forget every entry (memory and disk)"""
+        with self._lock:
+            self._entries.clear()
+        if self.store_dir and self.store_dir.exists():
+            for path in self.store_dir.glob("*/*"):
+                path.unlink(missing_ok=True)
+
+    def close(self):
+        """Trim the disk store to the most recently used max_disk_entries"""
+        if not self.store_dir or not self.store_dir.exists():
+            return
+        metas = sorted(self.store_dir.glob("*/*.json"), key=_mtime, reverse=True)
+        for meta_path in metas[self.max_disk_entries:]:
+            meta_path.unlink(missing_ok=True)
+            meta_path.with_suffix(".body").unlink(missing_ok=True)
+
+    def _lifetime(self, headers) -> float:
+        match = re.search(r"max-age=(\d+)", headers.get("Cache-Control", ""))
+        return float(match.group(1)) if match else self.ttl_s
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = self._load(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def _put(self, key: str, entry: dict):
+        self._remember(key, entry)
+        if self.store_dir:
+            self._save(key, entry)
+
+    def _remember(self, key: str, entry: dict):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _paths(self, key: str):
+        folder = self.store_dir / key[:2]
+        return folder / f"{key}.json", folder / f"{key}.body"
+
+    def _load(self, key: str):
+        if not self.store_dir:
+            return None
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+            os.utime(meta_path)  # disk LRU order
+        except (OSError, ValueError):
+            return None
+        # Entries written before header names were lower-cased
+        return {**meta, "headers": _headers(meta.get("headers", {})), "body": body}
+
+    def _save(self, key: str, entry: dict):
+        meta_path, body_path = self._paths(key)
+        meta = {name: value for name, value in entry.items() if name != "body"}
+        try:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to temp files first so parallel workers never read half a file
+            _atomic_write(body_path, entry["body"])
+            _atomic_write(meta_path, json.dumps(meta, indent=2).encode("utf-8"))
+        except OSError:
+            pass  # the memory copy still serves this worker
+
+
+def _headers(headers, names=None) -> dict:
+    """Lower-cased header names, without the ones describing the raw body (or only `names`)"""
+    return {
+        name.lower(): value for name, value in headers.items()
+        if (name.lower() in names if names else name.lower() not in _DROP_HEADERS)
+    }
+
+
+def _to_response(entry: dict, url: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response._content = entry["body"]
+    response.encoding = entry["encoding"]
+    response.url = url
+    response.reason = "OK"
+    response.from_cache = True
+    return response
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _atomic_write(path: Path, data: bytes):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -8,18 +8,12 @@ NOTE:
 """
 
 import pytest
-import random
-import string
 
 
 class TestAccountAPI:
     """Test suite for Account API endpoints"""
 
-    def _generate_username(self):
-        """Generate a random username to avoid duplicates"""
-        return "testuser_" + "".join(random.choices(string.ascii_lowercase + string.digits, k=8))
-
-    def test_create_user_account(self, api_request):
+    def test_create_user_account(self, api_request, data_factory):
         """
         Test: POST /Account/v1/User
         Description: Create a new user account
@@ -28,7 +22,8 @@ class TestAccountAPI:
 
         print("\n🧪 TEST STARTED: Create User Account")
 
-        username = self._generate_username()
+        # Unique per run and worker: no duplicate-user 400s
+        username = data_factory.username()
         password = "Test@12345"
 
         payload = {
@@ -58,7 +53,7 @@ class TestAccountAPI:
 
         print("🏁 TEST COMPLETED: Create User Account")
 
-    def test_create_user_with_weak_password(self, api_request):
+    def test_create_user_with_weak_password(self, api_request, data_factory):
         """
         Test: POST /Account/v1/User with weak password
         Description: Attempt user creation with invalid password
@@ -67,7 +62,7 @@ class TestAccountAPI:
 
         print("\n🧪 TEST STARTED: Create User with Weak Password")
 
-        username = self._generate_username()
+        username = data_factory.username()
         weak_password = "test123"
 
         payload = {
@@ -92,7 +87,7 @@ class TestAccountAPI:
 
         print("🏁 TEST COMPLETED: Weak Password Validation")
 
-    def test_generate_token(self, api_request):
+    def test_generate_token(self, api_request, pooled_user):
         """
         Test: POST /Account/v1/GenerateToken
         Description: Generate auth token for valid user
@@ -101,28 +96,15 @@ class TestAccountAPI:
 
         print("\n🧪 TEST STARTED: Generate Token")
 
-        # Step 1: Create user
-        username = self._generate_username()
-        password = "Test@12345"
-
-        print("🔐 Step 1: Creating user account...")
-
-        create_response = api_request.post(
-            "/Account/v1/User",
-            json={"userName": username, "password": password}
-        )
-
-        if create_response.status_code != 201:
-            pytest.xfail("⚠️ User creation failed, cannot test token generation")
-
-        print("✅ User created successfully")
+        # Step 1: Existing user from the session pool (no per-test signup)
+        print(f"🔐 Step 1: Using pooled user {pooled_user.username}")
 
         # Step 2: Generate token
         print("🔐 Step 2: Generating token...")
 
         token_response = api_request.post(
             "/Account/v1/GenerateToken",
-            json={"userName": username, "password": password}
+            json=pooled_user.credentials
         )
 
         print(f"\n📡 Status Code: {token_response.status_code}")
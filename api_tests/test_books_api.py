@@ -67,7 +67,7 @@ class TestBooksAPI:
 
         print("🏁 TEST COMPLETED: Get All Books")
 
-    def test_get_specific_book(self, api_request):
+    def test_get_specific_book(self, api_request, books_catalog):
         """
         Test: GET /BookStore/v1/Book?ISBN={isbn}
         Description: Fetch a specific book using a valid ISBN
@@ -78,8 +78,8 @@ class TestBooksAPI:
 
         print("\n🧪 TEST STARTED: Get Specific Book")
 
-        # Known valid ISBN from DemoQA
-        isbn = "9781449325862"  # Git Pocket Guide
+        # A valid ISBN from the current catalog (fetched once per session)
+        isbn = books_catalog[0]["isbn"]
 
         # Step 1: Send GET request for a specific book
         response = api_request.get(f"/BookStore/v1/Book?ISBN={isbn}")
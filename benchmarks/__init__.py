@@ -0,0 +1,5 @@
+"""
+Framework overhead benchmarks (run against the local DemoQA stand-in)
+
+    python -m benchmarks
+"""
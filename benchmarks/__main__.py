@@ -0,0 +1,64 @@
+"""
+Run the framework benchmarks against the local DemoQA stand-in
+
+    python -m benchmarks                                  # results -> benchmarks/results/<timestamp>.json
+    python -m benchmarks --engines chromium firefox webkit --repeat 50
+    python -m benchmarks --compare benchmarks/results/baseline.json   # exit 1 on regressions
+"""
+import argparse
+import json
+import sys
+from datetime import datetime
+
+from playwright.sync_api import sync_playwright
+
+from benchmarks import bench_api, bench_browser, bench_page_objects
+from benchmarks.harness import BenchmarkRun, compare
+from utils.local_demoqa import LocalDemoQA
+
+SUITES = ("browser", "page_objects", "api")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LearnNow framework benchmarks")
+    parser.add_argument("--engines", nargs="+", default=["chromium"],
+                        choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--repeat", type=int, default=20, help="Measured iterations per benchmark")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", metavar="BASELINE", help="Result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Relative slowdown counted as a regression (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = BenchmarkRun()
+    with LocalDemoQA() as server:
+        print(f"🌐 Benchmarking against {server.url}\n")
+        if "api" in args.only:
+            bench_api.run(results, server.url, args.repeat)
+        if {"browser", "page_objects"} & set(args.only):
+            with sync_playwright() as playwright:
+                if "browser" in args.only:
+                    bench_browser.run(playwright, results, server.url, args.engines, args.repeat)
+                if "page_objects" in args.only:
+                    bench_page_objects.run(playwright, results, server.url, args.engines[0], args.repeat)
+
+    output = args.output or f"benchmarks/results/{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    print(f"\n✅ Results saved: {results.save(output)}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(baseline, results.as_dict(), args.threshold)
+        if not regressions:
+            print(f"✅ No regressions beyond {args.threshold:.0%} vs {args.compare}")
+            return 0
+        print(f"❌ {len(regressions)} regression(s) vs {args.compare}:")
+        for name, metric, old, new, change in regressions:
+            print(f"   {name}: {metric} {old} -> {new} ({change:+.0%})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+API Client Benchmarks
+Single-request latency and sequential request rate of the pooled BookStoreClient
+"""
+import time
+
+from api_tests.clients import BookStoreClient
+from benchmarks.harness import BenchmarkRun, measure
+
+
+def run(results: BenchmarkRun, base_url: str, repeat: int, requests: int = 200):
+    """Measure BookStoreClient against the local server"""
+    client = BookStoreClient(base_url)
+
+    # Any book will do: take the first of whatever catalog the server seeds
+    response = client.get_books()
+    response.raise_for_status()
+    books = response.json()["books"]
+    if not books:
+        raise RuntimeError("The catalog is empty: nothing to request by ISBN")
+    isbn = books[0]["isbn"]
+
+    results.record("api_client.get_books", measure(
+        lambda: client.get_books(), repeat=repeat))
+    results.record("api_client.get_book", measure(
+        lambda: client.get_book(isbn), repeat=repeat))
+
+    start = time.perf_counter()
+    errors = 0
+    for _ in range(requests):
+        if client.get_books().status_code != 200:
+            errors += 1
+    elapsed = time.perf_counter() - start
+    results.record("api_client.request_rate", {
+        "n": requests,
+        "errors": errors,
+        "requests_per_s": round(requests / elapsed, 1),
+    })
+    client.close()
@@ -0,0 +1,44 @@
+"""
+Browser Benchmarks
+Browser launch per engine and context creation with and without video
+"""
+import tempfile
+
+from playwright.sync_api import Error
+
+from benchmarks.harness import BenchmarkRun, measure
+
+VIEWPORT = {"width": 1920, "height": 1080}
+
+
+def run(playwright, results: BenchmarkRun, base_url: str, engines: list, repeat: int):
+    """Launch/close every engine, then open a context + page with and without video"""
+    for engine in engines:
+        browser_type = getattr(playwright, engine)
+
+        try:
+            results.record(f"browser.launch[{engine}]", measure(
+                lambda: browser_type.launch(headless=True).close(),
+                repeat=max(3, repeat // 4), warmup=1,
+            ))
+        except Error as error:
+            results.skip(f"browser.launch[{engine}]", str(error).splitlines()[0])
+            continue
+
+        browser = browser_type.launch(headless=True)
+        try:
+            def new_context(**options):
+                context = browser.new_context(viewport=VIEWPORT, base_url=base_url, **options)
+                context.new_page().goto("/")
+                context.close()
+
+            results.record(f"context.create[{engine}]", measure(new_context, repeat=repeat))
+
+            with tempfile.TemporaryDirectory() as video_dir:
+                results.record(f"context.create_with_video[{engine}]", measure(
+                    lambda: new_context(record_video_dir=video_dir,
+                                        record_video_size={"width": 1280, "height": 720}),
+                    repeat=repeat,
+                ))
+        finally:
+            browser.close()
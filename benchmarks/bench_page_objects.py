@@ -0,0 +1,61 @@
+"""
+Page Object Benchmarks
+Round trips of BasePage actions, HomePage.get_cards_count and expect() polling latency
+"""
+from playwright.sync_api import Error, expect
+
+from benchmarks.harness import BenchmarkRun, measure
+from ui_tests.pages.base_page import BasePage
+from ui_tests.pages.home_page import HomePage
+
+# Appends an element after the given delay (ms), so expect() has to poll for it
+_APPEND_LATER = """delay => {
+  document.querySelectorAll('#bench-late').forEach(el => el.remove());
+  setTimeout(() => {
+    const el = document.createElement('div');
+    el.id = 'bench-late';
+    el.textContent = 'ready';
+    document.body.appendChild(el);
+  }, delay);
+}"""
+
+
+def run(playwright, results: BenchmarkRun, base_url: str, engine: str, repeat: int):
+    """Drive the page objects against the local server on one engine"""
+    try:
+        browser = getattr(playwright, engine).launch(headless=True)
+    except Error as error:
+        results.skip(f"page_objects[{engine}]", str(error).splitlines()[0])
+        return
+
+    try:
+        context = browser.new_context(viewport={"width": 1920, "height": 1080}, base_url=base_url)
+        page = context.new_page()
+
+        page.goto("/text-box")
+        base_page = BasePage(page)
+        results.record("base_page.fill_text", measure(
+            lambda: base_page.fill_text("#userName", "Benchmark User"), repeat=repeat))
+        results.record("base_page.click_element", measure(
+            lambda: base_page.click_element("#submit"), repeat=repeat))
+        results.record("base_page.get_text", measure(
+            lambda: base_page.get_text("#name"), repeat=repeat))
+
+        home_page = HomePage(page)
+        home_page.open()
+        results.record("home_page.get_cards_count", measure(home_page.get_cards_count, repeat=repeat))
+
+        for delay in (0, 100):
+            def poll():
+                page.evaluate(_APPEND_LATER, delay)
+                expect(page.locator("#bench-late")).to_be_visible(timeout=5000)
+
+            stats = measure(poll, repeat=repeat)
+            # Report the latency on top of the element's own delay
+            stats = {name: round(value - delay, 3) if name.endswith("_ms") else value
+                     for name, value in stats.items()}
+            results.record(f"expect.to_be_visible[+{delay}ms]", stats)
+
+        context.close()
+    finally:
+        browser.close()
@@ -0,0 +1,125 @@
+"""
+Benchmark Harness
+Timing, result files and run-to-run comparison shared by all benchmarks
+"""
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+
+from utils.timing import percentile
+
+
+def measure(func, repeat: int = 20, warmup: int = 2) -> dict:
+    """
+    Time repeated calls of a function
+    Args:
+        func: Callable without arguments
+        repeat: Measured calls
+        warmup: Unmeasured calls made first
+    Returns:
+        dict: Statistics in milliseconds
+    """
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "n": len(samples),
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+    }
+
+
+class BenchmarkRun:
+    """
+    Results of one benchmark run, keyed by benchmark name
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.skipped = {}
+
+    def record(self, name: str, stats: dict):
+        self.results[name] = stats
+        print(f"{name:<48}{_headline(stats)}")
+
+    def skip(self, name: str, reason: str):
+        self.skipped[name] = reason
+        print(f"{name:<48}skipped: {reason}")
+
+    def as_dict(self) -> dict:
+        return {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "environment": _environment(),
+            "results": self.results,
+            "skipped": self.skipped,
+        }
+
+    def save(self, path: str):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.as_dict(), indent=2), encoding="utf-8")
+        return path
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.2) -> list:
+    """
+    Find benchmarks that got slower (or lost throughput) beyond a threshold
+    Args:
+        baseline: Saved run (BenchmarkRun.as_dict())
+        current: Saved run to check
+        threshold: Allowed relative change, 0.2 = 20%
+    Returns:
+        list: (name, metric, baseline value, current value, relative change) per regression
+    """
+    regressions = []
+    for name, stats in current["results"].items():
+        before = baseline["results"].get(name)
+        if not before:
+            continue
+        metric = "requests_per_s" if "requests_per_s" in stats else "median_ms"
+        old, new = before.get(metric), stats.get(metric)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        # Higher is better for throughput, lower is better for latency
+        worse = -change if metric == "requests_per_s" else change
+        if worse > threshold:
+            regressions.append((name, metric, old, new, change))
+    return regressions
+
+
+def _headline(stats: dict) -> str:
+    if "requests_per_s" in stats:
+        return f"{stats['requests_per_s']:>10.1f} req/s"
+    return f"{stats['median_ms']:>10.2f} ms median | {stats['p95_ms']:.2f} ms p95"
+
+
+def _environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    try:
+        from importlib.metadata import version
+        playwright_version = version("playwright")
+    except Exception:
+        playwright_version = ""
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "playwright": playwright_version,
+    }
@@ -0,0 +1,7 @@
+"""
+Framework Configuration
+Named settings profiles (local-debug, ci, perf, offline) shared by fixtures and page objects
+"""
+from config.settings import PROFILES, Settings, get_settings, load_settings
+
+__all__ = ["PROFILES", "Settings", "get_settings", "load_settings"]
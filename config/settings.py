@@ -0,0 +1,113 @@
+"""
+Framework Settings
+Typed, load-once settings with named profiles, so one switch (--profile or
+LEARNNOW_PROFILE) tunes browser, timeouts, artifacts and throughput knobs together
+"""
+import os
+from dataclasses import dataclass, field, replace
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Everything a profile controls
+    Timeouts are in milliseconds except test_timeout_s (pytest-timeout, seconds).
+    """
+    profile: str
+
+    # Browser
+    headless: bool = True
+    slow_mo: int = 0
+    viewport: dict = field(default_factory=lambda: {"width": 1920, "height": 1080})
+    video_size: dict = field(default_factory=lambda: {"width": 1280, "height": 720})
+
+    # Timeouts
+    default_timeout_ms: int = 30000
+    navigation_timeout_ms: int = 60000
+    element_timeout_ms: int = 15000
+    test_timeout_s: int = 300
+
+    # Adaptive locator timeouts: p99 wait x factor, clamped to [floor, default_timeout_ms]
+    adaptive_timeout_factor: float = 3.0
+    adaptive_timeout_floor_ms: int = 1000
+
+    # API client: keep-alive connections per host, request timeout (seconds), idempotent retries
+    api_pool_size: int = 10
+    api_timeout_s: float = 30.0
+    api_retries: int = 2
+
+    # Artifact directories
+    screenshots_dir: str = "screenshots"
+    videos_dir: str = "videos"
+    reports_dir: str = "reports"
+
+    # Throughput knobs (defaults of the matching command line options)
+    context_pool_size: int = 1
+    record_video: str = "retain-on-failure"
+    block_resources: str = "full"
+    network_cache: str = "off"
+    local_demoqa: bool = False
+    trace_mode: str = "off"
+
+
+PROFILES = {
+    # Watchable runs on a developer machine
+    "local-debug": Settings("local-debug", headless=False, slow_mo=300),
+    # Headless, same timeouts and artifacts as local
+    "ci": Settings("ci", trace_mode="retain-on-failure"),
+    # High-throughput: no slow-mo, no video, warm contexts, no ads, shorter waits
+    "perf": Settings(
+        "perf",
+        default_timeout_ms=10000,
+        navigation_timeout_ms=30000,
+        element_timeout_ms=10000,
+        test_timeout_s=120,
+        context_pool_size=2,
+        record_video="off",
+        block_resources="no-ads",
+        api_pool_size=20,
+        api_timeout_s=10.0,
+    ),
+    # No network at all: everything runs against the local DemoQA stand-in
+    "offline": Settings(
+        "offline",
+        default_timeout_ms=10000,
+        navigation_timeout_ms=15000,
+        element_timeout_ms=10000,
+        test_timeout_s=120,
+        record_video="off",
+        block_resources="minimal",
+        local_demoqa=True,
+        api_timeout_s=5.0,
+        api_retries=0,
+    ),
+}
+
+_settings = None
+
+
+def default_profile() -> str:
+    """LEARNNOW_PROFILE if set, otherwise ci on CI and local-debug elsewhere"""
+    return os.getenv("LEARNNOW_PROFILE") or ("ci" if os.getenv("CI") == "true" else "local-debug")
+
+
+def load_settings(profile: str = None, **overrides) -> Settings:
+    """
+    Select the settings for this process (called once, from pytest_configure)
+    Args:
+        profile: One of PROFILES (default: default_profile())
+        overrides: Individual fields to change
+    Returns:
+        Settings: The active settings
+    """
+    global _settings
+    name = profile or default_profile()
+    if name not in PROFILES:
+        raise ValueError(f"Unknown settings profile: {name} (choose from {', '.join(PROFILES)})")
+    _settings = replace(PROFILES[name], **overrides)
+    return _settings
+
+
+def get_settings() -> Settings:
+    """The active settings, loading the default profile on first use"""
+    return _settings or load_settings()
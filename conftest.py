@@ -4,11 +4,294 @@ Stable for Chromium, Firefox, WebKit (Local + CI)
 """
 
 import os
+import inspect
 import pytest
-import requests
 from playwright.sync_api import sync_playwright
-from pathlib import Path
-from datetime import datetime
+
+from api_tests.clients import AccountClient, BaseClient, BookStoreClient, ResponseCache
+from config import PROFILES as SETTINGS_PROFILES, get_settings, load_settings
+from utils import adaptive_timeouts, event_log, locators
+from utils.adaptive_timeouts import AdaptiveTimeouts, CACHE_KEY as LOCATOR_TIMINGS_KEY
+from utils.artifact_retention import ArtifactRetention, compact_index
+from utils.async_engine import AsyncEngine
+from utils.locators import CACHE_KEY as LOCATOR_WINNERS_KEY, SelectorResolver
+from utils.context_pool import ContextPool, PoolStats
+from utils.data_factory import DataFactory, new_run_id
+from utils.duration_scheduler import DurationSchedulerPlugin
+from utils.event_log import EventLog, EventLogPlugin, LEVELS as EVENT_LEVELS, events_path
+from utils.flaky_history import FlakyHistoryPlugin
+from utils.impact import ImpactPlugin
+from utils.local_demoqa import LocalDemoQA
+from utils.network_cache import MODES as NETWORK_CACHE_MODES, NetworkCache
+from utils.screenshots import ScreenshotWriter
+from utils.resource_blocking import (
+    CACHE_KEY as RESOURCE_SIZES_KEY, PROFILES as BLOCKING_PROFILES, ResourceBlocker, ResourceSizes,
+)
+from utils.tracing import MODES as TRACE_MODES, TraceRecorder
+from utils.timing import TimingPlugin, instrument_page, percentile, phase
+from utils.user_pool import UserPool
+
+CONTEXT_POOL_STATS = pytest.StashKey[PoolStats]()
+NETWORK_CACHE_STATS = pytest.StashKey[dict]()
+BLOCKING_STATS = pytest.StashKey[dict]()
+API_LATENCIES = pytest.StashKey[dict]()
+API_CACHE_STATS = pytest.StashKey[dict]()
+TRACE_STATS = pytest.StashKey[dict]()
+ARTIFACT_STATS = pytest.StashKey[dict]()
+RUN_ID = pytest.StashKey[str]()
+
+# Options that fall back to the settings profile when neither the
+# command line nor the environment sets them
+PROFILE_OPTIONS = (
+    "context_pool_size", "local_demoqa", "record_video", "network_cache", "block_resources",
+    "api_pool_size", "api_timeout_s", "api_retries", "trace_mode",
+)
+
+
+# ===============================
+# COMMAND LINE OPTIONS
+# ===============================
+
+def pytest_addoption(parser):
+    group = parser.getgroup("learnnow", "LearnNow framework")
+    group.addoption(
+        "--profile",
+        choices=sorted(SETTINGS_PROFILES),
+        default=None,
+        help="Settings profile (default: LEARNNOW_PROFILE, else ci on CI and local-debug locally)",
+    )
+    group.addoption(
+        "--context-pool-size",
+        type=int,
+        default=os.getenv("CONTEXT_POOL_SIZE"),
+        help="Warm browser contexts kept per worker (0 = fresh context per test)",
+    )
+    group.addoption(
+        "--local-demoqa",
+        action="store_true",
+        default=True if os.getenv("LOCAL_DEMOQA") == "true" else None,
+        help="Run UI and API tests against an in-process DemoQA stand-in",
+    )
+    group.addoption(
+        "--record-video",
+        choices=["off", "on", "retain-on-failure", "on-first-retry"],
+        default=os.getenv("RECORD_VIDEO"),
+        help="When to record test videos",
+    )
+    group.addoption(
+        "--artifact-max-mb",
+        "--video-dir-max-mb",
+        dest="artifact_max_mb",
+        type=int,
+        default=int(os.getenv("ARTIFACT_MAX_MB") or os.getenv("VIDEO_DIR_MAX_MB") or "500"),
+        help="Budget for videos, screenshots and traces together; least recently used go first, "
+             "failure artifacts last (0 = no budget)",
+    )
+    group.addoption(
+        "--artifact-max-age-days",
+        type=float,
+        default=float(os.getenv("ARTIFACT_MAX_AGE_DAYS", "7")),
+        help="Delete videos, screenshots and traces older than this (0 = keep forever)",
+    )
+    group.addoption(
+        "--async-concurrency",
+        type=int,
+        default=int(os.getenv("ASYNC_CONCURRENCY", "4")),
+        help="Max concurrent test coroutines per worker for @pytest.mark.concurrent tests",
+    )
+    group.addoption(
+        "--failure-screenshot-type",
+        choices=["jpeg", "png"],
+        default=os.getenv("FAILURE_SCREENSHOT_TYPE", "jpeg"),
+        help="Image format of failure screenshots (viewport only)",
+    )
+    group.addoption(
+        "--failure-screenshot-quality",
+        type=int,
+        default=int(os.getenv("FAILURE_SCREENSHOT_QUALITY", "70")),
+        help="JPEG quality of failure screenshots",
+    )
+    group.addoption(
+        "--failure-screenshot-full-page",
+        action="store_true",
+        default=os.getenv("FAILURE_SCREENSHOT_FULL_PAGE") == "true",
+        help="Also save a full-page screenshot when the viewport shot differs from the last one",
+    )
+    group.addoption(
+        "--adaptive-timeouts",
+        choices=["on", "off"],
+        default=os.getenv("ADAPTIVE_TIMEOUTS", "on"),
+        help="Derive BasePage locator timeouts from recorded wait durations",
+    )
+    group.addoption(
+        "--event-log-level",
+        choices=list(EVENT_LEVELS),
+        default=os.getenv("EVENT_LOG_LEVEL", "info"),
+        help="Lowest level kept in the per-test event buffer (off = no event logging)",
+    )
+    group.addoption(
+        "--event-log-flush",
+        choices=["failed", "always"],
+        default=os.getenv("EVENT_LOG_FLUSH", "failed"),
+        help="When a test's buffered events are written to <reports dir>/events*.jsonl",
+    )
+    group.addoption(
+        "--event-log-echo",
+        choices=list(EVENT_LEVELS),
+        default=os.getenv("EVENT_LOG_ECHO", "off"),
+        help="Also print events at or above this level as they happen",
+    )
+    group.addoption(
+        "--user-pool-size",
+        type=int,
+        default=int(os.getenv("USER_POOL_SIZE", "2")),
+        help="Accounts (with tokens) provisioned per worker for the pooled_user fixture",
+    )
+    group.addoption(
+        "--trace-mode",
+        choices=list(TRACE_MODES),
+        default=os.getenv("TRACE_MODE"),
+        help="Playwright trace chunk per test on pooled contexts; retain-on-failure saves failed and retried tests",
+    )
+    group.addoption(
+        "--trace-capture",
+        default=os.getenv("TRACE_CAPTURE", "screenshots,snapshots"),
+        help="Comma-separated trace content: screenshots, snapshots (DOM), sources",
+    )
+    group.addoption(
+        "--api-pool-size",
+        type=int,
+        default=os.getenv("API_POOL_SIZE"),
+        help="Keep-alive connections per host for the API clients",
+    )
+    group.addoption(
+        "--api-timeout",
+        dest="api_timeout_s",
+        type=float,
+        default=os.getenv("API_TIMEOUT"),
+        help="Default API request timeout in seconds",
+    )
+    group.addoption(
+        "--api-retries",
+        type=int,
+        default=os.getenv("API_RETRIES"),
+        help="Retries for idempotent API calls (GET/HEAD/OPTIONS/PUT/DELETE) on connection errors and 502/503/504",
+    )
+    group.addoption(
+        "--api-cache",
+        choices=["on", "memory", "off"],
+        default=os.getenv("API_CACHE", "on"),
+        help="Response cache for read-only catalog calls (bookstore_client, books_catalog): "
+             "on = memory + disk shared by workers",
+    )
+    group.addoption(
+        "--api-cache-ttl",
+        type=float,
+        default=float(os.getenv("API_CACHE_TTL", "300")),
+        help="Seconds a cached response is used before it is revalidated (ETag / Last-Modified)",
+    )
+    group.addoption(
+        "--api-cache-dir",
+        default=os.getenv("API_CACHE_DIR", ".api_cache"),
+        help="Folder holding cached API responses",
+    )
+    group.addoption(
+        "--data-seed",
+        type=int,
+        default=os.getenv("DATA_SEED"),
+        help="Seed for the random parts of generated test data (default: derived from the run id)",
+    )
+    group.addoption(
+        "--flaky-threshold",
+        type=float,
+        default=float(os.getenv("FLAKY_THRESHOLD", "0.2")),
+        help="Flakiness score (0-1, from past runs on this browser) from which a test is rerun and quarantined",
+    )
+    group.addoption(
+        "--flaky-reruns",
+        type=int,
+        default=int(os.getenv("FLAKY_RERUNS", "2")),
+        help="Immediate reruns for tests above --flaky-threshold (0 = only record history)",
+    )
+    group.addoption(
+        "--impact-base",
+        default=os.getenv("IMPACT_BASE"),
+        help="Git ref (e.g. origin/main): run only the tests the changes since it can affect",
+    )
+    group.addoption(
+        "--impact-trace",
+        action="store_true",
+        default=os.getenv("IMPACT_TRACE") == "true",
+        help="Record which page-object methods every test calls (refines --impact-base selection)",
+    )
+    group.addoption(
+        "--phase-timing",
+        choices=["on", "off"],
+        default=os.getenv("PHASE_TIMING", "on"),
+        help="Record per-phase timings of every test",
+    )
+    group.addoption(
+        "--phase-timing-dir",
+        default=None,
+        help="Folder for per-test timing breakdowns, default <reports dir>/timings "
+             "(the session summary goes next to it)",
+    )
+    group.addoption(
+        "--dist-by-duration",
+        action="store_true",
+        default=False,
+        help="With xdist: spread tests across workers longest-first using recorded durations",
+    )
+    group.addoption(
+        "--network-cache",
+        choices=NETWORK_CACHE_MODES,
+        default=os.getenv("NETWORK_CACHE"),
+        help="Record/replay page responses from an on-disk cache",
+    )
+    group.addoption(
+        "--network-cache-dir",
+        default=os.getenv("NETWORK_CACHE_DIR", ".network_cache"),
+        help="Folder holding recorded responses",
+    )
+    group.addoption(
+        "--block-resources",
+        choices=sorted(BLOCKING_PROFILES),
+        default=os.getenv("BLOCK_RESOURCES"),
+        help="Default resource-blocking profile (override per test with @pytest.mark.block_resources)",
+    )
+
+
+# ===============================
+# TARGET SITE (LIVE OR LOCAL)
+# ===============================
+
+@pytest.fixture(scope="session")
+def demoqa_server(pytestconfig):
+    """Local DemoQA stand-in, started only with --local-demoqa (one per worker)"""
+    if not pytestconfig.getoption("local_demoqa"):
+        yield None
+        return
+    server = LocalDemoQA().start()
+    event_log.info("local_demoqa_started", url=server.url)
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def ui_base_url(demoqa_server):
+    """Base URL for UI tests: local stand-in, UI_BASE_URL, or live DemoQA"""
+    if demoqa_server:
+        return demoqa_server.url
+    return os.getenv("UI_BASE_URL", "https://demoqa.com").rstrip("/")
+
+
+@pytest.fixture(scope="session")
+def api_base_url(demoqa_server):
+    """Base URL for API tests: local stand-in, API_BASE_URL, or live DemoQA"""
+    if demoqa_server:
+        return demoqa_server.url
+    return os.getenv("API_BASE_URL", "https://demoqa.com").rstrip("/")
+
 
 # ===============================
 # BROWSER NAME (ENV ONLY)
@@ -29,82 +312,466 @@ def browser_name():
 
 @pytest.fixture(scope="session")
 def browser(browser_name):
-    is_ci = os.getenv("CI") == "true"
-
-    # CI = always headless
-    headless = True if is_ci else False
-    slow_mo = 0 if is_ci else 300
+    # Headless and slow-mo come from the settings profile (ci = headless, local-debug = headed + slow-mo)
+    settings = get_settings()
+    headless = settings.headless
+    slow_mo = settings.slow_mo
 
     with sync_playwright() as p:
-        if browser_name == "chromium":
-            browser = p.chromium.launch(headless=headless, slow_mo=slow_mo)
-        elif browser_name == "firefox":
-            browser = p.firefox.launch(headless=headless, slow_mo=slow_mo)
-        elif browser_name == "webkit":
-            browser = p.webkit.launch(headless=headless, slow_mo=slow_mo)
-        else:
-            raise ValueError(f"Unsupported browser: {browser_name}")
-
-        print(f"\n🌐 Browser: {browser_name.upper()} | Headless: {headless}")
+        with phase("browser_launch"):
+            if browser_name == "chromium":
+                browser = p.chromium.launch(headless=headless, slow_mo=slow_mo)
+            elif browser_name == "firefox":
+                browser = p.firefox.launch(headless=headless, slow_mo=slow_mo)
+            elif browser_name == "webkit":
+                browser = p.webkit.launch(headless=headless, slow_mo=slow_mo)
+            else:
+                raise ValueError(f"Unsupported browser: {browser_name}")
+
+        event_log.info("browser_launched", browser=browser_name, headless=headless)
         yield browser
-        browser.close()
-        print(f"\n✅ Browser closed: {browser_name.upper()}")
+        with phase("browser_close"):
+            browser.close()
+        event_log.info("browser_closed", browser=browser_name)
 
 
 # ===============================
-# PAGE FIXTURE
+# CONTEXT POOL FIXTURE
 # ===============================
 
-@pytest.fixture
-def page(browser, request):
-    Path("screenshots").mkdir(exist_ok=True)
-    Path("videos").mkdir(exist_ok=True)
-    Path("reports").mkdir(exist_ok=True)
+@pytest.fixture(scope="session")
+def context_pool(browser, pytestconfig):
+    """
+    Per-worker pool of warm browser contexts.
+    Tests marked @pytest.mark.isolated always get a fresh context.
+    """
+    pool = ContextPool(browser, max_size=pytestconfig.getoption("context_pool_size"))
+    pytestconfig.stash[CONTEXT_POOL_STATS] = pool.stats
+    yield pool
+    pool.close()
+
+
+# ===============================
+# ARTIFACT RETENTION / VIDEO POLICY
+# ===============================
+
+def _artifact_index_path(settings):
+    return f"{settings.reports_dir}/artifact_index.jsonl"
+
+
+@pytest.fixture(scope="session")
+def artifact_retention(pytestconfig):
+    """Background worker indexing, expiring and evicting videos, screenshots and traces"""
+    settings = get_settings()
+    retention = ArtifactRetention(
+        [settings.videos_dir, settings.screenshots_dir, f"{settings.reports_dir}/traces"],
+        _artifact_index_path(settings),
+        max_bytes=pytestconfig.getoption("artifact_max_mb") * 1024 * 1024,
+        max_age_days=pytestconfig.getoption("artifact_max_age_days"),
+    ).start()
+    pytestconfig.stash[ARTIFACT_STATS] = retention.stats
+    yield retention
+    retention.stop()
+
+
+def _should_record_video(mode, item):
+    if mode == "on-first-retry":
+        # pytest-rerunfailures counts executions starting at 1
+        return getattr(item, "execution_count", 1) == 2
+    return mode in ("on", "retain-on-failure")
+
+
+def _test_failed(item):
+    reports = (getattr(item, "rep_setup", None), getattr(item, "rep_call", None))
+    return any(report is not None and report.failed for report in reports)
+
+
+# ===============================
+# TRACING
+# ===============================
+
+@pytest.fixture(scope="session")
+def trace_recorder(pytestconfig):
+    """Per-test Playwright trace chunks, written to <reports dir>/traces (see --trace-mode)"""
+    capture = [name.strip() for name in pytestconfig.getoption("trace_capture").split(",") if name.strip()]
+    recorder = TraceRecorder(
+        pytestconfig.getoption("trace_mode"),
+        output_dir=f"{get_settings().reports_dir}/traces",
+        capture=capture,
+    )
+    pytestconfig.stash[TRACE_STATS] = recorder.stats
+    yield recorder
+
+
+# ===============================
+# NETWORK CACHE
+# ===============================
+
+@pytest.fixture(scope="session")
+def network_cache(pytestconfig):
+    """Record/replay cache installed on every page (see --network-cache)"""
+    cache = NetworkCache(
+        pytestconfig.getoption("network_cache_dir"),
+        mode=pytestconfig.getoption("network_cache"),
+    )
+    pytestconfig.stash[NETWORK_CACHE_STATS] = cache.stats
+    yield cache
+
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    suffix = f"-{worker}" if worker else ""
+    cache.write_miss_report(f"{get_settings().reports_dir}/network_cache_misses{suffix}.json")
 
-    context = browser.new_context(
-        viewport={"width": 1920, "height": 1080},
-        record_video_dir="videos/",
-        record_video_size={"width": 1280, "height": 720},
+
+# ===============================
+# RESOURCE BLOCKING
+# ===============================
+
+@pytest.fixture(scope="session")
+def resource_sizes(pytestconfig):
+    """Response sizes remembered across runs, to estimate bytes saved by blocking"""
+    cache = getattr(pytestconfig, "cache", None)
+    sizes = ResourceSizes(cache.get(RESOURCE_SIZES_KEY, {}) if cache else {})
+    yield sizes
+    if cache:
+        cache.set(RESOURCE_SIZES_KEY, sizes.merged(cache.get(RESOURCE_SIZES_KEY, {})))
+
+
+def _blocking_profile(request):
+    marker = request.node.get_closest_marker("block_resources")
+    name = marker.args[0] if marker else request.config.getoption("block_resources")
+    if name not in BLOCKING_PROFILES:
+        raise ValueError(f"Unknown resource-blocking profile: {name}")
+    return BLOCKING_PROFILES[name]
+
+
+def _record_blocking(config, summary):
+    totals = config.stash.setdefault(BLOCKING_STATS, {})
+    profile = totals.setdefault(summary["profile"], {"tests": 0, "blocked_requests": 0, "blocked_bytes": 0})
+    profile["tests"] += 1
+    profile["blocked_requests"] += summary["blocked_requests"]
+    profile["blocked_bytes"] += summary["blocked_bytes"]
+
+
+# ===============================
+# ADAPTIVE LOCATOR TIMEOUTS
+# ===============================
+
+@pytest.fixture(scope="session")
+def locator_timeouts(pytestconfig):
+    """Per-locator wait history, used by BasePage to derive timeouts (see --adaptive-timeouts)"""
+    if pytestconfig.getoption("adaptive_timeouts") == "off":
+        yield None
+        return
+
+    settings = get_settings()
+    cache = getattr(pytestconfig, "cache", None)
+    model = AdaptiveTimeouts(
+        cache.get(LOCATOR_TIMINGS_KEY, {}) if cache else {},
+        factor=settings.adaptive_timeout_factor,
+        floor_ms=settings.adaptive_timeout_floor_ms,
+        ceiling_ms=settings.default_timeout_ms,
     )
+    adaptive_timeouts.install(model)
+    yield model
+    adaptive_timeouts.install(None)
+    if cache:
+        cache.set(LOCATOR_TIMINGS_KEY, model.merged(cache.get(LOCATOR_TIMINGS_KEY, {})))
+
 
-    page = context.new_page()
+@pytest.fixture(scope="session")
+def locator_winners(pytestconfig):
+    """Winning candidates of Fallback selector chains, remembered per URL pattern"""
+    cache = getattr(pytestconfig, "cache", None)
+    resolver = SelectorResolver(cache.get(LOCATOR_WINNERS_KEY, {}) if cache else {})
+    locators.install(resolver)
+    yield resolver
+    locators.install(SelectorResolver())
+    if cache:
+        cache.set(LOCATOR_WINNERS_KEY, resolver.merged(cache.get(LOCATOR_WINNERS_KEY, {})))
+
+
+# ===============================
+# PAGE FIXTURE
+# ===============================
+
+@pytest.fixture
+def page(context_pool, artifact_retention, network_cache, resource_sizes, screenshot_writer,
+         trace_recorder, locator_timeouts, locator_winners, ui_base_url, request):
+    settings = get_settings()
+
+    video_mode = request.config.getoption("record_video")
+    record_video = _should_record_video(video_mode, request.node)
+    # pytest-rerunfailures counts executions starting at 1
+    attempt = getattr(request.node, "execution_count", 1)
+
+    # Page objects and tests navigate with paths relative to base_url
+    context_options = {"viewport": settings.viewport, "base_url": ui_base_url}
+    if record_video:
+        context_options["record_video_dir"] = f"{settings.videos_dir}/"
+        context_options["record_video_size"] = settings.video_size
+
+    with phase("new_context"):
+        context = context_pool.acquire(
+            isolated=request.node.get_closest_marker("isolated") is not None,
+            **context_options,
+        )
+    tracing = trace_recorder.wants_chunk(attempt) and trace_recorder.start(context, request.node.nodeid)
+
+    with phase("new_page"):
+        page = context.new_page()
     page.test_name = request.node.name
+    instrument_page(page)
+    network_cache.install(page)
+
+    # Installed last so it runs first and only falls back to the cache for allowed requests
+    blocker = ResourceBlocker(_blocking_profile(request), resource_sizes)
+    blocker.install(page)
 
     yield page
 
-    context.close()
+    blocking_summary = blocker.summary()
+    request.node.user_properties.append(("resource_blocking", blocking_summary))
+    _record_blocking(request.config, blocking_summary)
+
+    video = page.video if record_video else None
+
+    failed = _test_failed(request.node)
+    if tracing:
+        trace = trace_recorder.stop(context, request.node.nodeid, trace_recorder.keep(failed, attempt), attempt)
+        if trace:
+            event_log.info("trace_saved", path=str(trace))
+            request.node.user_properties.append(("trace", str(trace)))
+            artifact_retention.record(trace, request.node.nodeid, "trace", failed or attempt > 1)
+
+    # Releasing closes the page, which finalizes the video file
+    with phase("context_release"):
+        context_pool.release(context)
+
+    if video and video_mode == "retain-on-failure" and not failed:
+        artifact_retention.discard(video.path())
+    elif video:
+        artifact_retention.record(video.path(), request.node.nodeid, "video", failed or attempt > 1)
+
+
+# ===============================
+# ASYNC ENGINE (playwright.async_api)
+# ===============================
+
+@pytest.fixture(scope="session")
+def async_engine(browser_name, ui_base_url, pytestconfig):
+    """
+    One async browser per worker, driven from a background event loop.
+    Used by `async def` tests that request `async_page`.
+    """
+    settings = get_settings()
+
+    engine = AsyncEngine(
+        browser_name,
+        launch_options={"headless": settings.headless, "slow_mo": settings.slow_mo},
+        context_options={"viewport": settings.viewport, "base_url": ui_base_url},
+        concurrency=pytestconfig.getoption("async_concurrency"),
+    ).start()
+    yield engine
+    engine.stop()
+
+
+@pytest.fixture
+def async_page(async_engine, locator_timeouts, locator_winners, request):
+    """
+    Async Playwright page in its own context.
+    Tests marked @pytest.mark.concurrent receive their page from the engine batch instead.
+    """
+    if request.node.get_closest_marker("concurrent"):
+        yield None
+        return
+
+    page = async_engine.run(async_engine.new_page())
+    yield page
+    async_engine.run(async_engine.close_page(page))
+
+
+def _can_batch(config):
+    # Under xdist a batch may only contain tests this worker is sure to run
+    if not hasattr(config, "workerinput"):
+        return True
+    return config.getoption("dist", "no") in ("loadfile", "loadscope")
+
+
+def _concurrent_batch(item, engine):
+    """This test plus the pending concurrent tests of the same module"""
+    batch = [item]
+    if _can_batch(item.config):
+        items = item.session.items
+        for other in items[items.index(item) + 1:]:
+            if (
+                other.module is item.module
+                and other.get_closest_marker("concurrent")
+                and not any(other.get_closest_marker(name)
+                            for name in ("skip", "skipif", "xfail"))
+                and other.nodeid not in engine.results
+            ):
+                batch.append(other)
+
+    return {
+        test.nodeid: (test.obj, _concurrent_kwargs(test))
+        for test in batch
+    }
+
+
+def _concurrent_kwargs(item):
+    params = getattr(item, "callspec", None)
+    params = params.params if params else {}
+    return {
+        name: params[name]
+        for name in item._fixtureinfo.argnames
+        if name != "async_page"
+    }
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Run coroutine tests on the async engine"""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj) or "async_engine" not in pyfuncitem.funcargs:
+        return None
+
+    engine = pyfuncitem.funcargs["async_engine"]
+
+    if pyfuncitem.get_closest_marker("concurrent") is None:
+        kwargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+        engine.run(pyfuncitem.obj(**kwargs))
+        return True
+
+    if pyfuncitem.nodeid not in engine.results:
+        engine.run_batch(_concurrent_batch(pyfuncitem, engine))
+
+    error = engine.results.pop(pyfuncitem.nodeid)
+    if error is not None:
+        raise error
+    return True
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        if not item.get_closest_marker("concurrent"):
+            continue
+        params = getattr(item, "callspec", None)
+        allowed = {"async_page", *(params.params if params else {})}
+        extra = set(item._fixtureinfo.argnames) - allowed
+        if not inspect.iscoroutinefunction(item.obj) or extra:
+            raise pytest.UsageError(
+                f"{item.nodeid}: concurrent tests must be `async def` and may only "
+                f"request async_page (got {sorted(extra)})"
+            )
 
 
 # ===============================
 # SCREENSHOT ON FAILURE
 # ===============================
 
+@pytest.fixture(scope="session")
+def screenshot_writer(pytestconfig):
+    """Captures failure screenshots in memory and writes them from a background thread"""
+    writer = ScreenshotWriter(
+        get_settings().screenshots_dir,
+        image_type=pytestconfig.getoption("failure_screenshot_type"),
+        quality=pytestconfig.getoption("failure_screenshot_quality"),
+        full_page_on_change=pytestconfig.getoption("failure_screenshot_full_page"),
+    ).start()
+    yield writer
+    writer.stop()
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
 
+    # Expose phase results to fixtures (video policy, ...)
+    setattr(item, f"rep_{report.when}", report)
+
     if report.when == "call" and report.failed:
         if "page" in item.funcargs:
             page = item.funcargs["page"]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            writer = item.funcargs["screenshot_writer"]
             name = item.name.replace("::", "_")
-            path = Path("screenshots") / f"FAILED_{name}_{timestamp}.png"
             try:
-                page.screenshot(path=str(path), full_page=True)
-                print(f"\n📸 Screenshot saved: {path}")
+                path = writer.capture(page, name, item.nodeid)
+                if path:
+                    event_log.info("screenshot_queued", path=str(path))
+                    retention = item.funcargs["artifact_retention"]
+                    retention.record(path, item.nodeid, "screenshot", True)
+                    if writer.full_page_on_change:
+                        full_page = path.with_name(f"{path.stem}_full{path.suffix}")
+                        retention.record(full_page, item.nodeid, "screenshot", True)
             except Exception as e:
-                print(f"\n⚠️ Screenshot failed: {e}")
+                event_log.warning("screenshot_failed", error=str(e))
 
 
 # ===============================
 # MARKERS
 # ===============================
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
+    # Load the settings profile before any plugin reads its options (e.g. pytest-timeout)
+    settings = load_settings(config.getoption("profile"))
+    for name in PROFILE_OPTIONS:
+        if config.getoption(name) is None:
+            setattr(config.option, name, getattr(settings, name))
+    if config.getoption("timeout", None) is None and not os.getenv("PYTEST_TIMEOUT"):
+        config.option.timeout = settings.test_timeout_s
+
+    # One run id for the controller and all its workers (handed over in workerinput)
+    config.stash[RUN_ID] = getattr(config, "workerinput", {}).get("learnnow_run_id") or new_run_id()
+
     config.addinivalue_line("markers", "smoke")
     config.addinivalue_line("markers", "regression")
     config.addinivalue_line("markers", "slow")
+    config.addinivalue_line("markers", "isolated: use a fresh browser context instead of a pooled one")
+    config.addinivalue_line("markers", "concurrent: run this async test concurrently with its module neighbours")
+    config.addinivalue_line("markers", "block_resources(profile): resource-blocking profile for the page fixture")
+
+    if config.getoption("phase_timing") == "on":
+        timing_dir = config.getoption("phase_timing_dir") or f"{settings.reports_dir}/timings"
+        config.pluginmanager.register(TimingPlugin(config, timing_dir), "phase_timing")
+
+    level = EVENT_LEVELS[config.getoption("event_log_level")]
+    if level < event_log.OFF:
+        worker = getattr(config, "workerinput", {}).get("workerid")
+        event_log.install(EventLog(
+            events_path(settings.reports_dir, worker),
+            level=level,
+            echo_level=EVENT_LEVELS[config.getoption("event_log_echo")],
+            worker=worker or "main",
+        ))
+        config.pluginmanager.register(
+            EventLogPlugin(event_log.active(), config.getoption("event_log_flush")), "event_log"
+        )
+
+    # Workers read the history to mark flaky tests, the controller records outcomes
+    if config.pluginmanager.hasplugin("cacheprovider"):
+        browser = os.getenv("PLAYWRIGHT_BROWSER", "chromium").lower()
+        config.pluginmanager.register(FlakyHistoryPlugin(
+            config,
+            browser,
+            threshold=config.getoption("flaky_threshold"),
+            reruns=config.getoption("flaky_reruns"),
+            quarantine_path=f"{settings.reports_dir}/quarantine-{browser}.json",
+        ), "flaky_history")
+
+    if config.getoption("impact_base") or config.getoption("impact_trace"):
+        if not config.pluginmanager.hasplugin("cacheprovider"):
+            raise pytest.UsageError(
+                "--impact-base/--impact-trace need the test trace in the pytest cache; "
+                "drop -p no:cacheprovider"
+            )
+        config.pluginmanager.register(ImpactPlugin(
+            config, base=config.getoption("impact_base"), trace=config.getoption("impact_trace"),
+        ), "test_impact")
+
+    # Durations are recorded (and scheduling decided) on the controller only
+    if not hasattr(config, "workerinput") and config.pluginmanager.hasplugin("cacheprovider"):
+        config.pluginmanager.register(DurationSchedulerPlugin(config), "duration_scheduler")
 
 
 # ===============================
@@ -115,46 +782,240 @@ def pytest_sessionstart(session):
     print("\n" + "=" * 80)
     print("🚀 STARTING PLAYWRIGHT TEST EXECUTION")
     print(f"📍 ENV: {os.getenv('TEST_ENV', 'LOCAL').upper()}")
+    print(f"⚙️ PROFILE: {get_settings().profile}")
+    print(f"🆔 RUN ID: {session.config.stash[RUN_ID]}")
     print(f"🖥️ CI MODE: {'YES' if os.getenv('CI') == 'true' else 'NO'}")
     print("=" * 80 + "\n")
 
 
 def pytest_sessionfinish(session, exitstatus):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        # xdist worker: hand counters to the controller instead of printing
+        workeroutput["context_pool"] = _pool_stats(session.config).as_dict()
+        workeroutput["network_cache"] = session.config.stash.get(NETWORK_CACHE_STATS, {})
+        workeroutput["resource_blocking"] = session.config.stash.get(BLOCKING_STATS, {})
+        workeroutput["api_latency"] = session.config.stash.get(API_LATENCIES, {})
+        workeroutput["api_cache"] = session.config.stash.get(API_CACHE_STATS, {})
+        workeroutput["tracing"] = session.config.stash.get(TRACE_STATS, {})
+        workeroutput["artifacts"] = session.config.stash.get(ARTIFACT_STATS, {})
+    else:
+        # Workers only append to the index; drop entries for deleted artifacts once they are done
+        compact_index(_artifact_index_path(get_settings()))
+
     print("\n" + "=" * 80)
     print("🏁 TEST EXECUTION COMPLETED")
     print("✅ ALL TESTS PASSED" if exitstatus == 0 else "❌ SOME TESTS FAILED")
     print("=" * 80 + "\n")
 
 
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_protocol(item, nextitem):
-    print(f"\n▶️ Running: {item.name}")
-    yield
+# ===============================
+# RUN SUMMARY REPORTING
+# ===============================
+
+def _pool_stats(config):
+    return config.stash.setdefault(CONTEXT_POOL_STATS, PoolStats())
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Give every xdist worker the controller's run id"""
+    node.workerinput["learnnow_run_id"] = node.config.stash[RUN_ID]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect counters from xdist workers"""
+    workeroutput = getattr(node, "workeroutput", {})
+    if workeroutput.get("context_pool"):
+        _pool_stats(node.config).merge(workeroutput["context_pool"])
+    if workeroutput.get("network_cache"):
+        totals = node.config.stash.setdefault(NETWORK_CACHE_STATS, {})
+        for name, value in workeroutput["network_cache"].items():
+            totals[name] = totals.get(name, 0) + value
+    for profile, counts in workeroutput.get("resource_blocking", {}).items():
+        totals = node.config.stash.setdefault(BLOCKING_STATS, {}).setdefault(profile, {})
+        for name, value in counts.items():
+            totals[name] = totals.get(name, 0) + value
+    for endpoint, samples in workeroutput.get("api_latency", {}).items():
+        node.config.stash.setdefault(API_LATENCIES, {}).setdefault(endpoint, []).extend(samples)
+    if workeroutput.get("api_cache"):
+        totals = node.config.stash.setdefault(API_CACHE_STATS, {})
+        for name, value in workeroutput["api_cache"].items():
+            totals[name] = totals.get(name, 0) + value
+    if workeroutput.get("tracing"):
+        totals = node.config.stash.setdefault(TRACE_STATS, {})
+        for name, value in workeroutput["tracing"].items():
+            totals[name] = totals.get(name, 0) + value
+    if workeroutput.get("artifacts"):
+        totals = node.config.stash.setdefault(ARTIFACT_STATS, {})
+        for name, value in workeroutput["artifacts"].items():
+            totals[name] = totals.get(name, 0) + value
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    stats = config.stash.get(CONTEXT_POOL_STATS, None)
+    if stats and (stats.hits or stats.misses or stats.isolated):
+        terminalreporter.write_sep("-", "browser context pool")
+        terminalreporter.write_line(stats.summary())
+
+    cache_stats = config.stash.get(NETWORK_CACHE_STATS, None)
+    if cache_stats and any(cache_stats.values()):
+        terminalreporter.write_sep("-", f"network cache ({config.getoption('network_cache')})")
+        terminalreporter.write_line(" ".join(f"{name}={value}" for name, value in cache_stats.items()))
+        if cache_stats.get("misses"):
+            terminalreporter.write_line(f"missed requests: {get_settings().reports_dir}/network_cache_misses*.json")
+
+    blocking = config.stash.get(BLOCKING_STATS, None)
+    if blocking and any(counts["blocked_requests"] for counts in blocking.values()):
+        terminalreporter.write_sep("-", "resource blocking")
+        for profile, counts in sorted(blocking.items()):
+            terminalreporter.write_line(
+                f"{profile}: {counts['tests']} tests | {counts['blocked_requests']} requests blocked | "
+                f"~{counts['blocked_bytes'] / 1024 / 1024:.1f} MB saved"
+            )
+
+    api_cache_stats = config.stash.get(API_CACHE_STATS, None)
+    if api_cache_stats and any(api_cache_stats.values()):
+        terminalreporter.write_sep("-", f"api response cache ({config.getoption('api_cache')})")
+        terminalreporter.write_line(" ".join(f"{name}={value}" for name, value in api_cache_stats.items()))
+
+    trace_stats = config.stash.get(TRACE_STATS, None)
+    if trace_stats and trace_stats.get("chunks"):
+        terminalreporter.write_sep("-", f"playwright tracing ({config.getoption('trace_mode')})")
+        terminalreporter.write_line(" ".join(f"{name}={value}" for name, value in trace_stats.items()))
+        if trace_stats.get("saved"):
+            reports_dir = get_settings().reports_dir
+            terminalreporter.write_line(f"traces: {reports_dir}/traces (npx playwright show-trace <zip>)")
+
+    artifact_stats = config.stash.get(ARTIFACT_STATS, None)
+    if artifact_stats and any(artifact_stats.values()):
+        terminalreporter.write_sep("-", "artifact retention")
+        terminalreporter.write_line(
+            f"recorded={artifact_stats['recorded']} discarded={artifact_stats['discarded']} "
+            f"expired={artifact_stats['expired']} evicted={artifact_stats['evicted']} | "
+            f"~{artifact_stats['freed_bytes'] / 1024 / 1024:.1f} MB freed"
+        )
+        terminalreporter.write_line(f"index: {_artifact_index_path(get_settings())}")
+
+    latencies = config.stash.get(API_LATENCIES, None)
+    if latencies:
+        terminalreporter.write_sep("-", "api latency (ms)")
+        for endpoint, samples in sorted(latencies.items(), key=lambda item: -sum(item[1])):
+            terminalreporter.write_line(
+                f"{endpoint}: n={len(samples)} | p50={percentile(samples, 50):.0f} | "
+                f"p95={percentile(samples, 95):.0f} | max={max(samples):.0f}"
+            )
 
 
 # ===============================
-# API REQUEST FIXTURE (PLAYWRIGHT)
+# API CLIENTS (POOLED)
 # ===============================
 
+def _api_client(client_class, base_url, config, cache=None):
+    """Client with the configured pool size, timeout and retries, recording into the run's latencies"""
+    return client_class(
+        base_url,
+        pool_size=config.getoption("api_pool_size"),
+        timeout=config.getoption("api_timeout_s"),
+        retries=config.getoption("api_retries"),
+        latencies=config.stash.setdefault(API_LATENCIES, {}),
+        cache=cache,
+    )
+
+
 @pytest.fixture(scope="session")
-def api_request():
+def api_cache(pytestconfig):
+    """Response cache for safe GETs (None with --api-cache=off); the disk part is shared by workers"""
+    mode = pytestconfig.getoption("api_cache")
+    if mode == "off":
+        yield None
+        return
+    cache = ResponseCache(
+        pytestconfig.getoption("api_cache_dir") if mode == "on" else None,
+        ttl_s=pytestconfig.getoption("api_cache_ttl"),
+    )
+    pytestconfig.stash[API_CACHE_STATS] = cache.stats
+    yield cache
+    cache.close()
+
+
+@pytest.fixture(scope="session")
+def api_request(api_base_url, pytestconfig):
     """
-    Simple requests-based API client.
+    Pooled requests-based API client (keep-alive, timeouts, idempotent retries).
     Stable, fast, CI-safe.
     """
-    base_url = os.getenv("API_BASE_URL", "https://demoqa.com")
+    client = _api_client(BaseClient, api_base_url, pytestconfig)
+    yield client
+    client.close()
 
-    class APIClient:
-        def get(self, path, **kwargs):
-            return requests.get(f"{base_url}{path}", **kwargs)
 
-        def post(self, path, **kwargs):
-            return requests.post(f"{base_url}{path}", **kwargs)
+@pytest.fixture(scope="session")
+def bookstore_client(api_base_url, api_cache, pytestconfig):
+    """Typed client for the BookStore endpoints; anonymous GETs go through the response cache"""
+    client = _api_client(BookStoreClient, api_base_url, pytestconfig, cache=api_cache)
+    yield client
+    client.close()
 
-        def put(self, path, **kwargs):
-            return requests.put(f"{base_url}{path}", **kwargs)
 
-        def delete(self, path, **kwargs):
-            return requests.delete(f"{base_url}{path}", **kwargs)
+@pytest.fixture(scope="session")
+def books_catalog(bookstore_client):
+    """
+    The live catalog (list of book dicts), fetched once per session (and
+    shared through the response cache), instead of hardcoding ISBNs
+    """
+    response = bookstore_client.get_books()
+    if response.status_code == 502:
+        pytest.xfail("❌ DemoQA BookStore API is down (502 Bad Gateway)")
+    assert response.status_code == 200, f"Could not load the book catalog: {response.status_code}"
+    books = response.json().get("books", [])
+    if not books:
+        pytest.xfail("⚠️ DemoQA returned an empty book catalog")
+    return books
+
+
+@pytest.fixture(scope="session")
+def account_client(api_base_url, pytestconfig):
+    """Typed client for the Account endpoints"""
+    client = _api_client(AccountClient, api_base_url, pytestconfig)
+    yield client
+    client.close()
+
 
-    return APIClient()
\ No newline at end of file
+# ===============================
+# ACCOUNT USER POOL
+# ===============================
+
+@pytest.fixture(scope="session")
+def user_pool(api_request, data_factory, pytestconfig):
+    """
+    Accounts with tokens, provisioned in parallel on first use (per worker)
+    and deleted at the end of the session
+    """
+    pool = UserPool(api_request, data_factory, size=pytestconfig.getoption("user_pool_size"))
+    pool.provision()
+    event_log.info("user_pool_provisioned", users=len(pool.users), errors=len(pool.errors))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def pooled_user(user_pool):
+    """A provisioned account with a valid token, exclusive to this test"""
+    if not user_pool.users:
+        pytest.xfail(f"⚠️ Could not provision pooled users: {'; '.join(user_pool.errors)}")
+    user = user_pool.acquire()
+    yield user
+    user_pool.release(user)
+
+
+# ===============================
+# TEST DATA
+# ===============================
+
+@pytest.fixture(scope="session")
+def data_factory(pytestconfig):
+    """Unique usernames, emails, phones and form payloads for this worker"""
+    worker = getattr(pytestconfig, "workerinput", {}).get("workerid", "main")
+    return DataFactory(pytestconfig.stash[RUN_ID], worker, seed=pytestconfig.getoption("data_seed"))
@@ -0,0 +1,63 @@
+"""
+Framework Tests: Adaptive Locator Timeouts
+Tests that a learned timeout grows again after it turned out too short
+"""
+
+import pytest
+
+from utils import adaptive_timeouts
+from utils.adaptive_timeouts import AdaptiveTimeouts
+
+
+class SlowPage:
+    """Stand-in page object (its class name is part of the key)"""
+
+
+class TimeoutError(Exception):
+    """Matched by name, like Playwright's TimeoutError"""
+
+
+@pytest.fixture
+def model():
+    model = AdaptiveTimeouts({"SlowPage:#slow": [100.0] * 200}, factor=3.0, floor_ms=1000)
+    adaptive_timeouts.install(model)
+    yield model
+    adaptive_timeouts.install(None)
+
+
+def _wait(element_ms: float):
+    """Simulate a wait for an element that appears after element_ms"""
+    with adaptive_timeouts.wait(SlowPage(), "#slow", default_ms=15000) as timeout_ms:
+        if element_ms > timeout_ms:
+            raise TimeoutError()
+
+
+class TestAdaptiveTimeouts:
+    """Test suite for learning from timed-out waits"""
+
+    def test_timeout_raises_the_learned_timeout(self, model):
+        """A 1.5 s element times out once at the 1 s floor, then gets factor x the timed-out wait"""
+        assert model.timeout_for("SlowPage:#slow", 15000) == 1000
+
+        with pytest.raises(TimeoutError):
+            _wait(1500)
+
+        assert model.timeout_for("SlowPage:#slow", 15000) == 3000
+        _wait(1500)
+
+    def test_explicit_timeouts_are_not_samples(self, model):
+        """A caller's own timeout running out says nothing about the locator"""
+        with pytest.raises(TimeoutError):
+            with adaptive_timeouts.wait(SlowPage(), "#slow", 15000, timeout=500):
+                raise TimeoutError()
+
+        assert model.timeout_for("SlowPage:#slow", 15000) == 1000
+        assert model.stats["timeouts"] == 1
+
+    def test_default_timeouts_are_not_samples(self, model):
+        """Until a locator has learned a timeout, running out of the default records nothing"""
+        with pytest.raises(TimeoutError):
+            with adaptive_timeouts.wait(SlowPage(), "#missing", 15000):
+                raise TimeoutError()
+
+        assert model.samples("SlowPage:#missing") == []
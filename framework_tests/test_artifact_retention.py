@@ -0,0 +1,136 @@
+"""
+Framework Tests: Artifact Retention
+Tests which artifacts a sweep keeps and evicts: failures outlive passes,
+tiers go in order, least recently used first, until the byte budget fits
+"""
+
+import os
+import time
+
+import pytest
+
+from utils.artifact_retention import ArtifactRetention, load_index
+
+
+@pytest.fixture
+def folders(tmp_path):
+    videos, traces = tmp_path / "videos", tmp_path / "traces"
+    videos.mkdir()
+    traces.mkdir()
+    return videos, traces
+
+
+def _artifact(path, size: int = 100, age_s: float = 3600):
+    """Write `size` bytes, last used `age_s` ago"""
+    path.write_bytes(b"x" * size)
+    used = time.time() - age_s
+    os.utime(path, (used, used))
+    return path
+
+
+def _retention(folders, tmp_path, max_bytes: int, grace_s: float = 0) -> ArtifactRetention:
+    """Not started yet: queued records are indexed before the first sweep"""
+    return ArtifactRetention(
+        folders, str(tmp_path / "index.jsonl"), max_bytes=max_bytes, max_age_days=0,
+        sweep_interval=60, grace_s=grace_s,
+    )
+
+
+def _remaining(folders) -> set:
+    return {path.name for folder in folders for path in folder.iterdir()}
+
+
+class TestArtifactRetention:
+    """Test suite for ArtifactRetention"""
+
+    def test_failure_artifacts_outlive_passing_ones(self, folders, tmp_path):
+        """Over budget, the passing test's video goes and the failing test's stays, even when older"""
+        videos, _ = folders
+        failed = _artifact(videos / "failed.webm", age_s=7200)
+        passed = _artifact(videos / "passed.webm", age_s=60)
+        retention = _retention(folders, tmp_path, max_bytes=150)
+
+        retention.record(failed, "t::fails", "video", failed=True)
+        retention.record(passed, "t::passes", "video", failed=False)
+        retention.start().stop()
+
+        assert _remaining(folders) == {"failed.webm"}
+        assert retention.stats["evicted"] == 1
+
+    def test_discard_deletes_right_away(self, folders, tmp_path):
+        """discard() removes a passing test's artifact without waiting for the budget"""
+        videos, _ = folders
+        passed = _artifact(videos / "passed.webm")
+        retention = _retention(folders, tmp_path, max_bytes=0)
+
+        retention.discard(passed)
+        retention.start().stop()
+
+        assert _remaining(folders) == set()
+        assert retention.stats["discarded"] == 1
+
+    @pytest.mark.parametrize("max_bytes, kept", [
+        (500, {"stray.zip", "passed.zip", "failed.zip"}),
+        (250, {"passed.zip", "failed.zip"}),
+        (150, {"failed.zip"}),
+        (50, set()),
+    ])
+    def test_tiers_are_evicted_in_order(self, folders, tmp_path, max_bytes, kept):
+        """Unindexed files go first, then passing-test artifacts, failure artifacts last"""
+        _, traces = folders
+        _artifact(traces / "failed.zip", age_s=9000)
+        _artifact(traces / "passed.zip", age_s=6000)
+        _artifact(traces / "stray.zip", age_s=60)
+        retention = _retention(folders, tmp_path, max_bytes=max_bytes)
+
+        retention.record(traces / "failed.zip", "t::fails", "trace", failed=True)
+        retention.record(traces / "passed.zip", "t::passes", "trace", failed=False)
+        retention.start().stop()
+
+        assert _remaining(folders) == kept
+
+    def test_least_recently_used_goes_first_within_a_tier(self, folders, tmp_path):
+        """Among passing-test artifacts, the oldest are evicted until the budget fits"""
+        videos, _ = folders
+        for name, age_s in (("old.webm", 9000), ("mid.webm", 6000), ("new.webm", 3000)):
+            _artifact(videos / name, age_s=age_s)
+        retention = _retention(folders, tmp_path, max_bytes=200)
+        for path in videos.iterdir():
+            retention.record(path, f"t::{path.stem}", "video", failed=False)
+        retention.start().stop()
+
+        assert _remaining(folders) == {"mid.webm", "new.webm"}
+
+    def test_budget_is_honoured(self, folders, tmp_path):
+        """After a sweep the folders fit in max_bytes, and the freed bytes are counted"""
+        videos, traces = folders
+        for number in range(10):
+            _artifact(videos / f"video-{number}.webm", size=1000, age_s=100 + number)
+            _artifact(traces / f"trace-{number}.zip", size=500, age_s=100 + number)
+        retention = _retention(folders, tmp_path, max_bytes=4000)
+        retention.start().stop()
+
+        total = sum(path.stat().st_size for folder in folders for path in folder.iterdir())
+        assert total <= 4000
+        assert retention.stats["freed_bytes"] == 15000 - total
+
+    def test_grace_period_protects_files_being_written(self, folders, tmp_path):
+        """Files younger than grace_s are not evicted, even over budget"""
+        videos, _ = folders
+        _artifact(videos / "writing.webm", age_s=1)
+        retention = _retention(folders, tmp_path, max_bytes=10, grace_s=60)
+        retention.start().stop()
+
+        assert _remaining(folders) == {"writing.webm"}
+
+    def test_index_maps_artifacts_to_tests(self, folders, tmp_path):
+        """record() appends the artifact's node id, kind and outcome to the index"""
+        videos, _ = folders
+        video = _artifact(videos / "a.webm")
+        retention = _retention(folders, tmp_path, max_bytes=0)
+
+        retention.record(video, "t::a", "video", failed=True)
+        retention.start().stop()
+
+        entry = load_index(str(tmp_path / "index.jsonl"))[os.path.abspath(video)]
+        assert (entry["nodeid"], entry["kind"], entry["failed"]) == ("t::a", "video", True)
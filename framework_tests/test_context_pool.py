@@ -0,0 +1,157 @@
+"""
+Framework Tests: Browser Context Pool
+Tests with fake contexts that clean contexts are reused, and that tainted,
+unclean or failing ones are closed and replaced
+"""
+
+import pytest
+
+from utils.context_pool import DEFAULT_TIMEOUT_MS, ContextPool, reset_context
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def evaluate(self, script):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    """Records the calls a reset makes; `origins` is what storage_state() reports"""
+
+    def __init__(self, number: int):
+        self.number = number
+        self.pages = [FakePage()]
+        self.origins = []
+        self.calls = []
+        self.closed = False
+
+    def __getattr__(self, name):
+        # clear_cookies, set_offline, add_init_script ...
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def storage_state(self, indexed_db=False):
+        return {"cookies": [], "origins": self.origins}
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **options):
+        context = FakeContext(len(self.contexts))
+        self.contexts.append(context)
+        return context
+
+
+@pytest.fixture
+def pool():
+    return ContextPool(FakeBrowser(), max_size=1)
+
+
+class TestContextPool:
+    """Test suite for ContextPool bookkeeping"""
+
+    def test_clean_context_is_reused(self, pool):
+        """A context that resets cleanly is handed to the next test with the same options"""
+        first = pool.acquire(viewport={"width": 800, "height": 600})
+        pool.release(first)
+        second = pool.acquire(viewport={"width": 800, "height": 600})
+
+        assert second is first and not first.closed
+        assert (pool.stats.hits, pool.stats.misses, pool.stats.resets) == (1, 1, 1)
+
+    def test_different_options_never_share(self, pool):
+        """Contexts are pooled per option set"""
+        first = pool.acquire(viewport={"width": 800, "height": 600})
+        pool.release(first)
+
+        assert pool.acquire(viewport={"width": 1280, "height": 720}) is not first
+
+    @pytest.mark.parametrize("call", ["add_init_script", "expose_binding", "expose_function"])
+    def test_tainted_context_is_closed_and_replaced(self, pool, call):
+        """After a call that cannot be undone the context is closed, and the next test gets a new one"""
+        first = pool.acquire()
+        getattr(first, call)("name")
+        pool.release(first)
+        second = pool.acquire()
+
+        assert first.closed
+        assert second is not first and not second.closed
+        assert (pool.stats.tainted, pool.stats.resets, pool.stats.misses) == (1, 0, 2)
+        assert (call, ("name",), {}) in first.calls
+
+    def test_taint_does_not_outlive_the_context(self, pool):
+        """A replacement context starts untainted and is pooled again"""
+        first = pool.acquire()
+        first.add_init_script("script")
+        pool.release(first)
+        second = pool.acquire()
+        pool.release(second)
+
+        assert pool.acquire() is second
+
+    def test_storage_left_behind_is_not_pooled(self, pool):
+        """A context still holding origin storage after the reset is closed"""
+        first = pool.acquire()
+        first.origins = [{"origin": "http://other.test", "localStorage": []}]
+        pool.release(first)
+
+        assert first.closed
+        assert pool.acquire() is not first
+        assert pool.stats.tainted == 1
+
+    def test_reset_failure_closes_the_context(self):
+        """A reset that raises never returns the context to the pool"""
+        def broken_reset(context, options):
+            raise RuntimeError("browser went away")
+
+        pool = ContextPool(FakeBrowser(), reset=broken_reset)
+        first = pool.acquire()
+        pool.release(first)
+
+        assert first.closed and pool.stats.reset_failures == 1
+        assert pool.acquire() is not first
+
+    def test_isolated_and_extra_contexts_are_closed(self, pool):
+        """Isolated contexts and contexts beyond max_size are closed on release"""
+        isolated = pool.acquire(isolated=True)
+        first, second = pool.acquire(), pool.acquire()
+        for context in (isolated, first, second):
+            pool.release(context)
+
+        assert isolated.closed and not first.closed and second.closed
+        assert pool.stats.isolated == 1
+
+
+class TestResetContext:
+    """Test suite for reset_context"""
+
+    def test_puts_back_creation_options(self):
+        """Pages are closed, state is cleared and the creation options are restored"""
+        context = FakeContext(0)
+        page = context.pages[0]
+
+        clean = reset_context(context, {"extra_http_headers": {"X-Test": "1"}, "offline": True})
+
+        calls = {name: args for name, args, _ in context.calls}
+        assert clean and page.closed
+        assert {"clear_cookies", "clear_permissions", "unroute_all"} <= set(calls)
+        assert calls["set_extra_http_headers"] == ({"X-Test": "1"},)
+        assert calls["set_offline"] == (True,)
+        assert calls["set_geolocation"] == (None,)
+        assert calls["set_default_timeout"] == (DEFAULT_TIMEOUT_MS,)
+
+    def test_reports_storage_it_cannot_clear(self):
+        """Origins left in storage_state make the context unclean"""
+        context = FakeContext(0)
+        context.origins = [{"origin": "http://other.test"}]
+
+        assert not reset_context(context, {})
@@ -0,0 +1,49 @@
+"""
+Framework Tests: Test Data Factory
+Tests that factories for different xdist workers never hand out the same value
+"""
+
+import pytest
+
+from utils.data_factory import DataFactory, worker_index
+
+
+def _values(factory: DataFactory, count: int) -> dict:
+    return {
+        "usernames": {factory.username() for _ in range(count)},
+        "emails": {factory.email() for _ in range(count)},
+        "phones": {factory.phone() for _ in range(count)},
+        "person_emails": {factory.person()["email"] for _ in range(count)},
+    }
+
+
+class TestDataFactory:
+    """Test suite for DataFactory namespaces"""
+
+    @pytest.mark.parametrize("workers", [("gw0", "gw1"), ("gw1", "gw10"), ("main", "gw0")])
+    def test_workers_never_overlap(self, workers):
+        """Two workers of one run, drawing several batches each, share no username, email or phone"""
+        first, second = (_values(DataFactory("abc123", worker, batch_size=50), 120) for worker in workers)
+
+        for kind in first:
+            assert len(first[kind]) == 120, kind
+            assert not first[kind] & second[kind], kind
+
+    def test_runs_never_overlap(self):
+        """The same worker in two runs gets different usernames and emails"""
+        first = _values(DataFactory("abc123", "gw0"), 20)
+        second = _values(DataFactory("def456", "gw0"), 20)
+
+        assert not first["usernames"] & second["usernames"]
+        assert not first["emails"] & second["emails"]
+
+    def test_same_seed_reproduces_values(self):
+        """A worker's values depend only on the run id, worker and seed"""
+        first, second = DataFactory("abc123", "gw1", seed=7), DataFactory("abc123", "gw1", seed=7)
+
+        assert [first.person() for _ in range(3)] == [second.person() for _ in range(3)]
+        assert first.password() == second.password()
+
+    def test_worker_index(self):
+        """gw0 -> 1, gw1 -> 2; anything else is the main process"""
+        assert [worker_index(worker) for worker in ("gw0", "gw1", "gw10", "main", None)] == [1, 2, 11, 0, 0]
@@ -0,0 +1,121 @@
+"""
+Framework Tests: Structured Event Log
+Tests the ring buffer limit, what a flush writes, and that the plugin flushes
+only failed tests' events
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from utils.event_log import DEBUG, ERROR, INFO, WARNING, EventLog
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CONFTEST = '''
+from utils import event_log
+from utils.event_log import EventLog, EventLogPlugin
+
+
+def pytest_configure(config):
+    event_log.install(EventLog("events.jsonl", buffer_size=3))
+    config.pluginmanager.register(EventLogPlugin(event_log.active()), "event_log")
+'''
+
+TESTS = '''
+from utils import event_log
+
+
+def test_passes():
+    event_log.info("step", number=1)
+
+
+def test_fails():
+    for number in range(5):
+        event_log.info("step", number=number)
+    assert False
+'''
+
+
+def _lines(path: Path) -> list:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestEventLog:
+    """Test suite for EventLog"""
+
+    def test_overfilled_buffer_flushes_the_newest_events(self, tmp_path):
+        """Past buffer_size the oldest events are dropped; flush writes the rest once, in order"""
+        log = EventLog(tmp_path / "events.jsonl", buffer_size=3, worker="gw1")
+        log.start_test("t::a")
+        for number in range(5):
+            log.log(INFO, "step", number=number)
+
+        assert log.flush("failed") == 3
+        assert log.flush("failed") == 0
+
+        lines = _lines(tmp_path / "events.jsonl")
+        assert [line["number"] for line in lines] == [2, 3, 4]
+        assert {(line["test"], line["worker"], line["flush"], line["level"]) for line in lines} == {
+            ("t::a", "gw1", "failed", "INFO"),
+        }
+
+    def test_flushes_append(self, tmp_path):
+        """Each flush adds its events after the ones already in the file"""
+        log = EventLog(tmp_path / "events.jsonl")
+        for test in ("t::a", "t::b"):
+            log.start_test(test)
+            log.log(INFO, "step")
+            log.flush()
+
+        assert [line["test"] for line in _lines(tmp_path / "events.jsonl")] == ["t::a", "t::b"]
+
+    def test_new_test_starts_an_empty_buffer(self, tmp_path):
+        """Events of a passing test that was not flushed never reach the next test's flush"""
+        log = EventLog(tmp_path / "events.jsonl")
+        log.start_test("t::passes")
+        log.log(INFO, "step")
+        log.start_test("t::fails")
+        log.log(ERROR, "boom")
+        log.flush("failed")
+
+        assert [line["event"] for line in _lines(tmp_path / "events.jsonl")] == ["boom"]
+
+    def test_levels_below_the_threshold_are_dropped(self, tmp_path):
+        """Events below the log level are never buffered"""
+        log = EventLog(tmp_path / "events.jsonl", level=WARNING)
+        for level in (DEBUG, INFO, WARNING, ERROR):
+            log.log(level, "event")
+
+        assert [record["level"] for record in log.records()] == ["WARNING", "ERROR"]
+
+    def test_memory_only_log_writes_nothing(self, tmp_path):
+        """Without a path flush() keeps nothing and writes nothing"""
+        log = EventLog()
+        log.log(INFO, "step")
+
+        assert log.flush() == 0
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestEventLogPlugin:
+    """Test suite for EventLogPlugin in a pytest run"""
+
+    def test_only_failed_tests_are_flushed(self, tmp_path):
+        """The failing test's last buffer_size events are written and shown in its report"""
+        (tmp_path / "conftest.py").write_text(CONFTEST)
+        (tmp_path / "test_sample.py").write_text(TESTS)
+
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "test_sample.py"],
+            cwd=tmp_path, capture_output=True, text=True, timeout=120,
+            env={**os.environ, "PYTHONPATH": str(ROOT)},
+        )
+
+        assert "1 failed, 1 passed" in result.stdout, result.stdout
+        lines = _lines(tmp_path / "events.jsonl")
+        assert {line["test"] for line in lines} == {"test_sample.py::test_fails"}
+        assert [line.get("number") for line in lines] == [2, 3, 4]
+        assert "event log (call)" in result.stdout
@@ -0,0 +1,122 @@
+"""
+Framework Tests: Flaky Test History
+Tests the flakiness score, the outcome window and the threshold, and that the
+plugin loads and saves its history through config.cache
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from utils.flaky_history import (
+    CACHE_KEY, FAILED, PASSED, RERUN_PASSED, FlakyHistory, FlakyHistoryPlugin, flakiness,
+)
+
+
+class DictCache:
+    """config.cache stand-in"""
+
+    def __init__(self, data: dict = None):
+        self.data = dict(data or {})
+
+    def get(self, key, default):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+
+def _report(nodeid: str, outcome: str, when: str = "call"):
+    return SimpleNamespace(
+        nodeid=nodeid, outcome=outcome, when=when,
+        failed=outcome == "failed", passed=outcome == "passed",
+    )
+
+
+class TestFlakiness:
+    """Test suite for the flakiness score"""
+
+    @pytest.mark.parametrize("outcomes, expected", [
+        ("", 0.0),
+        (PASSED * 10, 0.0),
+        (FAILED * 10, 0.0),
+        ((PASSED + FAILED) * 5, 0.9),
+        (PASSED * 3 + RERUN_PASSED, 0.25),
+    ], ids=["empty", "all-pass", "all-fail", "alternating", "one-rerun"])
+    def test_score(self, outcomes, expected):
+        """Stable tests score 0 either way; flips and reruns count per run"""
+        assert flakiness(outcomes) == pytest.approx(expected)
+
+    def test_score_is_capped_at_one(self):
+        """Reruns and flips together never push the score above 1"""
+        assert flakiness(RERUN_PASSED + FAILED + RERUN_PASSED + FAILED) == 1.0
+
+
+class TestFlakyHistory:
+    """Test suite for FlakyHistory"""
+
+    def test_window_keeps_newest_outcomes(self):
+        """Only the last `window` outcomes are kept"""
+        history = FlakyHistory(window=4)
+        for outcome in FAILED + FAILED + PASSED + FAILED + PASSED + PASSED:
+            history.record("chromium", "t::a", outcome)
+
+        assert history.outcomes("chromium", "t::a") == PASSED + FAILED + PASSED + PASSED
+
+    def test_too_few_runs_are_not_scored(self):
+        """A test scores 0 until it has min_runs outcomes"""
+        history = FlakyHistory({"chromium": {"t::a": PASSED + FAILED}})
+
+        assert history.score("chromium", "t::a", min_runs=3) == 0.0
+        assert history.score("chromium", "t::a", min_runs=2) == 0.5
+
+    def test_threshold_cut_off(self):
+        """flaky() keeps tests at or above the threshold, per browser"""
+        history = FlakyHistory({
+            "chromium": {
+                "t::stable": PASSED * 4,
+                "t::edge": PASSED * 3 + FAILED,
+                "t::flaky": (PASSED + FAILED) * 2,
+            },
+            "firefox": {"t::stable": (PASSED + FAILED) * 2},
+        })
+
+        assert history.flaky("chromium", threshold=0.25) == {"t::edge": 0.25, "t::flaky": 0.75}
+        assert history.flaky("chromium", threshold=0.3) == {"t::flaky": 0.75}
+
+
+class TestFlakyHistoryPlugin:
+    """Test suite for FlakyHistoryPlugin's use of config.cache"""
+
+    def test_history_is_loaded_from_and_saved_to_the_cache(self, tmp_path):
+        """Session outcomes are appended to the cached history and written back"""
+        cache = DictCache({CACHE_KEY: {"chromium": {"t::a": PASSED * 3}}})
+        config = SimpleNamespace(cache=cache, pluginmanager=None)
+        plugin = FlakyHistoryPlugin(
+            config, "chromium", threshold=0.2, quarantine_path=str(tmp_path / "quarantine.json"),
+        )
+
+        plugin.pytest_sessionstart(session=None)
+        plugin.pytest_runtest_logreport(_report("t::a", "failed"))
+        plugin.pytest_runtest_logreport(_report("t::b", "rerun"))
+        plugin.pytest_runtest_logreport(_report("t::b", "passed"))
+        plugin.pytest_runtest_logreport(_report("t::c", "skipped", when="setup"))
+        plugin.pytest_sessionfinish(session=None)
+
+        assert cache.data[CACHE_KEY] == {
+            "chromium": {"t::a": PASSED * 3 + FAILED, "t::b": RERUN_PASSED},
+        }
+        assert [entry["nodeid"] for entry in plugin.quarantine()] == ["t::a"]
+        assert (tmp_path / "quarantine.json").exists()
+
+    def test_workers_do_not_write_the_cache(self):
+        """Only the controller records outcomes"""
+        cache = DictCache()
+        config = SimpleNamespace(cache=cache, workerinput={"workerid": "gw0"})
+        plugin = FlakyHistoryPlugin(config, "chromium")
+
+        plugin.pytest_sessionstart(session=None)
+        plugin.pytest_runtest_logreport(_report("t::a", "passed"))
+        plugin.pytest_sessionfinish(session=None)
+
+        assert cache.data == {}
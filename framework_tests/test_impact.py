@@ -0,0 +1,127 @@
+"""
+Framework Tests: Test Impact Analysis
+Runs pytest with --impact-base in a throwaway git repository and checks which
+changes select tests and how the run ends
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from utils.impact import changed_lines
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CONFTEST = '''
+from utils.impact import ImpactPlugin
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(ImpactPlugin(config, base="HEAD"), "test_impact")
+'''
+
+
+def _git(repo: Path, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=impact", "-c", "user.email=impact@test", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A committed project: one test, its docs and a data file"""
+    (tmp_path / "pytest.ini").write_text("[pytest]\n")
+    (tmp_path / "conftest.py").write_text(CONFTEST)
+    (tmp_path / "test_sample.py").write_text("def test_one():\n    pass\n")
+    (tmp_path / "README.md").write_text("# Sample\n")
+    (tmp_path / "ui_tests" / "data").mkdir(parents=True)
+    (tmp_path / "ui_tests" / "data" / "users.json").write_text('{"users": []}\n')
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+def _run(repo: Path, *args) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", *args],
+        cwd=repo, env=env, capture_output=True, text=True, timeout=120,
+    )
+
+
+class TestImpactSelection:
+    """Test suite for ImpactPlugin"""
+
+    def test_docs_only_change_deselects_everything_and_passes(self, repo):
+        """A diff that affects no test exits 0 instead of 5 (no tests collected)"""
+        with open(repo / "README.md", "a") as readme:
+            readme.write("More docs\n")
+
+        result = _run(repo)
+
+        assert "1 deselected" in result.stdout, result.stdout
+        assert result.returncode == 0, result.stdout
+
+    def test_docs_only_change_passes_under_xdist(self, repo):
+        """Workers report their selection, so the controller also exits 0"""
+        pytest.importorskip("xdist")
+        with open(repo / "README.md", "a") as readme:
+            readme.write("More docs\n")
+
+        result = _run(repo, "-n", "2")
+
+        assert "0 selected, 1 deselected" in result.stdout, result.stdout
+        assert result.returncode == 0, result.stdout
+
+    def test_changed_test_is_selected(self, repo):
+        """A changed test file still runs"""
+        with open(repo / "test_sample.py", "a") as test_file:
+            test_file.write("\n\ndef test_two():\n    pass\n")
+
+        result = _run(repo)
+
+        assert "2 passed" in result.stdout, result.stdout
+        assert result.returncode == 0
+
+    def test_data_file_change_selects_everything(self, repo):
+        """A JSON file next to the tests may be test input: it is not treated as docs"""
+        (repo / "ui_tests" / "data" / "users.json").write_text('{"users": ["new"]}\n')
+
+        result = _run(repo)
+
+        assert "all tests selected: ui_tests/data/users.json changed" in result.stdout, result.stdout
+        assert "1 passed" in result.stdout
+
+    def test_top_level_notes_are_docs(self, repo):
+        """.txt notes at the top level select nothing"""
+        (repo / "NOTES.txt").write_text("todo\n")
+
+        result = _run(repo)
+
+        assert "1 deselected" in result.stdout, result.stdout
+
+    def test_hunk_lines_that_look_like_file_headers(self, repo):
+        """A removed `-- ` line and an added `++ ` line stay part of their hunk, not new file headers"""
+        (repo / "README.md").write_text("# Sample\n-- old rule\nText\n")
+        _git(repo, "commit", "-q", "-am", "rule")
+        (repo / "README.md").write_text("# Sample\n++ new rule\nText\n")
+
+        assert changed_lines("HEAD", repo) == {"README.md": ({2}, {2})}
+        result = _run(repo)
+        assert "1 deselected" in result.stdout, result.stdout
+
+    def test_needs_the_cache(self):
+        """--impact-base without the cache plugin is a usage error, not a silent full run"""
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "--collect-only",
+             "-p", "no:cacheprovider", "--impact-base", "HEAD", "framework_tests"],
+            cwd=ROOT, capture_output=True, text=True, timeout=120,
+        )
+
+        assert result.returncode == pytest.ExitCode.USAGE_ERROR, result.stdout
+        assert "drop -p no:cacheprovider" in result.stderr
@@ -0,0 +1,110 @@
+"""
+Framework Tests: Load Generation
+Tests the latency histogram's precision, percentiles and merge, and runs a
+short load test against the local DemoQA stand-in
+"""
+
+import math
+import random
+
+import pytest
+
+from loadgen import BookStoreScenario, LatencyHistogram, LoadRunner
+from utils.local_demoqa import LocalDemoQA
+
+
+def _exact(values: list, pct: float) -> int:
+    """Nearest-rank percentile of the raw samples"""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)), 1) - 1]
+
+
+def _distributions():
+    rng = random.Random(42)
+    return {
+        "uniform": [rng.randint(1, 100_000) for _ in range(20_000)],
+        "lognormal": [int(rng.lognormvariate(9, 1.2)) for _ in range(20_000)],
+        "bimodal": [rng.choice((800, 250_000)) + rng.randint(0, 50) for _ in range(20_000)],
+    }
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram"""
+
+    @pytest.mark.parametrize("digits", [1, 2, 3])
+    def test_bucket_precision(self, digits):
+        """Every value is reported within 10^-digits of itself"""
+        histogram = LatencyHistogram(significant_digits=digits)
+        for value in [*range(0, 5000), *range(5000, 10_000_000, 997)]:
+            reported = histogram._highest_equivalent(histogram._index(value))
+            assert value <= reported <= value + value * 10 ** -digits, value
+
+    @pytest.mark.parametrize("name", ["uniform", "lognormal", "bimodal"])
+    @pytest.mark.parametrize("pct", [50, 90, 99, 99.9])
+    def test_percentiles_within_precision(self, name, pct):
+        """Percentiles of known distributions match the exact ones within the configured precision"""
+        values = _distributions()[name]
+        histogram = LatencyHistogram(significant_digits=3)
+        for value in values:
+            histogram.record(value)
+
+        exact = _exact(values, pct)
+        assert exact <= histogram.value_at_percentile(pct) <= exact * (1 + 1e-3)
+
+    def test_summary(self):
+        """Count, min, mean and max are exact; percentiles are reported in ms"""
+        histogram = LatencyHistogram()
+        for value in (1000, 2000, 3000, 4000):
+            histogram.record(value)
+
+        assert histogram.summary(percentiles=(50, 100)) == {
+            "n": 4, "min_ms": 1.0, "mean_ms": 2.5, "max_ms": 4.0, "p50_ms": 2.0, "p100_ms": 4.0,
+        }
+
+    def test_merge_equals_recording_everything(self):
+        """Merging per-thread histograms gives the same result as one histogram of all samples"""
+        values = _distributions()["lognormal"]
+        whole, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for number, value in enumerate(values):
+            whole.record(value)
+            (first if number % 2 else second).record(value)
+
+        first.merge(second)
+
+        assert first.counts == whole.counts
+        assert (first.total, first.min_us, first.max_us, first.sum_us) == (
+            whole.total, whole.min_us, whole.max_us, whole.sum_us,
+        )
+        assert first.summary() == whole.summary()
+
+    def test_merge_needs_the_same_precision(self):
+        """Buckets of different precision cannot be added"""
+        with pytest.raises(ValueError):
+            LatencyHistogram(2).merge(LatencyHistogram(3))
+
+
+class TestLoadRunner:
+    """Test suite for LoadRunner against the local stand-in"""
+
+    @pytest.fixture(scope="class")
+    def scenario(self):
+        server = LocalDemoQA().start()
+        scenario = BookStoreScenario(server.url, pool_size=4, timeout=5)
+        scenario.setup({"books": 1, "book": 1, "token": 1})
+        yield scenario
+        scenario.teardown()
+        server.stop()
+
+    @pytest.mark.parametrize("rate", [None, 50.0], ids=["closed-loop", "open-loop"])
+    def test_short_run(self, scenario, rate):
+        """A half-second run sends every operation in the mix without errors"""
+        mix = {"books": 1, "book": 1, "token": 1}
+        runner = LoadRunner(scenario.operations(mix), concurrency=4, duration_s=0.5, rate=rate, warmup_s=0.1)
+
+        result = runner.run().as_dict()
+
+        total = result["operations"]["total"]
+        assert result["mode"] == ("open" if rate else "closed")
+        assert total["requests"] > 0 and total["errors"] == 0
+        assert all(result["operations"][name]["requests"] > 0 for name in mix)
+        assert 0 < total["latency"]["p50_ms"] <= total["latency"]["p99_ms"] <= total["latency"]["max_ms"]
@@ -0,0 +1,136 @@
+"""
+Framework Tests: Selector Fallback Chains
+Tests with a stub page which candidate SelectorResolver picks, and that the
+winner is remembered across runs and dropped once it stops matching
+"""
+
+from utils.locators import Fallback, SelectorResolver
+
+CHAIN = Fallback("#header", ".main-header", "h1")
+
+
+class StubLocator:
+    def __init__(self, page, selector: str):
+        self.page = page
+        self.selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    def count(self) -> int:
+        return self.page.elements.get(self.selector, (0, False))[0]
+
+    def is_visible(self) -> bool:
+        return self.page.elements.get(self.selector, (0, False))[1]
+
+
+class StubPage:
+    """
+    Page whose DOM is a dict: selector -> (count, visible).
+    Selectors using Playwright-only syntax are reported as not CSS, like the real ranking script.
+    """
+
+    def __init__(self, url: str, elements: dict):
+        self.url = url
+        self.elements = elements
+        self.evaluations = 0
+
+    def locator(self, selector: str) -> StubLocator:
+        return StubLocator(self, selector)
+
+    def evaluate(self, script, candidates):
+        self.evaluations += 1
+        ranks = []
+        for selector in candidates:
+            count, visible = self.elements.get(selector, (0, False))
+            css = not selector.startswith("text=") and ":has-text(" not in selector
+            ranks.append({"css": css, "count": count if css else 0, "visible": visible if css else False})
+        return ranks
+
+
+class TestSelectorResolver:
+    """Test suite for SelectorResolver"""
+
+    def test_first_matching_candidate_wins(self):
+        """Candidates are tried in declaration order"""
+        page = StubPage("http://demoqa.test/books", {".main-header": (1, True), "h1": (2, True)})
+
+        assert SelectorResolver().resolve(page, CHAIN) == ".main-header"
+
+    def test_visible_beats_attached(self):
+        """A hidden earlier candidate loses to a visible later one"""
+        page = StubPage("http://demoqa.test/books", {"#header": (1, False), "h1": (1, True)})
+
+        assert SelectorResolver().resolve(page, CHAIN) == "h1"
+
+    def test_attached_when_nothing_is_visible(self):
+        """Without a visible match the first attached candidate wins"""
+        page = StubPage("http://demoqa.test/books", {".main-header": (1, False), "h1": (1, False)})
+
+        assert SelectorResolver().resolve(page, CHAIN) == ".main-header"
+
+    def test_no_match_returns_first_candidate_unremembered(self):
+        """When nothing matches, the first candidate is returned for the caller's wait to report"""
+        resolver = SelectorResolver()
+
+        assert resolver.resolve(StubPage("http://demoqa.test/books", {}), CHAIN) == "#header"
+        assert resolver.merged({}) == {}
+
+    def test_non_css_candidates_are_checked_by_playwright(self):
+        """text= and :has-text() candidates are counted through page.locator()"""
+        chain = Fallback("text=Book Store", "h1")
+        page = StubPage("http://demoqa.test/books", {"text=Book Store": (1, True), "h1": (1, True)})
+
+        assert SelectorResolver().resolve(page, chain) == "text=Book Store"
+
+    def test_winner_is_tried_first_on_the_next_run(self):
+        """A persisted winner is used without ranking, even if an earlier candidate matches now"""
+        first_run = SelectorResolver()
+        first_run.resolve(StubPage("http://demoqa.test/books", {"h1": (1, True)}), CHAIN)
+        stored = first_run.merged({})
+
+        page = StubPage("http://demoqa.test/books", {".main-header": (1, True), "h1": (1, True)})
+        second_run = SelectorResolver(stored)
+
+        assert second_run.resolve(page, CHAIN) == "h1"
+        assert page.evaluations == 0
+        assert second_run.stats == {"cached": 1, "resolved": 0}
+
+    def test_winner_is_kept_per_url_pattern(self):
+        """Pages differing only in ids share a winner; other pages rank on their own"""
+        resolver = SelectorResolver()
+        resolver.resolve(StubPage("http://demoqa.test/books/9781449325862", {"h1": (1, True)}), CHAIN)
+
+        same_pattern = StubPage("http://demoqa.test/books/9781449331818", {".main-header": (1, True), "h1": (1, True)})
+        other_page = StubPage("http://demoqa.test/profile", {".main-header": (1, True), "h1": (1, True)})
+
+        assert resolver.resolve(same_pattern, CHAIN) == "h1"
+        assert resolver.resolve(other_page, CHAIN) == ".main-header"
+
+    def test_stale_winner_falls_back(self):
+        """A remembered winner that no longer matches is ranked again and replaced"""
+        key = SelectorResolver.key("http://demoqa.test/books", CHAIN)
+        resolver = SelectorResolver({key: "#header"})
+        page = StubPage("http://demoqa.test/books", {".main-header": (1, True)})
+
+        assert resolver.resolve(page, CHAIN) == ".main-header"
+        assert page.evaluations == 1
+        assert resolver.merged({key: "#header"}) == {key: ".main-header"}
+
+    def test_winner_outside_the_chain_is_ignored(self):
+        """A stored winner that is no longer a candidate (the chain was edited) is not used"""
+        key = SelectorResolver.key("http://demoqa.test/books", CHAIN)
+        resolver = SelectorResolver({key: "#removed"})
+        page = StubPage("http://demoqa.test/books", {"#removed": (1, True), "h1": (1, True)})
+
+        assert resolver.resolve(page, CHAIN) == "h1"
+
+    def test_plain_selectors_pass_through(self):
+        """Strings and one-candidate chains are returned unchanged, without touching the page"""
+        page = StubPage("http://demoqa.test/books", {})
+        resolver = SelectorResolver()
+
+        assert resolver.resolve(page, "#plain") == "#plain"
+        assert resolver.resolve(page, Fallback("#only")) == "#only"
+        assert page.evaluations == 0
@@ -0,0 +1,167 @@
+"""
+Framework Tests: Network Record/Replay Cache
+Tests what each mode does with a request, using fake routes instead of a browser
+"""
+
+import pytest
+from playwright.sync_api import Error
+
+from utils.network_cache import MODES, NetworkCache
+
+PAGE = "https://demoqa.test/books"
+
+
+class FakeRequest:
+    def __init__(self, url: str = PAGE, method: str = "GET"):
+        self.url = url
+        self.method = method
+        self.headers = {"accept": "text/html"}
+
+
+class FakeResponse:
+    def __init__(self, status: int = 200, body: bytes = b"<html>live</html>"):
+        self.status = status
+        self.headers = {"content-type": "text/html", "content-length": str(len(body))}
+        self._body = body
+
+    def body(self) -> bytes:
+        return self._body
+
+
+class FakeRoute:
+    """Remembers how the cache handled the request: fulfilled, fell back or aborted"""
+
+    def __init__(self, request: FakeRequest, response: FakeResponse = None, network_down: bool = False):
+        self.request = request
+        self.response = response or FakeResponse()
+        self.network_down = network_down
+        self.fetched = False
+        self.outcome = None
+        self.fulfilled = None
+
+    def fetch(self):
+        self.fetched = True
+        if self.network_down:
+            raise Error("net::ERR_INTERNET_DISCONNECTED")
+        return self.response
+
+    def fulfill(self, response=None, **entry):
+        self.outcome = "fulfilled"
+        self.fulfilled = response or entry
+
+    def fallback(self):
+        self.outcome = "fallback"
+
+    def abort(self, *args):
+        self.outcome = "aborted"
+
+
+class FakePage:
+    def __init__(self):
+        self.routes = []
+
+    def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+
+def _handle(cache: NetworkCache, **route_kwargs) -> FakeRoute:
+    route = FakeRoute(route_kwargs.pop("request", FakeRequest()), **route_kwargs)
+    cache._handle(route)
+    return route
+
+
+def _recorded(store_dir, body: bytes = b"<html>stored</html>"):
+    """A cache directory holding one stored response for PAGE"""
+    _handle(NetworkCache(store_dir, mode="refresh"), response=FakeResponse(body=body))
+
+
+class TestNetworkCache:
+    """Test suite for NetworkCache modes"""
+
+    @pytest.mark.parametrize("mode, routed", [("off", False), ("record", True), ("replay", True), ("refresh", True)])
+    def test_install_routes_unless_off(self, tmp_path, mode, routed):
+        """Every mode but off routes all requests of the page"""
+        page = FakePage()
+        NetworkCache(tmp_path, mode=mode).install(page)
+
+        assert bool(page.routes) == routed
+
+    def test_unknown_mode_is_rejected(self, tmp_path):
+        """A typo in --network-cache fails instead of silently disabling the cache"""
+        with pytest.raises(ValueError, match="Unsupported network cache mode"):
+            NetworkCache(tmp_path, mode="offline")
+
+    @pytest.mark.parametrize("mode, stored, outcome, fetched, body", [
+        ("record", False, "fulfilled", True, b"<html>live</html>"),
+        ("record", True, "fulfilled", False, b"<html>stored</html>"),
+        ("replay", False, "fallback", False, None),
+        ("replay", True, "fulfilled", False, b"<html>stored</html>"),
+        ("refresh", False, "fulfilled", True, b"<html>live</html>"),
+        ("refresh", True, "fulfilled", True, b"<html>live</html>"),
+    ])
+    def test_modes(self, tmp_path, mode, stored, outcome, fetched, body):
+        """record fills gaps, replay never fetches, refresh always fetches"""
+        if stored:
+            _recorded(tmp_path)
+        cache = NetworkCache(tmp_path, mode=mode)
+
+        route = _handle(cache)
+
+        assert (route.outcome, route.fetched) == (outcome, fetched)
+        if body is not None:
+            fulfilled = route.fulfilled
+            assert (fulfilled.body() if isinstance(fulfilled, FakeResponse) else fulfilled["body"]) == body
+
+    @pytest.mark.parametrize("mode", ["record", "refresh"])
+    def test_fetched_responses_are_stored(self, tmp_path, mode):
+        """A fetched response is replayed afterwards, without its content-length"""
+        _handle(NetworkCache(tmp_path, mode=mode))
+
+        route = _handle(NetworkCache(tmp_path, mode="replay"))
+
+        assert route.outcome == "fulfilled"
+        assert route.fulfilled["body"] == b"<html>live</html>"
+        assert route.fulfilled["headers"] == {"content-type": "text/html"}
+
+    def test_replay_reports_misses(self, tmp_path):
+        """A replay miss goes to the network and is listed in the miss report"""
+        cache = NetworkCache(tmp_path, mode="replay")
+        _handle(cache)
+        cache.write_miss_report(tmp_path / "misses.json")
+
+        assert cache.stats == {"hits": 0, "misses": 1, "recorded": 0}
+        assert cache.missed_urls == [f"GET {PAGE}"]
+        assert (tmp_path / "misses.json").exists()
+
+    def test_server_errors_are_not_recorded(self, tmp_path):
+        """5xx responses are passed on but never stored"""
+        cache = NetworkCache(tmp_path, mode="record")
+        _handle(cache, response=FakeResponse(status=503))
+
+        assert cache.stats["recorded"] == 0
+        assert _handle(NetworkCache(tmp_path, mode="replay")).outcome == "fallback"
+
+    def test_network_error_aborts(self, tmp_path):
+        """Without network, a miss while recording is aborted and reported"""
+        cache = NetworkCache(tmp_path, mode="record")
+
+        route = _handle(cache, network_down=True)
+
+        assert route.outcome == "aborted"
+        assert cache.missed_urls == [f"GET {PAGE}"]
+
+    @pytest.mark.parametrize("mode", [mode for mode in MODES if mode != "off"])
+    def test_writes_go_to_the_network(self, tmp_path, mode):
+        """POST and other unsafe methods are never cached or replayed"""
+        route = _handle(NetworkCache(tmp_path, mode=mode), request=FakeRequest(method="POST"))
+
+        assert (route.outcome, route.fetched) == ("fallback", False)
+
+    def test_key_varies_by_selected_headers(self, tmp_path):
+        """Accept headers are part of the key, other headers are not"""
+        cache = NetworkCache(tmp_path)
+
+        html = cache.key("GET", PAGE, {"accept": "text/html", "user-agent": "a"})
+        assert html == cache.key("GET", PAGE, {"accept": "text/html", "user-agent": "b"})
+        assert html != cache.key("GET", PAGE, {"accept": "application/json"})
+        assert html != cache.key("HEAD", PAGE, {"accept": "text/html"})
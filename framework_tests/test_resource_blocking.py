@@ -0,0 +1,125 @@
+"""
+Framework Tests: Resource-Blocking Profiles
+Tests which requests each profile aborts, and that tests checking the
+homepage banner image pin a profile that lets images through
+"""
+
+import importlib
+
+import pytest
+
+from config import PROFILES as SETTINGS_PROFILES
+from utils.resource_blocking import PROFILES, ResourceBlocker, ResourceSizes
+
+ORIGIN = "https://demoqa.com"
+
+
+class FakeFrame:
+    def __init__(self, parent=None):
+        self.parent_frame = parent
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str, navigation: bool = False, frame: FakeFrame = None):
+        self.url = url
+        self.resource_type = resource_type
+        self.navigation = navigation
+        self.frame = frame or FakeFrame()
+
+    def is_navigation_request(self) -> bool:
+        return self.navigation
+
+
+REQUESTS = {
+    "page": FakeRequest(f"{ORIGIN}/books", "document", navigation=True),
+    "script": FakeRequest(f"{ORIGIN}/main.js", "script"),
+    "subdomain-script": FakeRequest("https://static.demoqa.com/app.js", "script"),
+    "banner": FakeRequest(f"{ORIGIN}/images/Toolsqa.svg", "image"),
+    "font": FakeRequest(f"{ORIGIN}/fonts/open-sans.woff2", "font"),
+    "video": FakeRequest(f"{ORIGIN}/media/intro.mp4", "media"),
+    "ad": FakeRequest("https://pagead2.googlesyndication.com/pagead/show_ads.js", "script"),
+    "analytics": FakeRequest("https://www.google-analytics.com/analytics.js", "script"),
+    "third-party": FakeRequest("https://cdn.jsdelivr.net/npm/lib.js", "script"),
+    "third-party-frame": FakeRequest("https://embed.example.org/", "document", navigation=True,
+                                     frame=FakeFrame(parent=FakeFrame())),
+}
+
+# Request -> profiles that block it
+BLOCKED_BY = {
+    "page": set(),
+    "script": set(),
+    "subdomain-script": set(),
+    "banner": {"no-media", "minimal"},
+    "font": {"no-media", "minimal"},
+    "video": {"no-media", "minimal"},
+    "ad": {"no-ads", "no-media", "minimal"},
+    "analytics": {"no-ads", "no-media", "minimal"},
+    "third-party": {"minimal"},
+    "third-party-frame": {"minimal"},
+}
+
+
+class TestResourceBlocker:
+    """Test suite for ResourceBlocker decisions"""
+
+    @pytest.mark.parametrize("profile", sorted(PROFILES))
+    @pytest.mark.parametrize("request_name", sorted(REQUESTS))
+    def test_should_block(self, profile, request_name):
+        """Every profile blocks exactly its resource types, ad hosts and (minimal) third parties"""
+        blocker = ResourceBlocker(PROFILES[profile], ResourceSizes())
+        blocker._should_block(REQUESTS["page"])  # the top-level navigation sets the first party
+
+        assert blocker._should_block(REQUESTS[request_name]) == (profile in BLOCKED_BY[request_name])
+
+    def test_full_profile_does_not_route(self):
+        """Nothing to block: the page is not routed at all"""
+        assert not PROFILES["full"].blocks_anything
+        assert all(PROFILES[name].blocks_anything for name in ("no-ads", "no-media", "minimal"))
+
+    def test_blocked_bytes_are_estimated_from_known_sizes(self):
+        """Blocked requests are counted; sizes come from earlier runs when known"""
+        sizes = ResourceSizes({f"{ORIGIN}/images/Toolsqa.svg": 4096})
+        blocker = ResourceBlocker(PROFILES["minimal"], sizes)
+
+        class Route:
+            def __init__(self, request):
+                self.request = request
+
+            def abort(self, reason):
+                pass
+
+            def fallback(self):
+                pass
+
+        for name in ("page", "banner", "font"):
+            blocker._handle(Route(REQUESTS[name]))
+
+        assert blocker.summary() == {
+            "profile": "minimal", "blocked_requests": 2, "blocked_bytes": 4096, "unknown_sizes": 1,
+        }
+
+
+class TestBannerChecks:
+    """The offline settings profile blocks images by default; banner checks must opt out"""
+
+    def test_offline_default_blocks_the_banner(self):
+        """`minimal` aborts the homepage banner image, so a visibility check on it cannot pass"""
+        blocker = ResourceBlocker(PROFILES[SETTINGS_PROFILES["offline"].block_resources], ResourceSizes())
+        blocker._should_block(REQUESTS["page"])
+
+        assert blocker._should_block(REQUESTS["banner"])
+
+    @pytest.mark.parametrize("test", [
+        "ui_tests/test_homepage.py::test_verify_homepage_elements",
+        "ui_tests/test_assertions.py::test_python_built_in_assertions",
+        "ui_tests/test_assertions.py::test_playwright_expect_assertions",
+    ])
+    def test_banner_tests_let_images_through(self, test):
+        """Tests asserting the banner image pin a profile that does not block images"""
+        path, name = test.split("::")
+        module = importlib.import_module(path[:-3].replace("/", "."))
+        markers = [mark for mark in getattr(getattr(module, name), "pytestmark", [])
+                   if mark.name == "block_resources"]
+
+        assert markers, f"{test} has no block_resources marker"
+        assert "image" not in PROFILES[markers[0].args[0]].resource_types
@@ -0,0 +1,148 @@
+"""
+Framework Tests: API Response Cache
+Tests freshness, ETag revalidation, LRU eviction and the disk store of
+ResponseCache against the local DemoQA stand-in
+"""
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from api_tests.clients import ResponseCache
+from utils.local_demoqa import LocalDemoQA
+
+BOOKS = "/BookStore/v1/Books"
+BOOK = "/BookStore/v1/Book"
+ISBNS = ("9781449325862", "9781449331818", "9781449337711")
+
+
+@pytest.fixture(scope="module")
+def server():
+    with LocalDemoQA() as server:
+        yield server
+
+
+class Network:
+    """The `send` callable ResponseCache.fetch expects, remembering what went out"""
+
+    def __init__(self, base_url: str, rewrite=None):
+        """rewrite: optional callable(response) -> headers dict, to act as a different server"""
+        self.base_url = base_url
+        self.rewrite = rewrite
+        self.sent = []
+
+    def get(self, cache: ResponseCache, path: str, **kwargs) -> requests.Response:
+        url = f"{self.base_url}{path}"
+
+        def send(sent_kwargs):
+            response = requests.get(url, timeout=5, **sent_kwargs)
+            headers = sent_kwargs.get("headers") or {}
+            self.sent.append((path, sent_kwargs.get("params"), headers, response.status_code))
+            if self.rewrite:
+                response.headers = CaseInsensitiveDict(self.rewrite(response))
+            return response
+
+        return cache.fetch("GET", url, kwargs, send)
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache"""
+
+    def test_fresh_entry_is_served_without_a_request(self, server):
+        """Within the TTL the second call never reaches the server"""
+        cache = ResponseCache(ttl_s=300)
+        network = Network(server.url)
+
+        first = network.get(cache, BOOKS)
+        second = network.get(cache, BOOKS)
+
+        assert len(network.sent) == 1
+        assert not getattr(first, "from_cache", False)
+        assert second.from_cache and second.json() == first.json()
+        assert cache.stats == {"hits": 1, "revalidated": 0, "misses": 1, "stored": 1}
+
+    def test_stale_entry_is_revalidated_with_etag(self, server):
+        """Past the TTL the entry is revalidated with If-None-Match; 304 serves the stored body"""
+        cache = ResponseCache(ttl_s=0)
+        network = Network(server.url)
+
+        first = network.get(cache, BOOKS)
+        second = network.get(cache, BOOKS)
+
+        path, _, headers, status = network.sent[-1]
+        assert headers["If-None-Match"] == first.headers["ETag"]
+        assert status == 304
+        assert second.from_cache and second.status_code == 200 and second.json() == first.json()
+        assert cache.stats["revalidated"] == 1
+
+    def test_stale_entry_with_changed_etag_is_replaced(self, server):
+        """When the server no longer matches the stored ETag, the new 200 replaces the entry"""
+        cache = ResponseCache(ttl_s=0)
+        network = Network(server.url)
+        network.get(cache, BOOKS)
+        for entry in cache._entries.values():
+            entry["headers"]["etag"] = 'W/"outdated"'
+
+        response = network.get(cache, BOOKS)
+
+        assert network.sent[-1][3] == 200
+        assert not getattr(response, "from_cache", False)
+        assert cache.stats["misses"] == 2 and cache.stats["stored"] == 2
+        assert next(iter(cache._entries.values()))["headers"]["etag"] == response.headers["ETag"]
+
+    def test_lowercase_etag_is_revalidated(self, server):
+        """A server sending `etag` in lower case is revalidated like one sending `ETag`"""
+        cache = ResponseCache(ttl_s=0)
+        network = Network(server.url, rewrite=lambda response: {
+            name.lower(): value for name, value in response.headers.items()
+        })
+
+        first = network.get(cache, BOOKS)
+        second = network.get(cache, BOOKS)
+
+        assert network.sent[-1][2]["If-None-Match"] == first.headers["etag"]
+        assert network.sent[-1][3] == 304
+        assert second.from_cache and cache.stats["revalidated"] == 1
+
+    def test_not_modified_updates_stored_headers(self, server):
+        """A 304's Cache-Control and validators replace the stored ones"""
+        cache = ResponseCache(ttl_s=0)
+        network = Network(server.url)
+        network.get(cache, BOOKS)
+        network.rewrite = lambda response: {
+            **response.headers, "Cache-Control": "max-age=60", "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT",
+        }
+
+        network.get(cache, BOOKS)    # revalidated: now fresh for 60 s
+        third = network.get(cache, BOOKS)
+
+        assert [status for _, _, _, status in network.sent] == [200, 304]
+        assert third.from_cache and third.headers["Cache-Control"] == "max-age=60"
+        assert third.headers["Last-Modified"] == "Sat, 17 Oct 2026 10:00:00 GMT"
+
+    def test_memory_evicts_least_recently_used(self, server):
+        """With room for two entries, the one not used for longest goes first"""
+        cache = ResponseCache(ttl_s=300, max_entries=2)
+        network = Network(server.url)
+
+        network.get(cache, BOOK, params={"ISBN": ISBNS[0]})
+        network.get(cache, BOOK, params={"ISBN": ISBNS[1]})
+        network.get(cache, BOOK, params={"ISBN": ISBNS[0]})   # hit: ISBNS[0] is now most recent
+        network.get(cache, BOOK, params={"ISBN": ISBNS[2]})   # evicts ISBNS[1]
+
+        assert network.get(cache, BOOK, params={"ISBN": ISBNS[0]}).from_cache
+        assert not getattr(network.get(cache, BOOK, params={"ISBN": ISBNS[1]}), "from_cache", False)
+        assert [params["ISBN"] for _, params, _, _ in network.sent] == [ISBNS[0], ISBNS[1], ISBNS[2], ISBNS[1]]
+
+    def test_disk_store_is_shared_and_trimmed(self, server, tmp_path):
+        """Another cache on the same folder reuses entries; close() keeps the most recently used"""
+        network = Network(server.url)
+        writer = ResponseCache(tmp_path, ttl_s=300, max_disk_entries=1)
+        network.get(writer, BOOK, params={"ISBN": ISBNS[0]})
+        network.get(writer, BOOK, params={"ISBN": ISBNS[1]})
+        writer.close()
+
+        reader = ResponseCache(tmp_path, ttl_s=300)
+        assert network.get(reader, BOOK, params={"ISBN": ISBNS[1]}).from_cache
+        assert not getattr(network.get(reader, BOOK, params={"ISBN": ISBNS[0]}), "from_cache", False)
+        assert len(network.sent) == 3
@@ -0,0 +1,94 @@
+"""
+Framework Tests: Per-Phase Timing
+Tests that nested and re-entered phases are counted once, and the per-phase summary
+"""
+
+import time
+
+import pytest
+
+from utils.timing import UNATTRIBUTED, PhaseTimings, percentile, summarize
+
+
+class TestPhaseTimings:
+    """Test suite for PhaseTimings"""
+
+    def test_reentered_phase_counts_once(self):
+        """A locator wait inside a locator wait records one entry for the outer wall time"""
+        timings = PhaseTimings("t::a")
+        start = time.perf_counter()
+        with timings.phase("locator_wait"):
+            time.sleep(0.02)
+            with timings.phase("locator_wait"):
+                time.sleep(0.02)
+        elapsed = time.perf_counter() - start
+
+        entry = timings.phases["locator_wait"]
+        assert entry["count"] == 1
+        assert 0.04 <= entry["seconds"] <= elapsed
+
+    def test_nested_phases_do_not_overlap(self):
+        """Time in a nested phase is subtracted from the enclosing one"""
+        timings = PhaseTimings("t::a")
+        start = time.perf_counter()
+        with timings.phase("locator_wait"):
+            time.sleep(0.02)
+            with timings.phase("goto"):
+                time.sleep(0.03)
+                with timings.phase("locator_wait"):
+                    time.sleep(0.01)
+        elapsed = time.perf_counter() - start
+
+        phases = timings.phases
+        assert phases["goto"]["seconds"] >= 0.04
+        assert 0.02 <= phases["locator_wait"]["seconds"] < 0.04
+        assert phases["locator_wait"]["seconds"] + phases["goto"]["seconds"] == pytest.approx(elapsed, abs=0.005)
+
+    def test_phase_can_be_entered_again_after_it_closed(self):
+        """Sequential entries are separate samples"""
+        timings = PhaseTimings("t::a")
+        for _ in range(3):
+            with timings.phase("locator_wait"):
+                pass
+
+        assert timings.phases["locator_wait"]["count"] == 3
+
+    def test_unattributed_time(self):
+        """Wall time not covered by a phase is reported as unattributed"""
+        timings = PhaseTimings("t::a")
+        timings.phases["goto"]["seconds"] = 0.25
+        timings.wall.update({"setup": 0.5, "call": 1.0, "teardown": 0.25})
+
+        sample = timings.as_dict()
+
+        assert sample["wall"]["total"] == 1.75
+        assert sample["unattributed"] == 1.5
+
+
+class TestSummarize:
+    """Test suite for summarize"""
+
+    def test_per_phase_statistics(self):
+        """Each phase gets its test count, nearest-rank p50/p95 and total"""
+        samples = {
+            f"t::{number}": {
+                "wall": {"setup": 0.1, "call": number / 10},
+                "phases": {"goto": {"seconds": number / 100, "count": 1}},
+                "unattributed": 0.0,
+            }
+            for number in range(1, 21)
+        }
+        samples["t::1"]["phases"]["locator_wait"] = {"seconds": 0.5, "count": 2}
+
+        summary = summarize(samples)
+
+        assert summary["goto"] == {"tests": 20, "p50": 0.1, "p95": 0.19, "total": 2.1}
+        assert summary["locator_wait"] == {"tests": 1, "p50": 0.5, "p95": 0.5, "total": 0.5}
+        assert summary["pytest:setup"]["tests"] == 20 and "pytest:teardown" not in summary
+        assert summary[UNATTRIBUTED]["total"] == 0.0
+
+    def test_percentile(self):
+        """Nearest rank, 0 for no values"""
+        assert percentile([], 50) == 0.0
+        assert percentile([3, 1, 2], 50) == 2
+        assert percentile([3, 1, 2], 100) == 3
@@ -0,0 +1,63 @@
+"""
+Framework Tests: Account User Pool
+Tests that a failed token refresh never loses a pooled user
+"""
+
+import pytest
+
+from utils.data_factory import DataFactory
+from utils.user_pool import UserPool
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: dict):
+        self.status_code = status_code
+        self.body = body
+        self.text = str(body)
+
+    def json(self):
+        return self.body
+
+
+class FlakyTokenClient:
+    """Creates users; GenerateToken fails while `token_down` is set"""
+
+    def __init__(self):
+        self.token_down = False
+        self.created = []
+
+    def post(self, path, json=None, **kwargs):
+        if path == "/Account/v1/User":
+            self.created.append(json["userName"])
+            return FakeResponse(201, {"userID": f"id-{len(self.created)}"})
+        if self.token_down:
+            return FakeResponse(502, {})
+        return FakeResponse(200, {"token": "token", "expires": None})
+
+    def delete(self, path, **kwargs):
+        return FakeResponse(204, {})
+
+
+class TestUserPool:
+    """Test suite for UserPool"""
+
+    def test_user_is_returned_when_refresh_fails(self):
+        """A refresh error is raised, and the user can be acquired again afterwards"""
+        client = FlakyTokenClient()
+        client.token_down = True
+        pool = UserPool(client, DataFactory("abc123", "gw0"), size=1, acquire_timeout=0.1).provision()
+
+        with pytest.raises(RuntimeError, match="Token refresh failed"):
+            pool.acquire()
+
+        client.token_down = False
+        user = pool.acquire()
+        assert user.token == "token"
+
+    def test_usernames_come_from_the_data_factory(self):
+        """Usernames share the factory's run id and worker namespace"""
+        client = FlakyTokenClient()
+        pool = UserPool(client, DataFactory("abc123", "gw0"), size=2).provision()
+
+        assert sorted(client.created) == ["pool_abc123w1_00000", "pool_abc123w1_00001"]
+        assert len(pool.users) == 2
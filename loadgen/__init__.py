@@ -0,0 +1,8 @@
+"""
+Load Generation
+Concurrent load against the BookStore and Account endpoints the API suite
+covers, with throughput, error rates and HdrHistogram-style latency percentiles
+"""
+from loadgen.histogram import LatencyHistogram
+from loadgen.runner import LoadResult, LoadRunner, OperationStats
+from loadgen.scenarios import DEFAULT_MIX, BookStoreScenario, parse_mix
@@ -0,0 +1,83 @@
+"""
+Run a load test against the DemoQA BookStore and Account APIs
+
+    python -m loadgen                                     # local stand-in, 8 threads, 10 s
+    python -m loadgen --concurrency 32 --duration 60 --mix books=1,book=1
+    python -m loadgen --rate 200 --concurrency 64         # open loop: 200 calls/s
+    python -m loadgen --base-url https://demoqa.com --concurrency 4 --duration 30
+"""
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from config import get_settings
+from loadgen.runner import LoadRunner
+from loadgen.scenarios import DEFAULT_MIX, BookStoreScenario, parse_mix
+from utils.local_demoqa import LocalDemoQA
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LearnNow API load generator")
+    parser.add_argument("--base-url", help="Target (default: start the local DemoQA stand-in)")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="Threads (closed loop) or maximum calls in flight (with --rate)")
+    parser.add_argument("--rate", type=float, help="Open loop: calls per second regardless of response times")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before measuring")
+    parser.add_argument("--mix", type=parse_mix, default=dict(DEFAULT_MIX),
+                        help="Operation weights, e.g. books=3,book=3,token=1")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Request timeout in seconds")
+    parser.add_argument("--max-error-rate", type=float,
+                        help="Exit 1 when the overall error rate is above this (0.01 = 1%%)")
+    parser.add_argument("--output", help="Result file (default: <reports_dir>/load/<timestamp>.json)")
+    args = parser.parse_args()
+
+    server = None if args.base_url else LocalDemoQA().start()
+    base_url = args.base_url or server.url
+    scenario = BookStoreScenario(base_url, pool_size=args.concurrency, timeout=args.timeout)
+    mode = f"{args.rate:g} calls/s, max {args.concurrency} in flight" if args.rate else f"{args.concurrency} threads"
+    print(f"🌐 Load test against {base_url} ({mode}, {args.duration:g}s + {args.warmup:g}s warmup)\n")
+    try:
+        scenario.setup(args.mix)
+        runner = LoadRunner(
+            scenario.operations(args.mix),
+            concurrency=args.concurrency,
+            duration_s=args.duration,
+            rate=args.rate,
+            warmup_s=args.warmup,
+        )
+        result = runner.run().as_dict()
+    finally:
+        scenario.teardown()
+        if server:
+            server.stop()
+
+    _print_table(result)
+    output = Path(args.output or f"{get_settings().reports_dir}/load/{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"base_url": base_url, "mix": args.mix, **result}, indent=2), encoding="utf-8")
+    print(f"\n✅ Results saved: {output}")
+
+    error_rate = result["operations"]["total"]["error_rate"]
+    if args.max_error_rate is not None and error_rate > args.max_error_rate:
+        print(f"❌ Error rate {error_rate:.2%} is above {args.max_error_rate:.2%}")
+        return 1
+    return 0
+
+
+def _print_table(result: dict):
+    print(f"{'operation':<10}{'requests':>10}{'req/s':>10}{'err %':>9}"
+          f"{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'p99.9 ms':>10}{'max ms':>10}")
+    for name, row in result["operations"].items():
+        latency = row["latency"]
+        print(f"{name:<10}{row['requests']:>10}{row['throughput_rps']:>10.1f}{row['error_rate']:>9.2%}"
+              f"{latency['p50_ms']:>10.2f}{latency['p90_ms']:>10.2f}{latency['p99_ms']:>10.2f}"
+              f"{latency['p99.9_ms']:>10.2f}{latency['max_ms']:>10.2f}")
+        if row["error_kinds"]:
+            print(f"{'':<10}errors: {', '.join(f'{kind}={count}' for kind, count in row['error_kinds'].items())}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Latency Histogram
+HdrHistogram-style log-linear buckets: constant memory, fixed relative error
+(set by significant digits) and exact merge, whatever the number of samples
+"""
+import math
+
+
+class LatencyHistogram:
+    """
+    Records latencies in microseconds into log-linear buckets
+
+    Values below `sub_bucket_count` get one bucket each; above that every
+    power of two is split into `sub_bucket_count / 2` buckets, so any recorded
+    value is reported within 10^-significant_digits of its true value.
+    """
+
+    def __init__(self, significant_digits: int = 3):
+        """
+        Initialize an empty histogram
+        Args:
+            significant_digits: Decimal digits of precision kept (1-5)
+        """
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.significant_digits = significant_digits
+        self.sub_bucket_count = 2 ** math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._half = self.sub_bucket_count // 2
+        self._shift = self.sub_bucket_count.bit_length() - 2
+        self.counts = {}
+        self.total = 0
+        self.min_us = None
+        self.max_us = 0
+        self.sum_us = 0
+
+    def record(self, value_us: int, count: int = 1):
+        """Add `count` samples of a latency in microseconds"""
+        value_us = max(int(value_us), 0)
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+        self.sum_us += value_us * count
+        self.max_us = max(self.max_us, value_us)
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+
+    def record_seconds(self, seconds: float):
+        self.record(round(seconds * 1_000_000))
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add every sample of another histogram with the same precision"""
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+
+    def value_at_percentile(self, pct: float) -> int:
+        """Highest value (µs) of the bucket holding the given percentile"""
+        if not self.total:
+            return 0
+        wanted = max(math.ceil(pct / 100 * self.total), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= wanted:
+                return min(self._highest_equivalent(index), self.max_us)
+        return self.max_us
+
+    @property
+    def mean_us(self) -> float:
+        return self.sum_us / self.total if self.total else 0.0
+
+    def summary(self, percentiles=(50, 90, 99, 99.9)) -> dict:
+        """Count, mean, min, max and percentiles in milliseconds"""
+        summary = {
+            "n": self.total,
+            "min_ms": round((self.min_us or 0) / 1000, 3),
+            "mean_ms": round(self.mean_us / 1000, 3),
+            "max_ms": round(self.max_us / 1000, 3),
+        }
+        for pct in percentiles:
+            summary[f"p{pct:g}_ms"] = round(self.value_at_percentile(pct) / 1000, 3)
+        return summary
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_bucket_count:
+            return value
+        magnitude = value.bit_length() - 1 - self._shift
+        return magnitude * self._half + (value >> magnitude)
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < self.sub_bucket_count:
+            return index
+        magnitude = (index - self._half) // self._half
+        sub_bucket = index - magnitude * self._half
+        return ((sub_bucket + 1) << magnitude) - 1
@@ -0,0 +1,177 @@
+"""
+Load Runner
+Drives weighted API operations from a thread pool, either closed-loop (fixed
+concurrency) or open-loop (fixed arrival rate), and aggregates throughput,
+errors and latency histograms per operation
+"""
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from loadgen.histogram import LatencyHistogram
+
+
+@dataclass
+class OperationStats:
+    """Outcome of one operation over the measured window"""
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: dict = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        return self.histogram.total
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    def merge(self, other: "OperationStats"):
+        self.histogram.merge(other.histogram)
+        for kind, count in other.errors.items():
+            self.errors[kind] = self.errors.get(kind, 0) + count
+
+
+@dataclass
+class LoadResult:
+    """Per-operation stats plus the run parameters"""
+    mode: str
+    concurrency: int
+    rate: float
+    duration_s: float
+    operations: dict = field(default_factory=dict)
+
+    def total(self) -> OperationStats:
+        combined = OperationStats()
+        for stats in self.operations.values():
+            combined.merge(stats)
+        return combined
+
+    def as_dict(self) -> dict:
+        rows = {name: self._row(stats) for name, stats in sorted(self.operations.items())}
+        rows["total"] = self._row(self.total())
+        return {
+            "mode": self.mode,
+            "concurrency": self.concurrency,
+            "rate": self.rate,
+            "duration_s": round(self.duration_s, 3),
+            "operations": rows,
+        }
+
+    def _row(self, stats: OperationStats) -> dict:
+        return {
+            "requests": stats.requests,
+            "throughput_rps": round(stats.requests / self.duration_s, 1) if self.duration_s else 0.0,
+            "errors": stats.error_count,
+            "error_rate": round(stats.error_count / stats.requests, 4) if stats.requests else 0.0,
+            "error_kinds": dict(stats.errors),
+            "latency": stats.histogram.summary(),
+        }
+
+
+class LoadRunner:
+    """
+    Runs a weighted mix of operations for a fixed duration
+
+    An operation is a callable returning a response (anything with status_code);
+    a status of 400 or more, or an exception, counts as an error.
+
+    - closed loop (rate=None): `concurrency` threads call back to back, so
+      throughput is whatever the target sustains
+    - open loop (rate=N): N calls per second are scheduled regardless of how
+      fast earlier ones finish; latency is measured from the scheduled start,
+      so a stalled target shows up in the percentiles instead of lowering the
+      request rate (no coordinated omission)
+    """
+
+    def __init__(self, operations: dict, concurrency: int = 8, duration_s: float = 10.0,
+                 rate: float = None, warmup_s: float = 0.0, seed: int = 0):
+        """
+        Initialize the runner
+        Args:
+            operations: Name -> (weight, callable)
+            concurrency: Threads (closed loop) or maximum calls in flight (open loop)
+            duration_s: Measured run time
+            rate: Calls per second for open-loop mode (None = closed loop)
+            warmup_s: Unmeasured run time before the measured window
+            seed: Seed for the operation mix
+        """
+        if not operations:
+            raise ValueError("At least one operation is required")
+        self.operations = operations
+        self.concurrency = max(1, concurrency)
+        self.duration_s = duration_s
+        self.rate = rate
+        self.warmup_s = warmup_s
+        self.seed = seed
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._measure_from = 0.0
+
+    def run(self) -> LoadResult:
+        """Run warmup and the measured window; returns the measured stats"""
+        self._stats = {name: OperationStats() for name in self.operations}
+        start = time.perf_counter()
+        self._measure_from = start + self.warmup_s
+        deadline = self._measure_from + self.duration_s
+        if self.rate:
+            self._open_loop(start, deadline)
+        else:
+            self._closed_loop(deadline)
+        # Calls still in flight at the deadline are counted, so is the time they took
+        elapsed = time.perf_counter() - self._measure_from
+        return LoadResult(
+            mode="open" if self.rate else "closed",
+            concurrency=self.concurrency,
+            rate=self.rate,
+            duration_s=max(elapsed, 0.0),
+            operations=self._stats,
+        )
+
+    def _picker(self, seed: int):
+        names = list(self.operations)
+        weights = [self.operations[name][0] for name in names]
+        rng = random.Random(seed)
+        return lambda: rng.choices(names, weights)[0]
+
+    def _closed_loop(self, deadline: float):
+        def worker(index):
+            pick = self._picker(self.seed + index)
+            while time.perf_counter() < deadline:
+                name = pick()
+                self._call(name, time.perf_counter())
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="load") as executor:
+            list(executor.map(worker, range(self.concurrency)))
+
+    def _open_loop(self, start: float, deadline: float):
+        pick = self._picker(self.seed)
+        interval = 1.0 / self.rate
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="load") as executor:
+            for tick in itertools.count():
+                scheduled = start + tick * interval
+                if scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self._call, pick(), scheduled)
+
+    def _call(self, name: str, started: float):
+        error = None
+        try:
+            response = self.operations[name][1]()
+            if response.status_code >= 400:
+                error = str(response.status_code)
+        except Exception as exc:
+            error = type(exc).__name__
+        finished = time.perf_counter()
+        if started < self._measure_from:
+            return
+        with self._lock:
+            stats = self._stats[name]
+            stats.histogram.record_seconds(finished - started)
+            if error:
+                stats.errors[error] = stats.errors.get(error, 0) + 1
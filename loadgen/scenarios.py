@@ -0,0 +1,94 @@
+"""
+Load Scenarios
+The BookStore and Account operations the API suite covers, bound to pooled
+clients and one throwaway account
+"""
+import secrets
+import uuid
+
+from api_tests.clients import AccountClient, BookStoreClient
+
+# Default mix: reads dominate, token generation is the write-ish path
+DEFAULT_MIX = {"books": 3, "book": 3, "token": 1}
+
+
+class BookStoreScenario:
+    """
+    Builds the operations for LoadRunner
+
+    - books: GET /BookStore/v1/Books
+    - book:  GET /BookStore/v1/Book?ISBN=<isbn> (cycling through the catalog)
+    - token: POST /Account/v1/GenerateToken for an account created in setup()
+    """
+
+    def __init__(self, base_url: str, pool_size: int = 10, timeout: float = 30.0):
+        """
+        Initialize the clients (nothing is sent until setup())
+        Args:
+            base_url: Target, live DemoQA or the local stand-in
+            pool_size: Keep-alive connections per client (use the concurrency)
+            timeout: Request timeout in seconds
+        """
+        # Retries would hide errors the load run is meant to count
+        self.books = BookStoreClient(base_url, pool_size=pool_size, timeout=timeout, retries=0)
+        self.account = AccountClient(base_url, pool_size=pool_size, timeout=timeout, retries=0)
+        self.isbns = []
+        self.username = f"load_{uuid.uuid4().hex[:8]}"
+        self.password = f"Pw@{secrets.token_hex(6)}A1"
+        self.user_id = None
+        self._next_isbn = 0
+
+    def setup(self, mix: dict):
+        """Fetch the catalog and create the account the selected operations need"""
+        if "book" in mix:
+            response = self.books.get_books()
+            response.raise_for_status()
+            self.isbns = [book["isbn"] for book in response.json()["books"]]
+            if not self.isbns:
+                raise RuntimeError("The catalog is empty: nothing to request by ISBN")
+        if "token" in mix:
+            response = self.account.create_user(self.username, self.password)
+            if response.status_code != 201:
+                raise RuntimeError(f"Could not create the load account: {response.status_code} {response.text}")
+            self.user_id = response.json()["userID"]
+        return self
+
+    def operations(self, mix: dict) -> dict:
+        """Name -> (weight, callable) for the given weights"""
+        available = {"books": self.get_books, "book": self.get_book, "token": self.generate_token}
+        unknown = set(mix) - set(available)
+        if unknown:
+            raise ValueError(f"Unknown operation(s): {', '.join(sorted(unknown))} (choose from {', '.join(available)})")
+        return {name: (weight, available[name]) for name, weight in mix.items() if weight > 0}
+
+    def get_books(self):
+        return self.books.get_books()
+
+    def get_book(self):
+        # Racy increment across threads is fine: any spread over the catalog will do
+        isbn = self.isbns[self._next_isbn % len(self.isbns)]
+        self._next_isbn += 1
+        return self.books.get_book(isbn)
+
+    def generate_token(self):
+        return self.account.generate_token(self.username, self.password)
+
+    def teardown(self):
+        """Delete the load account and close the connection pools"""
+        try:
+            if self.user_id:
+                token = self.account.generate_token(self.username, self.password).json().get("token")
+                self.account.delete_user(self.user_id, token)
+        except Exception:
+            pass  # best effort: the account is throwaway
+        self.books.close()
+        self.account.close()
+
+
+def parse_mix(value: str) -> dict:
+    """'books=3,book=3,token=1' -> {'books': 3, 'book': 3, 'token': 1}"""
+    mix = {}
+    for part in filter(None, (part.strip() for part in value.split(","))):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
@@ -0,0 +1,8 @@
+"""
+Async Page Objects
+playwright.async_api versions of the page objects, for concurrent tests
+"""
+from ui_tests.pages.async_pages.base_page import AsyncBasePage
+from ui_tests.pages.async_pages.elements_page import AsyncElementsPage
+from ui_tests.pages.async_pages.forms_page import AsyncFormsPage
+from ui_tests.pages.async_pages.home_page import AsyncHomePage
@@ -0,0 +1,127 @@
+"""
+Async Base Page Class
+Same API as BasePage, built on playwright.async_api
+"""
+from playwright.async_api import Page
+
+from config import get_settings
+from utils import adaptive_timeouts, locators
+
+
+class AsyncBasePage:
+    """
+    Base class for all async page objects
+    Every method is a coroutine and must be awaited
+    """
+
+    def __init__(self, page: Page):
+        """
+        Initialize the base page
+        Args:
+            page: Playwright async Page object
+        """
+        self.page = page
+        self.timeout = get_settings().default_timeout_ms  # 30 seconds unless the profile changes it
+
+    async def navigate(self, url: str):
+        """
+        Navigate to a specific URL
+        Args:
+            url: The URL to navigate to
+        """
+        await self.page.goto(url, wait_until="domcontentloaded")
+
+    async def get_title(self) -> str:
+        """
+        Get the current page title
+        Returns:
+            str: Page title
+        """
+        return await self.page.title()
+
+    def get_url(self) -> str:
+        """
+        Get the current page URL
+        Returns:
+            str: Current URL
+        """
+        return self.page.url
+
+    async def resolve(self, selector: str, timeout: int = None) -> str:
+        """
+        Pick the candidate of a Fallback chain that matches the current page
+        Args:
+            selector: Fallback chain or plain selector (returned unchanged)
+            timeout: How long to wait for any candidate, in milliseconds (0 = no waiting)
+        Returns:
+            str: Selector to use
+        """
+        timeout_ms = self.timeout if timeout is None else timeout
+        return await locators.active().resolve_async(self.page, selector, timeout_ms)
+
+    async def click_element(self, selector: str):
+        """
+        Click on an element
+        Args:
+            selector: Element selector (CSS, text, XPath)
+        """
+        await self.page.locator(await self.resolve(selector)).click()
+
+    async def fill_text(self, selector: str, text: str):
+        """
+        Fill text into an input field
+        Args:
+            selector: Element selector
+            text: Text to fill
+        """
+        await self.page.locator(await self.resolve(selector)).fill(text)
+
+    async def is_visible(self, selector: str, timeout: int = None) -> bool:
+        """
+        Check if element is visible
+        Args:
+            selector: Element selector
+            timeout: Optional timeout in milliseconds
+        Returns:
+            bool: True if visible, False otherwise
+        """
+        try:
+            timeout_ms = timeout if timeout else self.timeout
+            selector = await self.resolve(selector, timeout=0)
+            return await self.page.locator(selector).is_visible(timeout=timeout_ms)
+        except Exception:
+            return False
+
+    async def get_text(self, selector: str, timeout: int = None) -> str:
+        """
+        Get text content of an element
+        Args:
+            selector: Element selector
+            timeout: Optional timeout in milliseconds
+        Returns:
+            str: Text content (empty string if not found)
+        """
+        try:
+            with adaptive_timeouts.wait(self, selector, self.timeout, timeout) as timeout_ms:
+                selector = await self.resolve(selector, timeout_ms)
+                return await self.page.locator(selector).text_content(timeout=timeout_ms)
+        except Exception:
+            return ""
+
+    async def wait_for_element(self, selector: str):
+        """
+        Explicitly wait for element to be visible
+        Args:
+            selector: Element selector
+        """
+        with adaptive_timeouts.wait(self, selector, self.timeout) as timeout_ms:
+            selector = await self.resolve(selector, timeout_ms)
+            await self.page.locator(selector).wait_for(state="visible", timeout=timeout_ms)
+
+    async def take_screenshot(self, filename: str):
+        """
+        Take a screenshot of current page
+        Args:
+            filename: Name of screenshot file
+        """
+        await self.page.screenshot(path=f"screenshots/{filename}")
@@ -0,0 +1,50 @@
+"""
+Async Elements Page Object
+Async version of ElementsPage for the DemoQA Elements page
+"""
+from ui_tests.pages.async_pages.base_page import AsyncBasePage
+from ui_tests.pages.elements_page import ElementsPage
+
+
+class AsyncElementsPage(AsyncBasePage):
+    """
+    Async Page Object for DemoQA Elements Page
+    Locators are shared with ElementsPage
+    """
+
+    MAIN_HEADER = ElementsPage.MAIN_HEADER
+    MENU_TEXT_BOX = ElementsPage.MENU_TEXT_BOX
+    MENU_CHECK_BOX = ElementsPage.MENU_CHECK_BOX
+
+    async def get_header_text(self):
+        """
+        Get the main header text
+        Returns:
+            str: Header text (trimmed)
+        """
+        text = await self.get_text(self.MAIN_HEADER, timeout=5000)
+        return text.strip() if text else ""
+
+    async def is_on_elements_page(self):
+        """
+        Verify we are on Elements page
+        Returns:
+            bool: True if on Elements page
+        """
+        try:
+            await self.page.wait_for_url("**/elements", timeout=5000)
+        except Exception:
+            pass
+        return "elements" in self.get_url().lower()
+
+    async def click_text_box(self):
+        """Click on 'Text Box' menu item"""
+        await self.click_element(self.MENU_TEXT_BOX)
+
+    async def is_text_box_visible(self):
+        """
+        Check if Text Box menu item is visible
+        Returns:
+            bool: True if visible
+        """
+        return await self.is_visible(self.MENU_TEXT_BOX)
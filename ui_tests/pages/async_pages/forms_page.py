@@ -0,0 +1,59 @@
+"""
+Async Forms Page Object
+Async version of FormsPage for the DemoQA Practice Form
+"""
+from ui_tests.pages.async_pages.base_page import AsyncBasePage
+from ui_tests.pages.forms_page import FormsPage
+
+
+class AsyncFormsPage(AsyncBasePage):
+    """
+    Async Page Object for DemoQA Practice Form
+    Locators are shared with FormsPage
+    """
+
+    URL = FormsPage.URL
+
+    FIRST_NAME = FormsPage.FIRST_NAME
+    LAST_NAME = FormsPage.LAST_NAME
+    EMAIL = FormsPage.EMAIL
+    MOBILE = FormsPage.MOBILE
+
+    GENDER_MALE = FormsPage.GENDER_MALE
+    GENDER_FEMALE = FormsPage.GENDER_FEMALE
+    GENDER_OTHER = FormsPage.GENDER_OTHER
+
+    SUBMIT_BUTTON = FormsPage.SUBMIT_BUTTON
+    SUCCESS_MODAL = FormsPage.SUCCESS_MODAL
+
+    async def open(self):
+        """Open the Practice Form page"""
+        await self.navigate(self.URL)
+
+    async def fill_first_name(self, name: str):
+        """Fill first name field"""
+        await self.fill_text(self.FIRST_NAME, name)
+
+    async def fill_last_name(self, name: str):
+        """Fill last name field"""
+        await self.fill_text(self.LAST_NAME, name)
+
+    async def fill_email(self, email: str):
+        """Fill email field"""
+        await self.fill_text(self.EMAIL, email)
+
+    async def fill_mobile(self, mobile: str):
+        """Fill mobile number field"""
+        await self.fill_text(self.MOBILE, mobile)
+
+    async def select_gender_male(self):
+        """Select Male gender"""
+        await self.click_element(self.GENDER_MALE)
+
+    async def click_submit(self):
+        """Click submit button"""
+        await self.click_element(self.SUBMIT_BUTTON)
+
+    async def is_success_modal_visible(self) -> bool:
+        """Check if success modal appears after submission"""
+        return await self.is_visible(self.SUCCESS_MODAL)
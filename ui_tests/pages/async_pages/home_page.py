@@ -0,0 +1,54 @@
+"""
+Async Page Object Model: Home Page
+Description: Async page object for DemoQA homepage
+"""
+from playwright.async_api import expect
+
+from ui_tests.pages.async_pages.base_page import AsyncBasePage
+from ui_tests.pages.home_page import HomePage
+
+
+class AsyncHomePage(AsyncBasePage):
+    """Async Page Object for DemoQA Homepage (locators shared with HomePage)"""
+    URL = HomePage.URL
+
+    BANNER_IMAGE = HomePage.BANNER_IMAGE
+    ELEMENTS_CARD = HomePage.ELEMENTS_CARD
+    ALL_CARDS = HomePage.ALL_CARDS
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.url = self.URL
+
+        # Locators
+        self.banner = ".banner-image"
+        self.elements_card = "div.card:has-text('Elements')"
+        self.cards = ".card"
+
+    async def open(self):
+        """Navigate to homepage"""
+        await self.page.goto(self.url, wait_until="domcontentloaded", timeout=60000)
+        await self.page.locator("div.home-banner").wait_for(state="visible", timeout=15000)
+
+    async def is_banner_visible(self):
+        """Check if banner is visible"""
+        banner = self.page.locator(".home-banner img")
+        try:
+            await banner.wait_for(state="visible", timeout=10000)
+            return True
+        except Exception:
+            return False
+
+    async def is_elements_card_visible(self):
+        """Check if Elements card is visible"""
+        return await self.page.locator(self.elements_card).is_visible()
+
+    async def get_cards_count(self):
+        """Count total cards on page"""
+        return await self.page.locator(self.cards).count()
+
+    async def click_elements_card(self):
+        card = self.page.locator(self.elements_card)
+        await expect(card).to_be_visible(timeout=10000)
+        await card.scroll_into_view_if_needed()
+        await card.click(force=True)
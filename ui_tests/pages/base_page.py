@@ -4,6 +4,11 @@ Contains common methods that all page classes will inherit
 """
 from playwright.sync_api import Page
 
+from config import get_settings
+from utils import adaptive_timeouts, dom_reads, event_log, locators
+from utils.form_fill import FormFillResult, fill_form
+from utils.timing import timed
+
 
 class BasePage:
     """
@@ -18,7 +23,7 @@ class BasePage:
             page: Playwright Page object
         """
         self.page = page
-        self.timeout = 30000  # 30 seconds default timeout
+        self.timeout = get_settings().default_timeout_ms  # 30 seconds unless the profile changes it
     
     def navigate(self, url: str):
         """
@@ -27,7 +32,7 @@ class BasePage:
             url: The URL to navigate to
         """
         self.page.goto(url, wait_until="domcontentloaded")
-        print(f"✅ Navigated to: {url}")
+        event_log.info("navigate", url=url)
     
     def get_title(self) -> str:
         """
@@ -45,15 +50,47 @@ class BasePage:
         """
         return self.page.url
     
+    @timed("locator_wait")
+    def resolve(self, selector: str, timeout: int = None) -> str:
+        """
+        Pick the candidate of a Fallback chain that matches the current page
+        Args:
+            selector: Fallback chain or plain selector (returned unchanged)
+            timeout: How long to wait for any candidate, in milliseconds (0 = no waiting)
+        Returns:
+            str: Selector to use
+        """
+        timeout_ms = self.timeout if timeout is None else timeout
+        return locators.active().resolve(self.page, selector, timeout_ms)
+    
+    @timed("dom_read")
+    def read(self, queries: dict, require: tuple = (), timeout: int = None) -> dict:
+        """
+        Read many locators in one in-page evaluation
+        Args:
+            queries: Result name -> query (utils.dom_reads.visible/text/count/attribute)
+            require: Names that must be truthy; the page is polled until they are
+            timeout: Polling limit for `require` in milliseconds
+        Returns:
+            dict: Result name -> value (current state if `require` timed out)
+        
+        Example:
+            state = self.read({"banner": visible(".home-banner"), "cards": count(".card")})
+        """
+        timeout_ms = self.timeout if timeout is None else timeout
+        return dom_reads.read(self.page, queries, require, timeout_ms)
+    
+    @timed("click")
     def click_element(self, selector: str):
         """
         Click on an element
         Args:
             selector: Element selector (CSS, text, XPath)
         """
-        self.page.locator(selector).click()
-        print(f"✅ Clicked element: {selector}")
+        self.page.locator(self.resolve(selector)).click()
+        event_log.info("click", selector=selector)
     
+    @timed("fill")
     def fill_text(self, selector: str, text: str):
         """
         Fill text into an input field
@@ -61,9 +98,27 @@ class BasePage:
             selector: Element selector
             text: Text to fill
         """
-        self.page.locator(selector).fill(text)
-        print(f"✅ Filled text '{text}' into: {selector}")
+        self.page.locator(self.resolve(selector)).fill(text)
+        # Length only: fields hold passwords and tokens
+        event_log.info("fill", selector=selector, chars=len(text))
+    
+    @timed("fill")
+    def fill_form(self, mapping: dict) -> FormFillResult:
+        """
+        Fill many fields in one round trip and read their values back,
+        after waiting (in the page) until every field is rendered and editable
+        Args:
+            mapping: Selector -> value
+        Returns:
+            FormFillResult: .ok, .mismatches, .missing, .describe()
+        """
+        result = fill_form(self.page, mapping, self.timeout)
+        # Selectors only: the values may be passwords or tokens
+        event_log.info("fill_form", fields=len(mapping), ok=result.ok,
+                       missing=result.missing, mismatched=list(result.mismatches))
+        return result
     
+    @timed("locator_wait")
     def is_visible(self, selector: str, timeout: int = None) -> bool:
         """
         Check if element is visible
@@ -75,10 +130,11 @@ class BasePage:
         """
         try:
             timeout_ms = timeout if timeout else self.timeout
-            return self.page.locator(selector).is_visible(timeout=timeout_ms)
+            return self.page.locator(self.resolve(selector, timeout=0)).is_visible(timeout=timeout_ms)
         except:
             return False
     
+    @timed("locator_wait")
     def get_text(self, selector: str, timeout: int = None) -> str:
         """
         Get text content of an element
@@ -89,19 +145,22 @@ class BasePage:
             str: Text content (empty string if not found)
         """
         try:
-            timeout_ms = timeout if timeout else self.timeout
-            return self.page.locator(selector).text_content(timeout=timeout_ms)
+            # Learned per-locator timeout, so a missing element fails fast
+            with adaptive_timeouts.wait(self, selector, self.timeout, timeout) as timeout_ms:
+                return self.page.locator(self.resolve(selector, timeout_ms)).text_content(timeout=timeout_ms)
         except:
             return ""
     
+    @timed("locator_wait")
     def wait_for_element(self, selector: str):
         """
         Explicitly wait for element to be visible
         Args:
             selector: Element selector
         """
-        self.page.locator(selector).wait_for(state="visible", timeout=self.timeout)
-        print(f"✅ Element is visible: {selector}")
+        with adaptive_timeouts.wait(self, selector, self.timeout) as timeout_ms:
+            self.page.locator(self.resolve(selector, timeout_ms)).wait_for(state="visible", timeout=timeout_ms)
+        event_log.info("element_visible", selector=selector)
     
     def take_screenshot(self, filename: str):
         """
@@ -110,4 +169,4 @@ class BasePage:
             filename: Name of screenshot file
         """
         self.page.screenshot(path=f"screenshots/{filename}")
-        print(f"✅ Screenshot saved: {filename}")
\ No newline at end of file
+        event_log.info("screenshot", filename=filename)
\ No newline at end of file
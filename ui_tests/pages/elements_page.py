@@ -3,17 +3,18 @@ Elements Page Object
 Contains locators and methods for DemoQA Elements page
 """
 from ui_tests.pages.base_page import BasePage
+from utils.locators import Fallback
 
 
 class ElementsPage(BasePage):
     """
     Page Object for DemoQA Elements Page
-    URL: https://demoqa.com/elements
+    URL: /elements (relative to the UI base URL)
     """
     
     # ========== LOCATORS ==========
-    # Main header - using the selector we found in debug test
-    MAIN_HEADER = "[class*='header']"
+    # Main header - candidates in order of preference, the winner is remembered per URL
+    MAIN_HEADER = Fallback(".main-header", "h1.text-center", "h1", ".playgound-header", "[class*='header']")
     
     # Left side menu items
     MENU_TEXT_BOX = "text=Text Box"
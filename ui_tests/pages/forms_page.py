@@ -9,12 +9,12 @@ from ui_tests.pages.base_page import BasePage
 class FormsPage(BasePage):
     """
     Page Object for DemoQA Practice Form
-    URL: https://demoqa.com/automation-practice-form
+    URL: /automation-practice-form (relative to the UI base URL)
     """
     
     # ========== LOCATORS ==========
     
-    URL = "https://demoqa.com/automation-practice-form"
+    URL = "/automation-practice-form"
     
     # Form fields
     FIRST_NAME = "#firstName"
@@ -61,6 +61,20 @@ class FormsPage(BasePage):
         self.fill_text(self.MOBILE, mobile)
     
     
+    def fill_personal_details(self, first_name: str, last_name: str, email: str, mobile: str):
+        """
+        Fill name, email and mobile in one round trip
+        Returns:
+            FormFillResult: Check .ok / .describe() for fields that did not take their value
+        """
+        return self.fill_form({
+            self.FIRST_NAME: first_name,
+            self.LAST_NAME: last_name,
+            self.EMAIL: email,
+            self.MOBILE: mobile,
+        })
+    
+    
     def select_gender_male(self):
         """Select Male gender"""
         self.click_element(self.GENDER_MALE)
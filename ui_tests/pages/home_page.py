@@ -5,18 +5,23 @@ Description: Page object for DemoQA homepage
 
 from playwright.sync_api import Page,expect
 
+from config import get_settings
+from ui_tests.pages.base_page import BasePage
+from utils.dom_reads import count, visible
 
-class HomePage:
+
+class HomePage(BasePage):
     """Page Object for DemoQA Homepage"""
-    URL = "https://demoqa.com/"
+    URL = "/"  # relative to the UI base URL
 
     BANNER_IMAGE = ".home-banner"
     ELEMENTS_CARD = "div.card-body h5:has-text('Elements')"
     ALL_CARDS = "div.card"
+    CARD_TITLE = "div.card-body h5"
 
     def __init__(self, page: Page):
-        self.page = page
-        self.url = "https://demoqa.com/"
+        super().__init__(page)
+        self.url = self.URL
         
         # Locators
         self.banner = ".banner-image"
@@ -25,8 +30,9 @@ class HomePage:
     
     def open(self):
         """Navigate to homepage"""
-        self.page.goto(self.url, wait_until="domcontentloaded", timeout=60000)
-        self.page.locator("div.home-banner").wait_for(state="visible", timeout=15000)
+        settings = get_settings()
+        self.page.goto(self.url, wait_until="domcontentloaded", timeout=settings.navigation_timeout_ms)
+        self.page.locator("div.home-banner").wait_for(state="visible", timeout=settings.element_timeout_ms)
     
     def get_title(self):
         """Get page title"""
@@ -36,28 +42,57 @@ class HomePage:
         """Get current URL"""
         return self.page.url
     
+    def snapshot(self, wait_for_banner: bool = True, timeout: int = None) -> dict:
+        """
+        Homepage state in one evaluation
+        Args:
+            wait_for_banner: Poll in the page until the banner is visible (up to timeout)
+            timeout: Polling limit in milliseconds (default: the profile's element timeout)
+        Returns:
+            dict: banner_visible, elements_card_visible, cards_count
+        """
+        return self.read(
+            {
+                "banner_visible": visible(".home-banner img"),
+                "elements_card_visible": visible("div.card", has_text="Elements"),
+                "cards_count": count(self.cards),
+            },
+            require=("banner_visible",) if wait_for_banner else (),
+            timeout=timeout or get_settings().element_timeout_ms,
+        )
+    
     def is_banner_visible(self):
-        """Check if banner is visible"""
-        banner = self.page.locator(".home-banner img")
-        try:
-            banner.wait_for(state="visible", timeout=10000)
-            return True
-        except:
-            return False
+        """Check if banner is visible (waits up to the profile's element timeout for it)"""
+        return self.snapshot()["banner_visible"]
     
     def is_elements_card_visible(self):
         """Check if Elements card is visible"""
-        return self.page.locator(self.elements_card).is_visible()
+        return self.snapshot(wait_for_banner=False)["elements_card_visible"]
     
     def get_cards_count(self):
         """Count total cards on page"""
-        return self.page.locator(self.cards).count()
+        return self.snapshot(wait_for_banner=False)["cards_count"]
+    
+    def cards_visible(self, names: list, timeout: int = None) -> dict:
+        """
+        Visibility of category cards by title, waiting (in the page) until all are visible
+        Args:
+            names: Card titles
+            timeout: Wait limit in milliseconds (default: the profile's element timeout)
+        Returns:
+            dict: Card title -> visible
+        """
+        return self.read(
+            {name: visible(self.CARD_TITLE, has_text=name) for name in names},
+            require=tuple(names),
+            timeout=timeout or get_settings().element_timeout_ms,
+        )
     
     def click_elements_card(self):
         card = self.page.locator(self.elements_card)
 
         # Ensure card exists & is visible
-        expect(card).to_be_visible(timeout=10000)
+        expect(card).to_be_visible(timeout=get_settings().element_timeout_ms)
 
         # Scroll into view (CRITICAL in headless CI)
         card.scroll_into_view_if_needed()
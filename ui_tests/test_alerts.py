@@ -6,6 +6,9 @@ import pytest
 import re
 from playwright.sync_api import expect
 
+# Dialogs, frames and windows never need images, fonts or ads
+pytestmark = pytest.mark.block_resources("no-media")
+
 
 def test_handle_javascript_alert():
     """
@@ -18,7 +21,7 @@ def test_handle_javascript_alert():
         print("\n🧪 Testing Alert Handling")
         
         # Navigate to Alerts page
-        page.goto("https://demoqa.com/alerts")
+        page.goto("/alerts")
         
         # Set up alert handler BEFORE triggering alert
         page.on("dialog", lambda dialog: dialog.accept())
@@ -36,7 +39,7 @@ def test_handle_confirmation_dialog(page):
 
     print("\n🧪 Testing Confirmation Dialog")
     
-    page.goto("https://demoqa.com/alerts")
+    page.goto("/alerts")
     
     # Variable to store dialog message
     dialog_message = None
@@ -62,7 +65,7 @@ def test_handle_confirmation_dialog(page):
 def test_handle_prompt_dialog(page):
     print("\n🧪 Testing Prompt Dialog")
 
-    page.goto("https://demoqa.com/alerts")
+    page.goto("/alerts")
 
     def handle_prompt(dialog):
         print(f"📢 Prompt message: {dialog.message}")
@@ -87,7 +90,7 @@ def test_handle_prompt_dialog(page):
     """ 
     print("\n🧪 Testing Prompt Dialog")
     
-    page.goto("https://demoqa.com/alerts")
+    page.goto("/alerts")
     
     # Handle prompt and enter text
     def handle_prompt(dialog):
@@ -104,13 +107,13 @@ def test_handle_prompt_dialog(page):
     assert "Playwright Automation" in result
     print(f"✅ Prompt result: {result}")
 
-def test_handle_new_window(page):
+def test_handle_new_window(page, ui_base_url):
     """
     Test: Handle new browser window/tab
     """
     print("\n🧪 Testing New Window")
 
-    page.goto("https://demoqa.com/browser-windows")
+    page.goto("/browser-windows")
 
     # Listen for new page event
     with page.expect_popup() as popup_info:
@@ -123,7 +126,7 @@ def test_handle_new_window(page):
     new_page.wait_for_load_state("domcontentloaded")
 
     # Assert URL
-    expect(new_page).to_have_url("https://demoqa.com/sample")
+    expect(new_page).to_have_url(f"{ui_base_url}/sample")
     print(f"✅ New window URL: {new_page.url}")
 
     # Assert heading (AUTO-WAIT)
@@ -135,7 +138,7 @@ def test_handle_new_window(page):
     new_page.close()
 
     # Original page still active
-    expect(page).to_have_url("https://demoqa.com/browser-windows")
+    expect(page).to_have_url(f"{ui_base_url}/browser-windows")
     print("✅ Original page still accessible")
         
 #Scenario 3: Handling Iframes
@@ -143,7 +146,7 @@ def test_handle_iframe(page):
     print("\n🧪 Testing Iframe Handling")
 
     page.goto(
-        "https://demoqa.com/frames",
+        "/frames",
         wait_until="domcontentloaded",
         timeout=60000
     )
@@ -167,7 +170,7 @@ def test_handle_iframe(page):
 def test_wait_for_dynamic_element(page):
     print("\n🧪 Testing Dynamic Element Wait")
 
-    page.goto("https://demoqa.com/dynamic-properties")
+    page.goto("/dynamic-properties")
 
     # Locator defined early (safe)
     visible_button = page.locator("#visibleAfter")
@@ -0,0 +1,64 @@
+"""
+Test Suite: Async Page Objects
+Independent checks that run as concurrent coroutines on one browser
+"""
+import re
+import pytest
+from playwright.async_api import expect
+from ui_tests.pages.async_pages import AsyncElementsPage, AsyncFormsPage, AsyncHomePage
+
+
+@pytest.mark.concurrent
+async def test_async_homepage_title(async_page):
+    """
+    Test: Homepage title and URL
+    """
+    home_page = AsyncHomePage(async_page)
+    await home_page.open()
+
+    title = await home_page.get_title()
+    assert "DEMOQA" in title, f"Expected 'DEMOQA' in title, got '{title}'"
+    await expect(async_page).to_have_url(re.compile(r".*/$"))
+
+
+@pytest.mark.concurrent
+async def test_async_homepage_cards(async_page):
+    """
+    Test: Homepage shows the Elements card and 6 category cards
+    """
+    home_page = AsyncHomePage(async_page)
+    await home_page.open()
+
+    assert await home_page.is_elements_card_visible(), "Elements card is not visible"
+    cards_count = await home_page.get_cards_count()
+    assert cards_count == 6, f"Expected 6 cards, found {cards_count}"
+
+
+@pytest.mark.concurrent
+async def test_async_navigate_to_elements_page(async_page):
+    """
+    Test: Navigate from homepage to Elements page
+    """
+    home_page = AsyncHomePage(async_page)
+    elements_page = AsyncElementsPage(async_page)
+
+    await home_page.open()
+    await home_page.click_elements_card()
+
+    assert await elements_page.is_on_elements_page(), "Not on Elements page"
+    assert await elements_page.is_text_box_visible(), "Text Box menu not visible"
+
+
+@pytest.mark.concurrent
+async def test_async_practice_form_fields(async_page):
+    """
+    Test: Practice form accepts input in the main fields
+    """
+    forms_page = AsyncFormsPage(async_page)
+    await forms_page.open()
+
+    await forms_page.fill_first_name("John")
+    await forms_page.fill_last_name("Doe")
+
+    await expect(async_page.locator(forms_page.FIRST_NAME)).to_have_value("John")
+    await expect(async_page.locator(forms_page.LAST_NAME)).to_have_value("Doe")
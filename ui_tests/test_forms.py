@@ -4,45 +4,35 @@ Test Suite: Forms Page Tests
 from ui_tests.pages.forms_page import FormsPage
 
 
-def test_fill_practice_form():
+def test_fill_practice_form(page, data_factory):
     """
     Test: Fill and submit practice form
     """
+    # Create page object
+    forms_page = FormsPage(page)
     
-    def test_robust_automation(page):
-        print("\n🧪 Starting Robust Text Box Test")
-        
-        # Create page object
-        forms_page = FormsPage(page)
-        
-        print("\n🧪 Starting test: Fill Practice Form")
-        
-        # Open form page
-        forms_page.open()
-        
-        # Fill form fields
-        forms_page.fill_first_name("John")
-        print("✅ Filled first name")
-        
-        forms_page.fill_last_name("Doe")
-        print("✅ Filled last name")
-        
-        forms_page.fill_email("john.doe@test.com")
-        print("✅ Filled email")
-        
-        forms_page.select_gender_male()
-        print("✅ Selected gender")
-        
-        forms_page.fill_mobile("1234567890")
-        print("✅ Filled mobile number")
-        
-        # Submit form
-        forms_page.click_submit()
-        print("✅ Clicked submit")
-        
-        # Verify success modal appears
-        assert forms_page.is_success_modal_visible(), "Success modal not visible"
-        print("✅ Success modal appeared")
-        
-        browser.close()
-        print("✅ Test completed successfully!\n")
\ No newline at end of file
+    print("\n🧪 Starting test: Fill Practice Form")
+    
+    # Open form page
+    forms_page.open()
+    
+    # Name, email and mobile set and verified in one round trip
+    person = data_factory.person()
+    result = forms_page.fill_personal_details(
+        person["first_name"], person["last_name"], person["email"], person["mobile"],
+    )
+    assert result.ok, f"Form fields did not keep their values: {result.describe()}"
+    print(f"✅ Filled {len(result.values)} fields")
+    
+    forms_page.select_gender_male()
+    print("✅ Selected gender")
+    
+    # Submit form
+    forms_page.click_submit()
+    print("✅ Clicked submit")
+    
+    # Verify success modal appears
+    assert forms_page.is_success_modal_visible(), "Success modal not visible"
+    print("✅ Success modal appeared")
+    
+    print("✅ Test completed successfully!\n")
@@ -4,56 +4,48 @@ Description: Tests using Page Object Model pattern
 """
 import pytest
 import os
-from playwright.sync_api import expect
 from ui_tests.pages.home_page import HomePage
 
 @pytest.mark.smoke
-def test_verify_homepage_elements(page):
-    from ui_tests.pages.elements_page import ElementsPage
+@pytest.mark.block_resources("no-ads")  # the banner check needs images, which no-media/minimal abort
+def test_verify_homepage_elements(page, ui_base_url):
     """
     Test: Verify DemoQA homepage loads with all elements
     Uses: Page Object Model pattern
     """
-    
-    # Start Playwright
-    def test_robust_automation(page):
-        print("\n🧪 Starting Robust Text Box Test")
-            
-        # Create page object
-        home_page = HomePage(page)
-        
-        # Test Steps
-        print("\n🧪 Starting test: Verify Homepage Elements")
-        
-        # Step 1: Open homepage
-        home_page.open()
-        
-        # Step 2: Verify page title
-        title = home_page.get_title()
-        assert "DEMOQA" in title, f"Expected 'DEMOQA' in title, got '{title}'"
-        print(f"✅ Title verified: {title}")
-        
-        # Step 3: Verify URL
-        url = home_page.get_url()
-        assert url == "https://demoqa.com/", f"Expected 'https://demoqa.com/', got '{url}'"
-        print(f"✅ URL verified: {url}")
         
-        # Step 4: Verify banner is visible
-        assert home_page.is_banner_visible(), "Banner is not visible"
-        print("✅ Banner is visible")
-        
-        # Step 5: Verify Elements card is visible
-        assert home_page.is_elements_card_visible(), "Elements card is not visible"
-        print("✅ Elements card is visible")
-        
-        # Step 6: Verify total cards count
-        cards_count = home_page.get_cards_count()
-        assert cards_count == 6, f"Expected 6 cards, found {cards_count}"
-        print(f"✅ Found {cards_count} category cards")
-        
-        # Cleanup
-        browser.close()
-        print("✅ Test completed successfully!\n")
+    # Create page object
+    home_page = HomePage(page)
+    
+    # Test Steps
+    print("\n🧪 Starting test: Verify Homepage Elements")
+    
+    # Step 1: Open homepage
+    home_page.open()
+    
+    # Step 2: Verify page title
+    title = home_page.get_title()
+    assert "DEMOQA" in title, f"Expected 'DEMOQA' in title, got '{title}'"
+    print(f"✅ Title verified: {title}")
+    
+    # Step 3: Verify URL
+    url = home_page.get_url()
+    assert url.rstrip("/") == ui_base_url.rstrip("/"), f"Expected '{ui_base_url}/', got '{url}'"
+    print(f"✅ URL verified: {url}")
+    
+    # Steps 4-6: Banner, Elements card and card count in one read
+    state = home_page.snapshot()
+    assert state["banner_visible"], "Banner is not visible"
+    print("✅ Banner is visible")
+    
+    assert state["elements_card_visible"], "Elements card is not visible"
+    print("✅ Elements card is visible")
+    
+    cards_count = state["cards_count"]
+    assert cards_count == 6, f"Expected 6 cards, found {cards_count}"
+    print(f"✅ Found {cards_count} category cards")
+    
+    print("✅ Test completed successfully!\n")
 
 @pytest.mark.smoke
 def test_navigate_to_elements_page(page):
@@ -105,38 +97,24 @@ def test_navigate_to_elements_page(page):
 def test_debug_elements_page(page):
     """Debug test to find the correct header selector"""
     
+    from ui_tests.pages.elements_page import ElementsPage
+
     home_page = HomePage(page)
     home_page.open()
     home_page.click_elements_card()
     
-    # Wait a bit for page to load
-    page.wait_for_timeout(2000)
-    
-    # Try different selectors
-    selectors_to_try = [
-        ".main-header",
-        "h1",
-        ".text-center",
-        "h1.text-center",
-        ".playgound-header",
-        "div.main-header",
-        "[class*='header']"
-    ]
+    # Resolve all header candidates at once (one wait, one DOM round trip)
+    elements_page = ElementsPage(page)
+    selector = elements_page.resolve(ElementsPage.MAIN_HEADER)
     
-    print("\n🔍 Testing selectors:")
-    for selector in selectors_to_try:
-        try:
-            element = page.locator(selector).first
-            if element.count() > 0:
-                text = element.text_content(timeout=2000)
-                print(f"✅ {selector} = '{text}'")
-            else:
-                print(f"❌ {selector} - not found")
-        except:
-            print(f"❌ {selector} - error/timeout")
+    print(f"\n🔍 Header candidates: {', '.join(ElementsPage.MAIN_HEADER.candidates)}")
+    text = page.locator(selector).first.text_content()
+    print(f"✅ {selector} = '{text}'")
+    assert text and text.strip(), f"Header found with {selector} but it has no text"
             
             
 @pytest.mark.regression
+@pytest.mark.block_resources("no-ads")
 def test_all_category_cards_visible(page):
     """
     Test: Verify all 6 category cards are visible on homepage
@@ -158,10 +136,10 @@ def test_all_category_cards_visible(page):
         "Book Store Application"
     ]
     
-    # Verify each card
-    for card_name in expected_cards:
-        card = page.locator(f"text={card_name}")
-        expect(card).to_be_visible()
-        print(f"✅ '{card_name}' card is visible")
+    # Verify all cards with one in-page read
+    cards = home_page.cards_visible(expected_cards)
+    missing = [card_name for card_name, is_visible in cards.items() if not is_visible]
+    assert not missing, f"Cards not visible: {missing}"
+    print(f"✅ All {len(cards)} category cards are visible")
 
     
\ No newline at end of file
@@ -1,37 +1,38 @@
 import re
+import pytest
 from playwright.sync_api import expect
 
+from ui_tests.pages.base_page import BasePage
 
-def test_robust_automation(page):
+
+@pytest.mark.block_resources("minimal")
+def test_robust_automation(page, data_factory):
     print("\n🧪 Starting Robust Text Box Test")
 
     # Navigate
     page.goto(
-    "https://demoqa.com/text-box",
+    "/text-box",
     wait_until="domcontentloaded",
     timeout=60000)
     expect(page).to_have_url(re.compile(".*text-box.*"))
     print("✅ Navigated to Text Box page")
 
-    # Fill form fields
-    full_name = "John Doe"
-    email = "john.doe@example.com"
-    current_address = "123 Main Street, New York"
-    permanent_address = "456 Park Avenue, Boston"
-
-    page.fill("#userName", full_name)
-    expect(page.locator("#userName")).to_have_value(full_name)
-    print(f"✅ Filled full name: {full_name}")
-
-    page.fill("#userEmail", email)
-    expect(page.locator("#userEmail")).to_have_value(email)
-    print(f"✅ Filled email: {email}")
-
-    page.fill("#currentAddress", current_address)
-    print("✅ Filled current address")
-
-    page.fill("#permanentAddress", permanent_address)
-    print("✅ Filled permanent address")
+    # Fill form fields (unique per worker, reproducible with --data-seed)
+    person = data_factory.person()
+    full_name = person["full_name"]
+    email = person["email"]
+    current_address = person["current_address"]
+    permanent_address = person["permanent_address"]
+
+    # All fields set and verified in one round trip
+    result = BasePage(page).fill_form({
+        "#userName": full_name,
+        "#userEmail": email,
+        "#currentAddress": current_address,
+        "#permanentAddress": permanent_address,
+    })
+    assert result.ok, f"Form fields did not keep their values: {result.describe()}"
+    print(f"✅ Filled {len(result.values)} fields")
 
     # Submit form
     page.click("#submit")
@@ -0,0 +1,141 @@
+"""
+Adaptive Locator Timeouts
+Remembers how long each page object's locators take to appear and derives
+per-locator timeouts from that history (p99 x factor, clamped to a floor and ceiling)
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from utils.timing import percentile
+
+CACHE_KEY = "learnnow/locator_timings"
+
+# Active model for this process (installed by the locator_timeouts fixture)
+_active = None
+
+
+class AdaptiveTimeouts:
+    """
+    Wait durations per page object + locator, and the timeouts learned from them.
+    A locator needs min_samples successful waits before its learned timeout
+    replaces the caller's default. A wait that runs out of a learned timeout
+    is recorded as lasting at least that long, heavily enough to move the p99,
+    so the timeout grows instead of failing the same way every run.
+    """
+
+    def __init__(self, history: dict = None, factor: float = 3.0, floor_ms: int = 1000,
+                 ceiling_ms: int = 30000, min_samples: int = 5, max_samples: int = 200):
+        """
+        Initialize the model
+        Args:
+            history: Stored samples, key -> list of wait durations in ms
+            factor: Safety factor applied to the p99 wait
+            floor_ms: Shortest timeout ever handed out
+            ceiling_ms: Longest timeout ever handed out
+            min_samples: Samples needed before a key gets a learned timeout
+            max_samples: Samples kept per key (the most recent ones)
+        """
+        self.history = {key: list(samples) for key, samples in (history or {}).items()}
+        self.factor = factor
+        self.floor_ms = floor_ms
+        self.ceiling_ms = ceiling_ms
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self._new = defaultdict(list)
+        self.stats = {"learned": 0, "default": 0, "timeouts": 0}
+
+    @staticmethod
+    def key(page_object: str, selector: str) -> str:
+        return f"{page_object}:{selector}"
+
+    def record(self, key: str, wait_ms: float):
+        """Remember a successful wait"""
+        self._new[key].append(round(wait_ms, 1))
+
+    def record_timeout(self, key: str, timeout_ms: int, learned: bool):
+        """
+        Count a wait that ran out of time
+        Args:
+            key: AdaptiveTimeouts.key(...)
+            timeout_ms: Timeout the wait had
+            learned: Whether that timeout came from this model (only then is it a sample)
+        """
+        self.stats["timeouts"] += 1
+        if not learned:
+            return
+        # The element needed at least timeout_ms: add that lower bound often enough
+        # to land in the top 1%, so the next p99 (and timeout) is at least factor x higher
+        copies = len(self.samples(key)) // 100 + 1
+        self._new[key].extend([float(timeout_ms)] * copies)
+
+    def is_learned(self, key: str) -> bool:
+        return len(self.samples(key)) >= self.min_samples
+
+    def samples(self, key: str) -> list:
+        return (self.history.get(key, []) + self._new.get(key, []))[-self.max_samples:]
+
+    def timeout_for(self, key: str, default_ms: int) -> int:
+        """
+        Timeout to use for a locator
+        Args:
+            key: AdaptiveTimeouts.key(...)
+            default_ms: Timeout used until enough samples exist
+        Returns:
+            int: Timeout in milliseconds
+        """
+        samples = self.samples(key)
+        if len(samples) < self.min_samples:
+            self.stats["default"] += 1
+            return default_ms
+        self.stats["learned"] += 1
+        learned = percentile(samples, 99) * self.factor
+        return int(min(self.ceiling_ms, max(self.floor_ms, learned)))
+
+    def merged(self, stored: dict) -> dict:
+        """History to persist: what is stored now plus what this worker measured"""
+        merged = {key: list(samples) for key, samples in stored.items()}
+        for key, samples in self._new.items():
+            merged[key] = (merged.get(key, []) + samples)[-self.max_samples:]
+        return merged
+
+
+@contextmanager
+def wait(page_object, selector: str, default_ms: int, timeout: int = None):
+    """
+    Pick the timeout for a page object's locator wait and record how long it took
+    Args:
+        page_object: Page object doing the wait (its class name is part of the key)
+        selector: Element selector
+        default_ms: Timeout used until the locator has a learned one
+        timeout: Explicit timeout from the caller, always wins
+    Yields:
+        int: Timeout in milliseconds
+    """
+    model = _active
+    if model is None:
+        yield timeout or default_ms
+        return
+
+    key = model.key(type(page_object).__name__, selector)
+    learned = not timeout and model.is_learned(key)
+    timeout_ms = timeout or model.timeout_for(key, default_ms)
+    start = time.perf_counter()
+    try:
+        yield timeout_ms
+    except Exception as error:
+        if type(error).__name__ == "TimeoutError":
+            model.record_timeout(key, timeout_ms, learned)
+        raise
+    model.record(key, (time.perf_counter() - start) * 1000)
+
+
+def install(model):
+    """Make a model the active one (None turns adaptive timeouts off)"""
+    global _active
+    _active = model
+
+
+def active():
+    """The active model, or None"""
+    return _active
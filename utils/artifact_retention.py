@@ -0,0 +1,211 @@
+"""
+Artifact Retention
+Keeps videos, screenshots and traces under a byte budget and a maximum age.
+Every artifact is indexed back to the test that produced it; cleanup runs on
+a background thread, so tests never wait on disk I/O
+"""
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Eviction order: files no test claims, then passing-test artifacts, failure artifacts last
+UNINDEXED, PASSED, FAILED = 0, 1, 2
+
+
+def _key(path) -> str:
+    return os.path.abspath(path)
+
+
+def load_index(index_path: str) -> dict:
+    """
+    Read the artifact index
+    Returns:
+        dict: Absolute artifact path -> {path, nodeid, kind, failed, recorded} (last entry wins)
+    """
+    entries = {}
+    try:
+        with open(index_path, encoding="utf-8") as index_file:
+            for line in index_file:
+                try:
+                    entry = json.loads(line)
+                    entries[_key(entry["path"])] = entry
+                except (ValueError, KeyError):
+                    continue  # a torn line from an interrupted run
+    except OSError:
+        pass
+    return entries
+
+
+def compact_index(index_path: str):
+    """Rewrite the index without entries whose artifact no longer exists (call when no worker is writing)"""
+    entries = [entry for entry in load_index(index_path).values() if os.path.exists(entry["path"])]
+    path = Path(index_path)
+    if not path.exists():
+        return
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text("".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class ArtifactRetention:
+    """
+    Background worker owning the artifact folders
+
+    - record() indexes an artifact to its test node id (appended to a JSONL index
+      shared by all xdist workers)
+    - discard() deletes an unwanted artifact (e.g. the video of a passing test)
+    - every sweep deletes artifacts older than max_age_days, then evicts the least
+      recently used ones until the folders fit in max_bytes: unindexed files first,
+      then passing-test artifacts, failure artifacts last
+    - files younger than grace_s are never evicted for size (another worker may
+      still be writing them)
+    """
+
+    def __init__(self, directories, index_path: str, max_bytes: int = 500 * 1024 * 1024,
+                 max_age_days: float = 7.0, sweep_interval: float = 30.0, grace_s: float = 120.0):
+        """
+        Initialize the retention worker
+        Args:
+            directories: Artifact folders (videos, screenshots, traces ...)
+            index_path: JSONL file mapping artifacts to node ids
+            max_bytes: Budget for all folders together (0 = no budget)
+            max_age_days: Artifacts older than this are deleted (0 = keep forever)
+            sweep_interval: Seconds between sweeps while idle
+            grace_s: Minimum age before a file can be evicted for size
+        """
+        self.directories = [Path(directory) for directory in directories]
+        self.index_path = Path(index_path)
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_days * 24 * 3600
+        self.sweep_interval = sweep_interval
+        self.grace_s = grace_s
+        self.stats = {"recorded": 0, "discarded": 0, "expired": 0, "evicted": 0, "freed_bytes": 0}
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="artifact-retention", daemon=True)
+
+    def start(self):
+        """Create the folders, start the worker and sweep once"""
+        for directory in self.directories:
+            directory.mkdir(parents=True, exist_ok=True)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread.start()
+        self._queue.put(None)
+        return self
+
+    def record(self, path, nodeid: str, kind: str, failed: bool):
+        """
+        Index an artifact to the test that produced it
+        Args:
+            path: Artifact file (it may still be being written)
+            nodeid: pytest node id
+            kind: video, screenshot, trace ...
+            failed: Whether it belongs to a failed (or retried) test
+        """
+        self._queue.put(("record", {
+            "path": str(path),
+            "nodeid": nodeid,
+            "kind": kind,
+            "failed": failed,
+            "recorded": datetime.now().isoformat(timespec="seconds"),
+        }))
+
+    def discard(self, path):
+        """
+        Schedule an artifact for deletion
+        Args:
+            path: Artifact file
+        """
+        self._queue.put(("discard", Path(path)))
+
+    def stop(self, timeout: float = 10.0):
+        """Flush pending work, sweep a last time and stop the worker"""
+        self._queue.put(StopIteration)
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.sweep_interval)
+            except queue.Empty:
+                item = None
+            if item is StopIteration:
+                self._sweep()
+                return
+            if item is None:
+                self._sweep()
+            elif item[0] == "record":
+                self._append(item[1])
+            elif self._delete(item[1]):
+                self.stats["discarded"] += 1
+
+    def _append(self, entry: dict):
+        try:
+            # One short write per line: O_APPEND keeps parallel workers' lines whole
+            with open(self.index_path, "a", encoding="utf-8") as index_file:
+                index_file.write(json.dumps(entry) + "\n")
+            self.stats["recorded"] += 1
+        except OSError:
+            pass
+
+    def _delete(self, path: Path) -> bool:
+        # The browser may still hold the file for a moment after page.close()
+        for _ in range(5):
+            try:
+                path.unlink()
+                return True
+            except FileNotFoundError:
+                return False  # removed by another xdist worker
+            except PermissionError:
+                time.sleep(0.2)
+            except OSError:
+                return False
+        return False
+
+    def _scan(self):
+        files = []
+        for directory in self.directories:
+            if not directory.exists():
+                continue
+            for path in directory.iterdir():
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if path.is_file() and not path.name.endswith(".tmp"):
+                    files.append((path, stat))
+        return files
+
+    def _sweep(self):
+        if not self.max_bytes and not self.max_age_s:
+            return
+        now = time.time()
+        index = load_index(self.index_path)
+
+        kept = []
+        for path, stat in self._scan():
+            if self.max_age_s and now - stat.st_mtime > self.max_age_s:
+                if self._delete(path):
+                    self.stats["expired"] += 1
+                    self.stats["freed_bytes"] += stat.st_size
+                continue
+            entry = index.get(_key(path))
+            tier = UNINDEXED if entry is None else FAILED if entry.get("failed") else PASSED
+            last_used = max(stat.st_atime, stat.st_mtime)
+            kept.append((tier, last_used, stat.st_size, path))
+
+        total = sum(size for _, _, size, _ in kept)
+        if not self.max_bytes or total <= self.max_bytes:
+            return
+        for _, last_used, size, path in sorted(kept):
+            if total <= self.max_bytes:
+                break
+            if now - last_used < self.grace_s:
+                continue
+            if self._delete(path):
+                self.stats["evicted"] += 1
+                self.stats["freed_bytes"] += size
+            total -= size
@@ -0,0 +1,110 @@
+"""
+Asyncio Execution Engine
+Drives one async Playwright browser from a background event loop so that
+independent coroutine tests can share it and run concurrently
+"""
+import asyncio
+import threading
+
+from playwright.async_api import async_playwright, Page
+
+
+class AsyncEngine:
+    """
+    Owns an event loop thread, an async Playwright instance and one browser.
+    Every test coroutine gets its own browser context; a semaphore caps
+    how many of them are open at once.
+    """
+
+    def __init__(self, browser_name: str, launch_options: dict = None,
+                 context_options: dict = None, concurrency: int = 4):
+        """
+        Initialize the engine (nothing is launched until start())
+        Args:
+            browser_name: chromium, firefox or webkit
+            launch_options: Keyword arguments for browser_type.launch()
+            context_options: Keyword arguments for browser.new_context()
+            concurrency: Max test coroutines running at the same time
+        """
+        self.browser_name = browser_name
+        self.launch_options = launch_options or {}
+        self.context_options = context_options or {}
+        self.concurrency = max(1, concurrency)
+        self.results = {}
+        self.browser = None
+        self._playwright = None
+        self._semaphore = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-engine", daemon=True)
+
+    def start(self):
+        """Start the loop thread and launch the browser"""
+        self._thread.start()
+        self.run(self._launch())
+        return self
+
+    def stop(self):
+        """Close the browser and stop the loop thread"""
+        if self._playwright:
+            self.run(self._shutdown())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(10)
+
+    def run(self, coro):
+        """
+        Run a coroutine on the engine loop and wait for its result
+        Args:
+            coro: Coroutine to execute
+        Returns:
+            Whatever the coroutine returns (exceptions are re-raised)
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def new_page(self) -> Page:
+        """Open a page in a new browser context"""
+        context = await self.browser.new_context(**self.context_options)
+        return await context.new_page()
+
+    async def close_page(self, page: Page):
+        """Close a page together with its browser context"""
+        await page.context.close()
+
+    def run_batch(self, tests: dict) -> dict:
+        """
+        Run independent tests concurrently, each on its own page
+        Args:
+            tests: Mapping of test id -> (coroutine function, kwargs without the page)
+        Returns:
+            dict: Test id -> exception raised by the test, or None if it passed
+        """
+        results = self.run(self._run_batch(tests))
+        self.results.update(results)
+        return results
+
+    async def _run_batch(self, tests: dict) -> dict:
+        test_ids = list(tests)
+        outcomes = await asyncio.gather(
+            *(self._run_one(*tests[test_id]) for test_id in test_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(test_ids, outcomes))
+
+    async def _run_one(self, func, kwargs: dict):
+        async with self._semaphore:
+            page = await self.new_page()
+            try:
+                await func(async_page=page, **kwargs)
+            finally:
+                await self.close_page(page)
+
+    async def _launch(self):
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._playwright = await async_playwright().start()
+        browser_type = getattr(self._playwright, self.browser_name, None)
+        if browser_type is None:
+            raise ValueError(f"Unsupported browser: {self.browser_name}")
+        self.browser = await browser_type.launch(**self.launch_options)
+
+    async def _shutdown(self):
+        await self.browser.close()
+        await self._playwright.stop()
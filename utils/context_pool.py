@@ -0,0 +1,212 @@
+"""
+Browser Context Pool
+Keeps warm browser contexts per worker and resets them between tests
+"""
+import json
+import time
+from dataclasses import dataclass, asdict
+
+from playwright.sync_api import Browser, BrowserContext
+
+# Playwright's own default for actions and navigations
+DEFAULT_TIMEOUT_MS = 30000
+
+# Context calls that cannot be undone: a context that used one is never pooled again
+IRREVERSIBLE_CALLS = ("add_init_script", "expose_binding", "expose_function")
+
+
+@dataclass
+class PoolStats:
+    """
+    Counters describing how the pool was used
+    hits/misses count pooled acquisitions, isolated counts fresh contexts,
+    tainted counts contexts closed because their state could not be reset
+    """
+    hits: int = 0
+    misses: int = 0
+    isolated: int = 0
+    resets: int = 0
+    reset_failures: int = 0
+    tainted: int = 0
+    reset_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+    def merge(self, other: dict):
+        """Add counters reported by another worker"""
+        for name, value in other.items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def summary(self) -> str:
+        acquired = self.hits + self.misses
+        hit_rate = (self.hits / acquired * 100) if acquired else 0.0
+        avg_reset = (self.reset_seconds / self.resets * 1000) if self.resets else 0.0
+        return (
+            f"hits={self.hits} misses={self.misses} isolated={self.isolated} "
+            f"hit_rate={hit_rate:.0f}% resets={self.resets} "
+            f"reset_failures={self.reset_failures} tainted={self.tainted} avg_reset={avg_reset:.1f}ms"
+        )
+
+
+class ContextPool:
+    """
+    Pool of reusable browser contexts for a single worker
+
+    Contexts are grouped by their creation options, so tests asking for
+    different options (video, viewport, ...) never share a context.
+    Between tests every page is closed; cookies, storage, permissions and
+    routes are cleared and extra headers, offline mode, geolocation and
+    default timeouts are put back. Contexts left with storage that cannot be
+    cleared (other origins, IndexedDB) or that got init scripts or exposed
+    bindings are closed instead of pooled.
+    """
+
+    def __init__(self, browser: Browser, max_size: int = 1, reset=None):
+        """
+        Initialize the pool
+        Args:
+            browser: Playwright Browser used to create contexts
+            max_size: Max idle contexts kept per option set (0 disables pooling)
+            reset: Callable(context, options) -> bool putting a context back into
+                its initial state (default: reset_context)
+        """
+        self.browser = browser
+        self.max_size = max_size
+        self.reset = reset or reset_context
+        self.stats = PoolStats()
+        self._idle = {}
+        self._leases = {}
+        self._options = {}
+        self._tainted = set()
+
+    @staticmethod
+    def _key(options: dict) -> str:
+        return json.dumps(options, sort_keys=True, default=str)
+
+    def acquire(self, isolated: bool = False, **options) -> BrowserContext:
+        """
+        Get a clean context for a test
+        Args:
+            isolated: Always create a fresh context that is closed on release
+            **options: Keyword arguments for browser.new_context()
+        Returns:
+            BrowserContext: Warm context from the pool or a new one
+        """
+        if isolated or self.max_size <= 0:
+            self.stats.isolated += 1
+            return self.browser.new_context(**options)
+
+        key = self._key(options)
+        idle = self._idle.get(key)
+        if idle:
+            self.stats.hits += 1
+            context = idle.pop()
+        else:
+            self.stats.misses += 1
+            context = self.browser.new_context(**options)
+            self._options[key] = options
+            self._watch(context)
+
+        self._leases[context] = key
+        return context
+
+    def release(self, context: BrowserContext):
+        """
+        Return a context to the pool (or close it if it cannot be reused)
+        Args:
+            context: Context previously returned by acquire()
+        """
+        key = self._leases.pop(context, None)
+        if key is None:
+            self._close(context)
+            return
+
+        if context in self._tainted:
+            self.stats.tainted += 1
+            self._close(context)
+            return
+
+        start = time.perf_counter()
+        try:
+            clean = self.reset(context, self._options[key])
+        except Exception:
+            self.stats.reset_failures += 1
+            self._close(context)
+            return
+        finally:
+            self.stats.reset_seconds += time.perf_counter() - start
+        if not clean:
+            self.stats.tainted += 1
+            self._close(context)
+            return
+
+        self.stats.resets += 1
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self.max_size:
+            idle.append(context)
+        else:
+            self._close(context)
+
+    def close(self):
+        """Close every idle and leased context"""
+        for idle in self._idle.values():
+            for context in idle:
+                self._close(context)
+        for context in list(self._leases):
+            self._close(context)
+        self._idle.clear()
+        self._leases.clear()
+        self._tainted.clear()
+
+    def taint(self, context: BrowserContext):
+        """Close the context on release instead of pooling it"""
+        if context in self._leases:
+            self._tainted.add(context)
+
+    def _watch(self, context: BrowserContext):
+        """Taint the context once a test makes a call that cannot be undone"""
+        for name in IRREVERSIBLE_CALLS:
+            def tainting(*args, _call=getattr(context, name), **kwargs):
+                self.taint(context)
+                return _call(*args, **kwargs)
+            setattr(context, name, tainting)
+
+    def _close(self, context: BrowserContext):
+        self._tainted.discard(context)
+        try:
+            context.close()
+        except Exception:
+            pass
+
+
+def reset_context(context: BrowserContext, options: dict) -> bool:
+    """
+    Put a context back into the state it was created in
+    Args:
+        context: Context returned to the pool
+        options: Options it was created with
+    Returns:
+        bool: False when storage is left that cannot be cleared (the context must not be reused)
+    """
+    # Storage is per origin, so clear it from each page before closing it
+    for page in context.pages:
+        try:
+            page.evaluate(
+                "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+            )
+        except Exception:
+            pass
+        page.close()
+    context.clear_cookies()
+    context.clear_permissions()
+    context.unroute_all(behavior="ignoreErrors")
+    context.set_extra_http_headers(options.get("extra_http_headers") or {})
+    context.set_offline(options.get("offline", False))
+    context.set_geolocation(options.get("geolocation"))
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    context.set_default_navigation_timeout(DEFAULT_TIMEOUT_MS)
+
+    # Origins that had no open page (and IndexedDB anywhere) are only visible here
+    state = context.storage_state(indexed_db=True)
+    return not state["origins"]
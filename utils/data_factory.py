@@ -0,0 +1,139 @@
+"""
+Test Data Factory
+Unique usernames, emails, phone numbers, passwords and form payloads, generated
+lazily in batches from a per-worker namespace and seed, so xdist workers never
+collide and never have to coordinate per value
+"""
+import itertools
+import os
+import random
+import re
+import secrets
+import string
+import threading
+
+FIRST_NAMES = ("John", "Jane", "Alex", "Maria", "Sam", "Priya", "Liam", "Chen", "Olga", "Omar")
+LAST_NAMES = ("Doe", "Smith", "Garcia", "Kumar", "Novak", "Okafor", "Tanaka", "Silva", "Brown", "Khan")
+STREETS = ("Main Street", "Park Avenue", "Oak Lane", "Lake Road", "Hill Drive", "Station Road")
+CITIES = ("New York", "Boston", "Chicago", "Austin", "Denver", "Seattle")
+
+# Phone numbers: prefix digit, two worker digits, seven counter digits
+_PHONE_COUNTER_DIGITS = 7
+
+
+def new_run_id() -> str:
+    """Identifier shared by every worker of one run (LEARNNOW_RUN_ID to pin it)"""
+    return os.getenv("LEARNNOW_RUN_ID") or secrets.token_hex(3)
+
+
+def worker_index(worker: str) -> int:
+    """gw0 -> 1, gw1 -> 2, ...; 0 for a run without xdist"""
+    match = re.fullmatch(r"gw(\d+)", worker or "")
+    return int(match.group(1)) + 1 if match else 0
+
+
+class DataFactory:
+    """
+    Per-worker source of collision-free test data
+
+    Every value embeds the run id and the worker index (the namespace) plus a
+    per-kind counter, so values are unique across workers and runs without any
+    shared state. The random parts (names, passwords, addresses) come from a
+    generator seeded with (seed, worker, kind), so a run can be reproduced with --data-seed.
+    Values are produced `batch_size` at a time, only when first asked for.
+    """
+
+    def __init__(self, run_id: str, worker: str = "main", seed: int = None, batch_size: int = 50):
+        """
+        Initialize the factory
+        Args:
+            run_id: Identifier of the run, the same for all workers
+            worker: xdist worker id (gw0, gw1 ...) or main
+            seed: Seed for the random parts (default: derived from run_id)
+            batch_size: Values generated at a time per kind
+        """
+        self.run_id = run_id
+        self.worker = worker
+        self.index = worker_index(worker)
+        self.namespace = f"{run_id}w{self.index}"
+        self.seed = seed if seed is not None else int(run_id, 16) if _is_hex(run_id) else 0
+        self.batch_size = batch_size
+        self._streams = {}
+        self._lock = threading.RLock()  # person() draws phone numbers while holding it
+
+    # ---------- values ----------
+
+    def username(self, prefix: str = "testuser") -> str:
+        return f"{prefix}_{self._next('username')}"
+
+    def email(self, domain: str = "test.com") -> str:
+        return f"user_{self._next('email')}@{domain}"
+
+    def phone(self) -> str:
+        """10-digit mobile number, unique per worker (DemoQA's practice form wants 10 digits)"""
+        return self._next("phone")
+
+    def password(self) -> str:
+        """Password meeting DemoQA's rules (upper, lower, digit, special, 8+ characters)"""
+        return self._next("password")
+
+    def person(self) -> dict:
+        """Form payload: first/last name, unique email and mobile, two addresses"""
+        return self._next("person")
+
+    def credentials(self) -> dict:
+        """Account API payload with a unique username and a valid password"""
+        return {"userName": self.username(), "password": self.password()}
+
+    # ---------- generation ----------
+
+    def _next(self, kind: str):
+        with self._lock:
+            stream = self._streams.get(kind)
+            if stream is None:
+                stream = self._streams[kind] = self._batches(kind)
+            return next(stream)
+
+    def _batches(self, kind: str):
+        make = getattr(self, f"_make_{kind}")
+        # One generator per kind: drawing passwords never shifts the names that follow
+        rng = random.Random(f"{self.seed}:{self.index}:{kind}")
+        counter = itertools.count()
+        while True:
+            batch = [make(next(counter), rng) for _ in range(self.batch_size)]
+            yield from batch
+
+    def _make_username(self, number: int, rng) -> str:
+        return f"{self.namespace}_{number:05d}"
+
+    def _make_email(self, number: int, rng) -> str:
+        return f"{self.namespace}_{number:05d}"
+
+    def _make_phone(self, number: int, rng) -> str:
+        if number >= 10 ** _PHONE_COUNTER_DIGITS:
+            raise RuntimeError("Phone numbers exhausted for this worker")
+        return f"9{self.index % 100:02d}{number:0{_PHONE_COUNTER_DIGITS}d}"
+
+    def _make_password(self, number: int, rng) -> str:
+        body = "".join(rng.choices(string.ascii_letters + string.digits, k=8))
+        return f"Pw@{body}{rng.choice(string.ascii_uppercase)}{rng.randint(0, 9)}"
+
+    def _make_person(self, number: int, rng) -> dict:
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        return {
+            "first_name": first,
+            "last_name": last,
+            "full_name": f"{first} {last}",
+            "email": f"{first.lower()}.{last.lower()}.{self.namespace}_{number:05d}@test.com",
+            "mobile": self.phone(),
+            "current_address": _address(rng),
+            "permanent_address": _address(rng),
+        }
+
+
+def _address(rng) -> str:
+    return f"{rng.randint(1, 999)} {rng.choice(STREETS)}, {rng.choice(CITIES)}"
+
+
+def _is_hex(value: str) -> bool:
+    return bool(re.fullmatch(r"[0-9a-f]+", value or ""))
@@ -0,0 +1,147 @@
+"""
+Batched DOM Reads
+Answers many locator queries (visibility, text, count, attribute) with one
+in-page evaluation instead of one driver round trip per query
+"""
+from dataclasses import dataclass
+
+from playwright.sync_api import Error
+
+KINDS = ("visible", "text", "count", "attribute")
+
+# queries: {name: {candidates, kind, attribute, has_text}} -> {name: {css, value}}
+# A query that has no CSS candidate is returned with css=false and answered by Playwright.
+_READ = """queries => {
+  const normalize = text => (text || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+  const isVisible = el => {
+    const style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden';
+  };
+  const results = {};
+  for (const [name, query] of Object.entries(queries)) {
+    let elements = null;
+    for (const selector of query.candidates) {
+      let found;
+      try {
+        found = Array.from(document.querySelectorAll(selector));
+      } catch (error) {
+        continue;
+      }
+      if (query.has_text !== null) {
+        const wanted = normalize(query.has_text);
+        found = found.filter(el => normalize(el.textContent).includes(wanted));
+      }
+      elements = found;
+      if (found.length) break;
+    }
+    if (elements === null) {
+      results[name] = {css: false, value: null};
+      continue;
+    }
+    const first = elements[0];
+    let value;
+    if (query.kind === 'visible') value = elements.some(isVisible);
+    else if (query.kind === 'count') value = elements.length;
+    else if (query.kind === 'text') value = first ? first.textContent : null;
+    else value = first ? first.getAttribute(query.attribute) : null;
+    results[name] = {css: true, value};
+  }
+  return results;
+}"""
+
+# Polls _READ in the page until every required query has a truthy value
+_READ_WHEN = f"""args => {{
+  const read = {_READ};
+  const results = read(args.queries);
+  return args.require.every(name => !results[name].css || results[name].value) ? results : false;
+}}"""
+
+
+@dataclass(frozen=True)
+class Query:
+    """
+    One thing to read from the page
+    kind: visible (bool), text (str | None), count (int) or attribute (str | None)
+    has_text: Keep only elements whose text contains this (case-insensitive, like :has-text())
+    """
+    selector: str
+    kind: str = "visible"
+    attribute: str = None
+    has_text: str = None
+
+    def __post_init__(self):
+        if self.kind not in KINDS:
+            raise ValueError(f"Unknown query kind: {self.kind}")
+        if self.kind == "attribute" and not self.attribute:
+            raise ValueError("Attribute queries need an attribute name")
+
+    def payload(self) -> dict:
+        return {
+            "candidates": list(getattr(self.selector, "candidates", [self.selector])),
+            "kind": self.kind,
+            "attribute": self.attribute,
+            "has_text": self.has_text,
+        }
+
+
+def visible(selector: str, has_text: str = None) -> Query:
+    return Query(selector, "visible", has_text=has_text)
+
+
+def text(selector: str, has_text: str = None) -> Query:
+    return Query(selector, "text", has_text=has_text)
+
+
+def count(selector: str, has_text: str = None) -> Query:
+    return Query(selector, "count", has_text=has_text)
+
+
+def attribute(selector: str, name: str, has_text: str = None) -> Query:
+    return Query(selector, "attribute", attribute=name, has_text=has_text)
+
+
+def read(page, queries: dict, require: tuple = (), timeout_ms: int = 0) -> dict:
+    """
+    Read many queries at once
+    Args:
+        page: Playwright Page object
+        queries: Result name -> Query
+        require: Names whose value must be truthy; the read is polled in the page until
+                 they are (or timeout_ms passes, then the current state is returned)
+        timeout_ms: Polling limit for `require`
+    Returns:
+        dict: Result name -> value (bool, str, int or None depending on the query kind)
+    """
+    payload = {name: query.payload() for name, query in queries.items()}
+    raw = None
+    if require:
+        try:
+            handle = page.wait_for_function(
+                _READ_WHEN, arg={"queries": payload, "require": list(require)}, timeout=timeout_ms
+            )
+            raw = handle.json_value()
+        except Error:
+            raw = None
+    if raw is None:
+        raw = page.evaluate(_READ, payload)
+
+    return {
+        name: raw[name]["value"] if raw[name]["css"] else _read_with_playwright(page, query)
+        for name, query in queries.items()
+    }
+
+
+def _read_with_playwright(page, query: Query):
+    # text=, :has-text(), xpath ... cannot be queried in the page itself
+    locator = page.locator(str(query.selector))
+    if query.has_text is not None:
+        locator = locator.filter(has_text=query.has_text)
+    if query.kind == "count":
+        return locator.count()
+    if not locator.count():
+        return False if query.kind == "visible" else None
+    if query.kind == "visible":
+        return locator.first.is_visible()
+    if query.kind == "text":
+        return locator.first.text_content()
+    return locator.first.get_attribute(query.attribute)
@@ -0,0 +1,139 @@
+"""
+Duration-Aware Scheduling
+Records how long every test takes and, on the next xdist run, spreads tests
+across workers longest-first (LPT) so slow tests do not pile up on one worker
+"""
+import heapq
+import statistics
+from collections import defaultdict
+
+import pytest
+
+CACHE_KEY = "learnnow/durations"
+DEFAULT_DURATION = 1.0  # seconds, used when nothing is known yet
+
+
+def lpt_schedule(test_ids: list, durations: dict, workers: list):
+    """
+    Longest-processing-time-first bin packing
+    Args:
+        test_ids: Tests to distribute
+        durations: Known durations in seconds per test id
+        workers: Worker keys to distribute to
+    Returns:
+        tuple: (worker -> list of test ids, worker -> predicted seconds)
+    """
+    known = [durations[test_id] for test_id in test_ids if test_id in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+
+    plan = {worker: [] for worker in workers}
+    loads = {worker: 0.0 for worker in workers}
+    heap = [(0.0, order, worker) for order, worker in enumerate(workers)]
+
+    ordered = sorted(test_ids, key=lambda test_id: durations.get(test_id, fallback), reverse=True)
+    for test_id in ordered:
+        load, order, worker = heapq.heappop(heap)
+        load += durations.get(test_id, fallback)
+        plan[worker].append(test_id)
+        loads[worker] = load
+        heapq.heappush(heap, (load, order, worker))
+
+    return plan, loads
+
+
+def _load_scheduling():
+    # Imported lazily so the module works without pytest-xdist
+    from xdist.scheduler import LoadScheduling
+
+    class DurationScheduling(LoadScheduling):
+        """
+        Sends every worker its whole LPT share up front (longest tests first),
+        then shuts the workers down once they drain their queue
+        """
+
+        def __init__(self, config, log, durations: dict):
+            super().__init__(config, log)
+            self.durations = durations
+            self.predicted = {}
+
+        def schedule(self):
+            assert self.collection_is_completed
+
+            # Initial distribution already happened (e.g. a replaced node)
+            if self.collection is not None:
+                for node in self.nodes:
+                    self.check_schedule(node)
+                return
+
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+
+            self.collection = list(self.node2collection.values())[0]
+            positions = {test_id: index for index, test_id in enumerate(self.collection)}
+            plan, loads = lpt_schedule(self.collection, self.durations, self.nodes)
+
+            for node, test_ids in plan.items():
+                self.predicted[node.gateway.id] = loads[node]
+                indices = [positions[test_id] for test_id in test_ids]
+                if indices:
+                    self.node2pending[node].extend(indices)
+                    node.send_runtest_some(indices)
+
+            self.pending = []
+            for node in self.nodes:
+                node.shutdown()
+
+    return DurationScheduling
+
+
+class DurationSchedulerPlugin:
+    """
+    Controller-side plugin: records per-test wall time into the pytest cache
+    and provides the LPT scheduler when --dist-by-duration is given
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.durations = {}
+        self.measured = defaultdict(float)
+        self.worker_busy = defaultdict(float)
+        self.scheduler = None
+
+    def pytest_sessionstart(self, session):
+        # config.cache does not exist yet when the plugin is registered
+        self.durations = self.config.cache.get(CACHE_KEY, {})
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if not config.getoption("dist_by_duration"):
+            return None
+        self.scheduler = _load_scheduling()(config, log, self.durations)
+        return self.scheduler
+
+    def pytest_runtest_logreport(self, report):
+        self.measured[report.nodeid] += report.duration
+        node = getattr(report, "node", None)
+        if node is not None:
+            self.worker_busy[node.gateway.id] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        if self.measured:
+            durations = dict(self.durations)
+            durations.update({nodeid: round(seconds, 3) for nodeid, seconds in self.measured.items()})
+            self.config.cache.set(CACHE_KEY, durations)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.scheduler or not self.scheduler.predicted:
+            return
+        predicted = self.scheduler.predicted
+        terminalreporter.write_sep("-", "duration-aware scheduling")
+        for worker in sorted(predicted):
+            terminalreporter.write_line(
+                f"{worker}: predicted {predicted[worker]:.1f}s | "
+                f"actual {self.worker_busy.get(worker, 0.0):.1f}s"
+            )
+        actual = max(self.worker_busy.values(), default=0.0)
+        terminalreporter.write_line(
+            f"makespan: predicted {max(predicted.values()):.1f}s | actual {actual:.1f}s"
+        )
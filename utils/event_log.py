@@ -0,0 +1,186 @@
+"""
+Structured Event Log
+Leveled JSONL events kept in a per-test ring buffer and written only when a
+test fails (or on request), instead of printing every action to stdout
+"""
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+
+import pytest
+
+DEBUG, INFO, WARNING, ERROR, OFF = 10, 20, 30, 40, 100
+
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR, "off": OFF}
+_NAMES = {value: name.upper() for name, value in LEVELS.items()}
+
+
+class EventLog:
+    """
+    Leveled event recorder
+
+    - events below `level` are dropped before anything is built
+    - kept events go into a ring buffer (the current test's last `buffer_size` events)
+    - flush() appends the buffer to a JSONL file in one write
+    - events at or above `echo_level` are also printed right away
+    """
+
+    def __init__(self, path: str = None, level: int = INFO, buffer_size: int = 200,
+                 echo_level: int = OFF, worker: str = "main"):
+        """
+        Initialize the log
+        Args:
+            path: JSONL file flushed events are appended to (None = keep in memory only)
+            level: Lowest level that is recorded
+            buffer_size: Events kept per test
+            echo_level: Lowest level that is also printed
+            worker: xdist worker id written with every event
+        """
+        self.path = Path(path) if path else None
+        self.level = level
+        self.echo_level = echo_level
+        self.worker = worker
+        self.test = None
+        self._buffer = deque(maxlen=buffer_size)
+
+    def enabled(self, level: int) -> bool:
+        return level >= self.level
+
+    def log(self, level: int, event: str, **fields):
+        if level < self.level:
+            return
+        record = {
+            "ts": round(time.time(), 3),
+            "level": _NAMES[level],
+            "event": event,
+            "test": self.test,
+            "worker": self.worker,
+            **fields,
+        }
+        self._buffer.append(record)
+        if level >= self.echo_level:
+            print(format_record(record))
+
+    def start_test(self, nodeid: str):
+        """Start a fresh buffer for a test"""
+        self._buffer.clear()
+        self.test = nodeid
+
+    def end_test(self):
+        self.test = None
+
+    def records(self) -> list:
+        return list(self._buffer)
+
+    def flush(self, reason: str = "requested") -> int:
+        """
+        Append the buffered events to the JSONL file and empty the buffer
+        Args:
+            reason: Why the buffer is written (failed, requested, always)
+        Returns:
+            int: Number of events written
+        """
+        if not self._buffer or self.path is None:
+            return 0
+        lines = "".join(json.dumps({**record, "flush": reason}, default=str) + "\n"
+                        for record in self._buffer)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as log_file:
+            log_file.write(lines)
+        count = len(self._buffer)
+        self._buffer.clear()
+        return count
+
+
+def format_record(record: dict) -> str:
+    """One readable line for an event"""
+    fields = " ".join(f"{name}={value}" for name, value in record.items()
+                      if name not in ("ts", "level", "event", "test", "worker"))
+    return f"[{record['level']}] {record['event']} {fields}".rstrip()
+
+
+# Active log for this process: disabled until the plugin installs a real one
+_active = EventLog(level=OFF)
+
+
+def install(log: EventLog):
+    global _active
+    _active = log
+
+
+def active() -> EventLog:
+    return _active
+
+
+def debug(event: str, **fields):
+    if _active.level <= DEBUG:
+        _active.log(DEBUG, event, **fields)
+
+
+def info(event: str, **fields):
+    if _active.level <= INFO:
+        _active.log(INFO, event, **fields)
+
+
+def warning(event: str, **fields):
+    if _active.level <= WARNING:
+        _active.log(WARNING, event, **fields)
+
+
+def error(event: str, **fields):
+    if _active.level <= ERROR:
+        _active.log(ERROR, event, **fields)
+
+
+def flush(reason: str = "requested") -> int:
+    """Write the current test's events now (e.g. from a test while debugging)"""
+    return _active.flush(reason)
+
+
+class EventLogPlugin:
+    """
+    Gives every test its own buffer, attaches the buffered events to failure
+    reports and flushes them to JSONL when the test failed (or always)
+    """
+
+    def __init__(self, log: EventLog, flush_on: str = "failed"):
+        self.log = log
+        self.flush_on = flush_on
+        self._failed = False
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.log.start_test(item.nodeid)
+        self._failed = False
+        info("test_start", name=item.name)
+        try:
+            yield
+        finally:
+            if self._failed:
+                self.log.flush("failed")
+            elif self.flush_on == "always":
+                self.log.flush("always")
+            self.log.end_test()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.failed:
+            self._failed = True
+            records = self.log.records()
+            if records:
+                report.sections.append(
+                    (f"event log ({report.when})", "\n".join(format_record(record) for record in records))
+                )
+
+    def pytest_unconfigure(self, config):
+        install(EventLog(level=OFF))
+
+
+def events_path(reports_dir: str, worker: str = None) -> str:
+    """JSONL file for this process (one per xdist worker)"""
+    suffix = f"-{worker}" if worker else ""
+    return os.path.join(reports_dir, f"events{suffix}.jsonl")
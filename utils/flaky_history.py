@@ -0,0 +1,168 @@
+"""
+Flaky Test History
+Keeps every test's recent outcomes per browser, scores how flaky it is, and
+gives only the flaky ones targeted immediate reruns (pytest-rerunfailures'
+flaky marker); everything else fails on the first attempt
+"""
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+CACHE_KEY = "learnnow/flaky_history"
+
+# One letter per run: passed first time, passed after a rerun, failed
+PASSED, RERUN_PASSED, FAILED = "P", "R", "F"
+
+
+def flakiness(outcomes: str) -> float:
+    """
+    Score a test's recent outcomes between 0 (stable) and 1 (coin flip)
+    Counts passes that needed a rerun plus every flip between passing and
+    failing, per run. Always-failing and always-passing tests both score 0.
+    Args:
+        outcomes: Oldest-first string of PASSED / RERUN_PASSED / FAILED
+    Returns:
+        float: Flakiness score
+    """
+    if not outcomes:
+        return 0.0
+    reruns = outcomes.count(RERUN_PASSED)
+    passed = [outcome != FAILED for outcome in outcomes]
+    flips = sum(1 for before, after in zip(passed, passed[1:]) if before != after)
+    return min((reruns + flips) / len(outcomes), 1.0)
+
+
+class FlakyHistory:
+    """
+    browser -> nodeid -> recent outcomes (a string, newest last, at most `window` long)
+    """
+
+    def __init__(self, history: dict = None, window: int = 20):
+        self.history = {browser: dict(tests) for browser, tests in (history or {}).items()}
+        self.window = window
+
+    def outcomes(self, browser: str, nodeid: str) -> str:
+        return self.history.get(browser, {}).get(nodeid, "")
+
+    def score(self, browser: str, nodeid: str, min_runs: int = 3) -> float:
+        outcomes = self.outcomes(browser, nodeid)
+        return flakiness(outcomes) if len(outcomes) >= min_runs else 0.0
+
+    def record(self, browser: str, nodeid: str, outcome: str):
+        tests = self.history.setdefault(browser, {})
+        tests[nodeid] = (tests.get(nodeid, "") + outcome)[-self.window:]
+
+    def flaky(self, browser: str, threshold: float, min_runs: int = 3) -> dict:
+        """nodeid -> score for every test at or above the threshold"""
+        return {
+            nodeid: round(self.score(browser, nodeid, min_runs), 3)
+            for nodeid in self.history.get(browser, {})
+            if self.score(browser, nodeid, min_runs) >= threshold
+        }
+
+
+class FlakyHistoryPlugin:
+    """
+    - every process: marks tests whose score reaches the threshold with
+      @pytest.mark.flaky(reruns=N, reruns_delay=0), so they rerun right away on
+      the same worker (and its warm context pool); other tests get no reruns
+    - controller: records each test's final outcome into the pytest cache and
+      writes the quarantine list (tests at or above the threshold)
+    """
+
+    def __init__(self, config, browser: str, threshold: float = 0.2, reruns: int = 2,
+                 window: int = 20, min_runs: int = 3, quarantine_path: str = None):
+        """
+        Initialize the plugin
+        Args:
+            config: pytest config (its cache holds the history)
+            browser: Browser the history is kept for
+            threshold: Score from which a test is rerun and quarantined
+            reruns: Immediate reruns for flaky tests (0 = record only)
+            window: Outcomes kept per test
+            min_runs: Outcomes needed before a test is scored
+            quarantine_path: JSON file for the quarantine list (None = do not write)
+        """
+        self.config = config
+        self.browser = browser
+        self.threshold = threshold
+        self.reruns = reruns
+        self.min_runs = min_runs
+        self.quarantine_path = Path(quarantine_path) if quarantine_path else None
+        self.history = FlakyHistory(window=window)
+        self._results = {}
+
+    def pytest_sessionstart(self, session):
+        # config.cache does not exist yet when the plugin is registered
+        self.history = FlakyHistory(self.config.cache.get(CACHE_KEY, {}), self.history.window)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not self.reruns or not config.pluginmanager.hasplugin("rerunfailures"):
+            return
+        for item in items:
+            score = self.history.score(self.browser, item.nodeid, self.min_runs)
+            if score >= self.threshold and not item.get_closest_marker("flaky"):
+                item.add_marker(pytest.mark.flaky(reruns=self.reruns, reruns_delay=0))
+
+    def pytest_runtest_logreport(self, report):
+        if hasattr(self.config, "workerinput"):
+            return
+        if report.outcome == "rerun":
+            self._results.setdefault(report.nodeid, set()).add("rerun")
+        elif report.outcome == "skipped" or hasattr(report, "wasxfail"):
+            # Skips and expected failures say nothing about flakiness
+            self._results.setdefault(report.nodeid, set()).add("ignore")
+        elif report.failed:
+            self._results.setdefault(report.nodeid, set()).add("failed")
+        elif report.when == "call":
+            self._results.setdefault(report.nodeid, set()).add("passed")
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or not self._results:
+            return
+        for nodeid, seen in self._results.items():
+            if "ignore" in seen:
+                continue
+            if "failed" in seen:
+                self.history.record(self.browser, nodeid, FAILED)
+            elif "passed" in seen:
+                self.history.record(self.browser, nodeid, RERUN_PASSED if "rerun" in seen else PASSED)
+        self.config.cache.set(CACHE_KEY, self.history.history)
+        self.write_quarantine()
+
+    def quarantine(self) -> list:
+        """Tests at or above the threshold, flakiest first"""
+        flaky = self.history.flaky(self.browser, self.threshold, self.min_runs)
+        return [
+            {"nodeid": nodeid, "score": score, "history": self.history.outcomes(self.browser, nodeid)}
+            for nodeid, score in sorted(flaky.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+    def write_quarantine(self):
+        if self.quarantine_path is None:
+            return
+        self.quarantine_path.parent.mkdir(parents=True, exist_ok=True)
+        self.quarantine_path.write_text(json.dumps({
+            "browser": self.browser,
+            "threshold": self.threshold,
+            "updated": datetime.now().isoformat(timespec="seconds"),
+            "tests": self.quarantine(),
+        }, indent=2), encoding="utf-8")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if hasattr(self.config, "workerinput"):
+            return
+        quarantined = self.quarantine()
+        rerun = [nodeid for nodeid, seen in self._results.items() if "rerun" in seen]
+        if not quarantined and not rerun:
+            return
+        terminalreporter.write_sep("-", f"flaky tests ({self.browser}, threshold {self.threshold:g})")
+        for entry in quarantined:
+            terminalreporter.write_line(f"{entry['score']:.2f} {entry['history']:>20} {entry['nodeid']}")
+        if rerun:
+            terminalreporter.write_line(f"rerun this session: {len(rerun)}")
+        if self.quarantine_path:
+            terminalreporter.write_line(f"quarantine list: {self.quarantine_path}")
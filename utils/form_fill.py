@@ -0,0 +1,126 @@
+"""
+Bulk Form Fill
+Sets many form fields and reads their values back in one in-page evaluation,
+firing the input/change events React-controlled inputs listen for
+"""
+from dataclasses import dataclass, field
+
+from playwright.sync_api import Error
+
+# fields: [{candidates, value}] -> [{css, found, value}]
+# The value goes through the prototype's native setter: React tracks the last value it
+# set itself and ignores an input event unless the DOM value changed underneath it.
+_FILL = """fields => fields.map(({candidates, value}) => {
+  let el = null;
+  let css = false;
+  for (const selector of candidates) {
+    try {
+      el = document.querySelector(selector);
+      css = true;
+    } catch (error) {
+      continue;
+    }
+    if (el) break;
+  }
+  if (!css) return {css: false, found: false, value: null};
+  if (!el) return {css: true, found: false, value: null};
+
+  const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+    : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+    : HTMLInputElement.prototype;
+  const setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+  el.focus();
+  setter.call(el, value);
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+  el.blur();
+  return {css: true, found: true, value: el.value};
+})"""
+
+# Polled until every CSS field exists and is actionable (visible, enabled, editable),
+# the checks page.fill() used to wait for. Non-CSS fields are waited for by Playwright.
+_READY = """fields => fields.every(({candidates}) => {
+  let css = false;
+  for (const selector of candidates) {
+    let el;
+    try {
+      el = document.querySelector(selector);
+      css = true;
+    } catch (error) {
+      continue;
+    }
+    if (el) return el.getClientRects().length > 0 && !el.disabled && !el.readOnly;
+  }
+  return !css;
+})"""
+
+
+@dataclass
+class FormFillResult:
+    """
+    Outcome of fill_form()
+    values: Selector -> value read back after filling
+    mismatches: Selector -> {"expected", "actual"} for fields that did not keep their value
+    missing: Selectors that matched no element
+    """
+    values: dict = field(default_factory=dict)
+    mismatches: dict = field(default_factory=dict)
+    missing: list = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches and not self.missing
+
+    def describe(self) -> str:
+        """Readable summary for assertion messages"""
+        problems = [f"{selector}: not found" for selector in self.missing]
+        problems += [f"{selector}: expected {entry['expected']!r}, got {entry['actual']!r}"
+                     for selector, entry in self.mismatches.items()]
+        return "; ".join(problems) or "all fields filled"
+
+
+def fill_form(page, mapping: dict, timeout_ms: int = 0) -> FormFillResult:
+    """
+    Fill many fields at once and verify them
+    Args:
+        page: Playwright Page object
+        mapping: Selector (or Fallback chain) -> value
+        timeout_ms: How long to wait for every field to be rendered and editable
+                    (fields still not there are reported as missing)
+    Returns:
+        FormFillResult: Values read back, mismatches and missing fields
+    """
+    fields = [
+        {"candidates": list(getattr(selector, "candidates", [selector])), "value": str(value)}
+        for selector, value in mapping.items()
+    ]
+    if timeout_ms:
+        try:
+            page.wait_for_function(_READY, arg=fields, timeout=timeout_ms)
+        except Error:
+            pass  # fill what is there; the rest shows up in result.missing
+    outcomes = page.evaluate(_FILL, fields)
+
+    result = FormFillResult()
+    for (selector, value), outcome in zip(mapping.items(), outcomes):
+        if not outcome["css"]:
+            # text=, xpath ... are not CSS: fill this one through Playwright
+            locator = page.locator(str(selector)).first
+            if timeout_ms:
+                try:
+                    locator.wait_for(state="visible", timeout=timeout_ms)
+                except Error:
+                    pass
+            if not locator.count():
+                result.missing.append(str(selector))
+                continue
+            locator.fill(str(value))
+            outcome["value"] = locator.input_value()
+        elif not outcome["found"]:
+            result.missing.append(str(selector))
+            continue
+
+        result.values[str(selector)] = outcome["value"]
+        if outcome["value"] != str(value):
+            result.mismatches[str(selector)] = {"expected": str(value), "actual": outcome["value"]}
+    return result
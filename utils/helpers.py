@@ -1,7 +1,18 @@
 # I use Python mainly for test logic, utilities, and validations.
+import random
+import re
+from datetime import datetime
+from urllib.parse import urlsplit
+
 
 def generate_random_email():
     return f"user_{random.randint(1000, 9999)}@test.com"
 
 def get_current_timestamp():
     return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def url_pattern(url: str) -> str:
+    """Path of a URL with numbers and long ids collapsed, e.g. /books/{id}"""
+    path = urlsplit(url).path or "/"
+    return re.sub(r"/(\d+|[0-9a-f-]{16,})(?=/|$)", "/{id}", path)
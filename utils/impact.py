@@ -0,0 +1,476 @@
+"""
+Test Impact Analysis
+Maps every test to the page-object classes, methods and locator constants it
+touches (static AST analysis plus an optional runtime trace) and, given a git
+diff, keeps only the tests a change can affect
+"""
+import ast
+import functools
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+CACHE_KEY = "learnnow/impact_map"
+
+PAGE_DIRS = ("ui_tests/pages/",)
+
+# Changes here only affect the tests below the given folder
+SCOPED_DIRS = {"api_tests/clients/": "api_tests/"}
+
+# Changes here never affect a test run: these folders, Markdown anywhere and
+# .txt notes at the top level (data files next to code may be test inputs)
+IGNORED_DIRS = ("benchmarks/", "loadgen/", ".github/")
+DOC_SUFFIXES = (".md",)
+TOP_LEVEL_DOC_SUFFIXES = (".txt",)
+RUN_ALL_FILES = ("requirements.txt", "pytest.ini", "conftest.py")
+
+
+# ---------- source structure ----------
+
+def symbol_ranges(source: str) -> list:
+    """
+    Line ranges of the symbols a change can be attributed to
+    Returns:
+        list: (qualname, first line, last line) for classes, class attributes,
+              methods and module-level functions (innermost ranges last)
+    """
+    ranges = []
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            ranges.append((node.name, _first_line(node), node.end_lineno))
+        elif isinstance(node, ast.ClassDef):
+            ranges.append((node.name, _first_line(node), node.end_lineno))
+            for member in node.body:
+                for name in _member_names(member):
+                    ranges.append((f"{node.name}.{name}", _first_line(member), member.end_lineno))
+    return ranges
+
+
+def symbols_for_lines(source: str, lines: set) -> set:
+    """
+    Innermost symbols covering the given lines; "*" for lines outside any
+    symbol (imports, module constants ...) and class-level lines that are no
+    attribute or method (docstrings, decorators ...) map to the class itself
+    """
+    ranges = symbol_ranges(source)
+    found = set()
+    for line in lines:
+        covering = [name for name, first, last in ranges if first <= line <= last]
+        found.add(max(covering, key=lambda name: name.count(".")) if covering else "*")
+    return found
+
+
+def _first_line(node) -> int:
+    decorators = getattr(node, "decorator_list", [])
+    return min([node.lineno] + [decorator.lineno for decorator in decorators])
+
+
+def _member_names(member) -> list:
+    if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return [member.name]
+    if isinstance(member, ast.Assign):
+        return [target.id for target in member.targets if isinstance(target, ast.Name)]
+    if isinstance(member, ast.AnnAssign) and isinstance(member.target, ast.Name):
+        return [member.target.id]
+    return []
+
+
+class PageObjectIndex:
+    """
+    Every page-object class: its file, bases, members, and for each method the
+    members it uses (self.X / ClassName.X), so a test touching a method also
+    depends on the locators and helpers behind it
+    """
+
+    def __init__(self, root: Path, page_dirs: tuple = PAGE_DIRS):
+        self.root = Path(root)
+        self.classes = {}  # name -> {"file", "bases", "members", "uses"}
+        for page_dir in page_dirs:
+            for path in sorted((self.root / page_dir).rglob("*.py")):
+                self._index(path)
+
+    def _index(self, path: Path):
+        relative = path.relative_to(self.root).as_posix()
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8-sig"))
+        except (OSError, SyntaxError):
+            return
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            members = {name for member in node.body for name in _member_names(member)}
+            uses = {}
+            for member in node.body:
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    uses[member.name] = {
+                        child.attr for child in ast.walk(member)
+                        if isinstance(child, ast.Attribute) and isinstance(child.value, ast.Name)
+                        and child.value.id in ("self", "cls", node.name)
+                    }
+            self.classes[node.name] = {
+                "file": relative,
+                "bases": [base.id for base in node.bases if isinstance(base, ast.Name)],
+                "members": members,
+                "uses": uses,
+            }
+
+    def owner(self, class_name: str, attribute: str):
+        """Class (following bases) that defines an attribute, or None"""
+        seen = set()
+        pending = [class_name]
+        while pending:
+            name = pending.pop(0)
+            if name in seen or name not in self.classes:
+                continue
+            seen.add(name)
+            if attribute in self.classes[name]["members"]:
+                return name
+            pending.extend(self.classes[name]["bases"])
+        return None
+
+    def symbol(self, class_name: str, attribute: str = None) -> str:
+        qualname = f"{class_name}.{attribute}" if attribute else class_name
+        return f"{self.classes[class_name]['file']}::{qualname}"
+
+    def expand(self, class_name: str, attribute: str) -> set:
+        """The member's symbol plus everything it uses, transitively"""
+        symbols = set()
+        pending = [(class_name, attribute)]
+        while pending:
+            name, attr = pending.pop()
+            owner = self.owner(name, attr)
+            if owner is None or self.symbol(owner, attr) in symbols:
+                continue
+            symbols.add(self.symbol(owner, attr))
+            # self.X inside the method resolves against the class it was reached from
+            pending.extend((name, used) for used in self.classes[owner]["uses"].get(attr, ()))
+        return symbols
+
+
+# ---------- per-test dependencies ----------
+
+def test_qualname(nodeid: str) -> tuple:
+    """'ui_tests/test_x.py::TestX::test_y[param]' -> ('ui_tests/test_x.py', 'TestX.test_y')"""
+    path, _, rest = nodeid.partition("::")
+    return path, re.sub(r"\[.*\]$", "", rest).replace("::", ".")
+
+
+@functools.lru_cache(maxsize=None)
+def _parse(path: Path):
+    try:
+        return ast.parse(path.read_text(encoding="utf-8-sig"))
+    except (OSError, SyntaxError):
+        return None
+
+
+def static_dependencies(index: PageObjectIndex, path: Path, qualname: str) -> set:
+    """
+    Page-object symbols a test function references: classes it names and the
+    attributes it reads on them (resolved through the class bases)
+    Args:
+        index: PageObjectIndex of the repository
+        path: Test module
+        qualname: Function (or Class.method) inside it
+    """
+    tree = _parse(path)
+    if tree is None:
+        return set()
+
+    function = _find_function(tree, qualname)
+    if function is None:
+        return set()
+    names = {node.id for node in ast.walk(function) if isinstance(node, ast.Name)}
+    attributes = {node.attr for node in ast.walk(function) if isinstance(node, ast.Attribute)}
+    classes = [name for name in names if name in index.classes]
+
+    symbols = {index.symbol(name) for name in classes}
+    for name in classes:
+        # Instantiating the class runs __init__ (possibly a base's)
+        for attribute in attributes | {"__init__"}:
+            symbols |= index.expand(name, attribute)
+    return symbols
+
+
+def _find_function(tree, qualname: str):
+    scope = tree.body
+    node = None
+    for part in qualname.split("."):
+        node = next((child for child in scope
+                     if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+                     and child.name == part), None)
+        if node is None:
+            return None
+        scope = node.body
+    return node
+
+
+class ImpactTracer:
+    """
+    sys.setprofile tracer collecting the page-object functions called while a
+    test runs (main thread only: async page objects are covered statically)
+    """
+
+    def __init__(self, root: Path, page_dirs: tuple = PAGE_DIRS):
+        self.root = str(Path(root).resolve())
+        self.prefixes = tuple(str(Path(root).resolve() / page_dir) for page_dir in page_dirs)
+        self.calls = set()
+        self._files = {}
+
+    def _profile(self, frame, event, arg):
+        if event != "call":
+            return
+        filename = frame.f_code.co_filename
+        if not filename.startswith(self.prefixes):
+            return
+        relative = self._files.get(filename)
+        if relative is None:
+            relative = self._files[filename] = Path(filename).relative_to(self.root).as_posix()
+        self.calls.add(f"{relative}::{getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)}")
+
+    def start(self):
+        self.calls = set()
+        sys.setprofile(self._profile)
+
+    def stop(self) -> set:
+        sys.setprofile(None)
+        return self.calls
+
+
+# ---------- git diff ----------
+
+def changed_lines(base: str, root: Path) -> dict:
+    """
+    Lines changed between a git ref and the working tree
+    Returns:
+        dict: path -> (changed lines in the working tree, changed lines in base)
+    """
+    diff = subprocess.run(
+        ["git", "diff", "-U0", "--no-color", "--no-renames", base, "--"],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout
+    changes = defaultdict(lambda: (set(), set()))
+    path = old_path = None
+    old_left = new_left = 0  # hunk lines still to come: inside a hunk "--- x" is a removed "-- x"
+    for line in diff.splitlines():
+        if old_left or new_left:
+            if line.startswith("-"):
+                old_left -= 1
+            elif line.startswith("+"):
+                new_left -= 1
+            elif line.startswith(" "):
+                old_left, new_left = old_left - 1, new_left - 1
+        elif line.startswith("--- "):
+            old_path = None if line == "--- /dev/null" else line[6:]
+        elif line.startswith("+++ "):
+            path = None if line == "+++ /dev/null" else line[6:]
+            changes[path or old_path]
+        elif line.startswith("@@"):
+            match = re.match(r"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", line)
+            old_start, old_count, new_start, new_count = (
+                int(match.group(1)), int(match.group(2) or 1), int(match.group(3)), int(match.group(4) or 1)
+            )
+            new_lines, old_lines = changes[path or old_path]
+            new_lines.update(range(new_start, new_start + new_count))
+            old_lines.update(range(old_start, old_start + old_count))
+            old_left, new_left = old_count, new_count
+
+    # New files git does not track yet count as changed from the first line to the last
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout.splitlines()
+    for path in untracked:
+        source = _read(Path(root) / path) or ""
+        changes[path] = (set(range(1, source.count("\n") + 2)), set())
+    return dict(changes)
+
+
+class ChangeSet:
+    """
+    What a diff touches
+    symbols: "file::Qualname" of changed page-object / test symbols ("file::*" = whole file)
+    scopes: Test folders whose tests are all affected
+    run_all: Why every test is affected (None if the change can be narrowed down)
+    """
+
+    def __init__(self):
+        self.symbols = set()
+        self.scopes = set()
+        self.run_all = None
+        self.files = []
+
+    def affects(self, nodeid: str, dependencies: set) -> bool:
+        if self.run_all:
+            return True
+        path, qualname = test_qualname(nodeid)
+        if any(nodeid.startswith(scope) for scope in self.scopes):
+            return True
+        if f"{path}::*" in self.symbols or f"{path}::{qualname}" in self.symbols:
+            return True
+        if any(f"{path}::{part}" in self.symbols for part in _parents(qualname)):
+            return True
+        # A change to a class itself (bases, docstring ...) affects all of its members
+        related = set(dependencies)
+        for symbol in dependencies:
+            file, _, name = symbol.partition("::")
+            related |= {f"{file}::{parent}" for parent in _parents(name)} | {f"{file}::*"}
+        return bool(self.symbols & related)
+
+
+def _parents(qualname: str) -> list:
+    parts = qualname.split(".")
+    return [".".join(parts[:index]) for index in range(1, len(parts))]
+
+
+def change_set(base: str, root: Path) -> ChangeSet:
+    """Classify every changed file of the diff against `base`"""
+    root = Path(root)
+    changes = ChangeSet()
+    for path, (new_lines, old_lines) in changed_lines(base, root).items():
+        changes.files.append(path)
+        if path.startswith(IGNORED_DIRS) or _is_doc(path):
+            continue
+        scope = next((scope for prefix, scope in SCOPED_DIRS.items() if path.startswith(prefix)), None)
+        if scope:
+            changes.scopes.add(scope)
+            continue
+        is_test = Path(path).name.startswith("test_") and path.endswith(".py")
+        if not (is_test or path.startswith(PAGE_DIRS)) or Path(path).name in RUN_ALL_FILES:
+            changes.run_all = changes.run_all or f"{path} changed"
+            continue
+        for source, lines in ((_read(root / path), new_lines), (_git_show(base, path, root), old_lines)):
+            if source is None or not lines:
+                continue
+            try:
+                symbols = symbols_for_lines(source, lines)
+            except SyntaxError:
+                symbols = {"*"}
+            if is_test:
+                # Helpers and fixtures inside a test module may be used by any of its tests
+                symbols = {symbol if symbol.rpartition(".")[2].startswith(("test", "Test")) else "*"
+                           for symbol in symbols}
+            changes.symbols |= {f"{path}::{symbol}" for symbol in symbols}
+    return changes
+
+
+def _is_doc(path: str) -> bool:
+    if path.endswith(DOC_SUFFIXES):
+        return True
+    return "/" not in path and path.endswith(TOP_LEVEL_DOC_SUFFIXES) and path not in RUN_ALL_FILES
+
+
+def _read(path: Path):
+    try:
+        return path.read_text(encoding="utf-8-sig")
+    except OSError:
+        return None
+
+
+def _git_show(base: str, path: str, root: Path):
+    result = subprocess.run(["git", "show", f"{base}:{path}"], cwd=root, capture_output=True, text=True)
+    return result.stdout.lstrip("﻿") if result.returncode == 0 else None
+
+
+# ---------- plugin ----------
+
+class ImpactPlugin:
+    """
+    - --impact-trace: records the page-object calls of every test into the pytest cache
+    - --impact-base REF: keeps only the tests the diff against REF (plus untracked
+      files) can affect: changed tests, tests whose page-object dependencies
+      changed, and everything when shared code (conftest, utils, config) changed
+    """
+
+    def __init__(self, config, base: str = None, trace: bool = False):
+        self.config = config
+        self.base = base
+        self.root = Path(str(config.rootpath))
+        self.tracer = ImpactTracer(self.root) if trace else None
+        self.traced = {}
+        self.known = {}
+        self.changes = None
+        self.selected = self.deselected = 0
+
+    def pytest_sessionstart(self, session):
+        # config.cache does not exist yet when the plugin is registered
+        self.known = self.config.cache.get(CACHE_KEY, {})
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not self.base:
+            return
+        try:
+            self.changes = change_set(self.base, self.root)
+        except (OSError, subprocess.CalledProcessError) as error:
+            self.changes = ChangeSet()
+            self.changes.run_all = f"git diff against {self.base} failed: {error}"
+
+        index = PageObjectIndex(self.root)
+        keep, drop = [], []
+        for item in items:
+            path, qualname = test_qualname(item.nodeid)
+            dependencies = set(self.known.get(item.nodeid, []))
+            dependencies |= static_dependencies(index, self.root / path, qualname)
+            if self.changes.affects(item.nodeid, dependencies):
+                keep.append(item)
+            else:
+                drop.append(item)
+        if drop:
+            config.hook.pytest_deselected(items=drop)
+            items[:] = keep
+        self.selected, self.deselected = len(keep), len(drop)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.tracer is None:
+            yield
+            return
+        self.tracer.start()
+        try:
+            yield
+        finally:
+            self.traced[item.nodeid] = sorted(self.tracer.stop())
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(self.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["impact_trace"] = self.traced
+            if self.changes is not None:
+                workeroutput["impact_selection"] = {
+                    "selected": self.selected, "deselected": self.deselected,
+                    "run_all": self.changes.run_all, "files": self.changes.files,
+                }
+            return
+        if self.traced:
+            self.config.cache.set(CACHE_KEY, {**self.config.cache.get(CACHE_KEY, {}), **self.traced})
+        # A diff that affects no test (docs, benchmarks ...) is a successful run, not "no tests collected"
+        if self.deselected and not self.selected and session.exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+            session.exitstatus = pytest.ExitCode.OK
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        workeroutput = getattr(node, "workeroutput", {})
+        self.traced.update(workeroutput.get("impact_trace", {}))
+        # Every worker selects from the same collection: any one of them tells the controller
+        selection = workeroutput.get("impact_selection")
+        if selection and self.changes is None:
+            self.changes = ChangeSet()
+            self.changes.run_all = selection["run_all"]
+            self.changes.files = selection["files"]
+            self.selected, self.deselected = selection["selected"], selection["deselected"]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.changes is None or hasattr(self.config, "workerinput"):
+            return
+        terminalreporter.write_sep("-", f"test impact (vs {self.base})")
+        if self.changes.run_all:
+            terminalreporter.write_line(f"all tests selected: {self.changes.run_all}")
+        else:
+            terminalreporter.write_line(
+                f"{self.selected} selected, {self.deselected} deselected "
+                f"for {len(self.changes.files)} changed file(s)"
+            )
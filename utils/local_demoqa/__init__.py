@@ -0,0 +1,6 @@
+"""
+Local DemoQA Stand-in
+In-process HTTP server serving the DemoQA pages our page objects use and an
+in-memory BookStore/Account API, so both suites can run without demoqa.com
+"""
+from utils.local_demoqa.server import LocalDemoQA
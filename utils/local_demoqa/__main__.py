@@ -0,0 +1,27 @@
+"""
+Run the local DemoQA stand-in from the command line
+
+    python -m utils.local_demoqa --port 8000
+    API_BASE_URL=http://127.0.0.1:8000 UI_BASE_URL=http://127.0.0.1:8000 pytest
+"""
+import argparse
+
+from utils.local_demoqa.server import LocalDemoQA
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local DemoQA stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = LocalDemoQA(args.host, args.port)
+    print(f"🌐 Local DemoQA running at {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
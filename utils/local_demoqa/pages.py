@@ -0,0 +1,251 @@
+"""
+HTML for the local DemoQA pages
+Only the markup and behaviour our page objects and tests rely on
+"""
+
+STYLE = """
+body { font-family: Arial, sans-serif; margin: 0; }
+.home-banner img { width: 100%; max-height: 260px; }
+.category-cards { display: flex; flex-wrap: wrap; gap: 20px; padding: 20px; }
+.card { width: 280px; border: 1px solid #ddd; border-radius: 6px; cursor: pointer; }
+.card-body h5 { text-align: center; margin: 16px; }
+.main-header { font-size: 28px; text-align: center; padding: 20px; }
+.menu-list { float: left; width: 220px; }
+.content { margin-left: 240px; padding: 10px; }
+#output .border { border: 1px solid #ccc; padding: 8px; }
+#modal { position: fixed; top: 80px; left: 30%; background: #fff; border: 1px solid #999; padding: 20px; }
+"""
+
+BANNER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="1200" height="260">'
+    '<rect width="1200" height="260" fill="#1991d2"/>'
+    '<text x="40" y="150" font-size="60" fill="#fff">SELENIUM CERTIFICATION TRAINING</text></svg>'
+)
+
+CARDS = [
+    ("Elements", "/elements"),
+    ("Forms", "/forms"),
+    ("Alerts, Frame &amp; Windows", "/alertsWindows"),
+    ("Widgets", "/widgets"),
+    ("Interactions", "/interaction"),
+    ("Book Store Application", "/books"),
+]
+
+ELEMENTS_MENU = [
+    ("Text Box", "/text-box"),
+    ("Check Box", "/checkbox"),
+    ("Radio Button", "/radio-button"),
+    ("Web Tables", "/webtables"),
+    ("Buttons", "/buttons"),
+    ("Links", "/links"),
+    ("Broken Links - Images", "/broken"),
+    ("Upload and Download", "/upload-download"),
+    ("Dynamic Properties", "/dynamic-properties"),
+]
+
+
+def layout(body: str, script: str = "") -> str:
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>DEMOQA</title>"
+        f"<style>{STYLE}</style></head><body>{body}"
+        f"<script>{script}</script></body></html>"
+    )
+
+
+def section(title: str, content: str, script: str = "") -> str:
+    """Page with the main header and the Elements side menu"""
+    menu = "".join(
+        f'<li><a href="{href}"><span class="text">{name}</span></a></li>'
+        for name, href in ELEMENTS_MENU
+    )
+    return layout(
+        f'<div class="main-header">{title}</div>'
+        f'<ul class="menu-list">{menu}</ul>'
+        f'<div class="content">{content}</div>',
+        script,
+    )
+
+
+def home() -> str:
+    cards = "".join(
+        f'<div class="card mt-4 top-card" onclick="location.href=\'{href}\'">'
+        f'<div class="card-up"></div><div class="card-body"><h5>{name}</h5></div></div>'
+        for name, href in CARDS
+    )
+    return layout(
+        '<div class="home-banner"><a href="/"><img class="banner-image" src="/images/Toolsqa.svg"></a></div>'
+        f'<div class="category-cards">{cards}</div>'
+    )
+
+
+def elements() -> str:
+    return section("Elements", "<p>Please select an item from left to start practice.</p>")
+
+
+def placeholder(title: str) -> str:
+    return section(title, f"<p>{title}</p>")
+
+
+def text_box() -> str:
+    return section(
+        "Text Box",
+        """
+        <form id="userForm" onsubmit="return false">
+          <input id="userName" placeholder="Full Name" type="text">
+          <input id="userEmail" placeholder="name@example.com" type="email">
+          <textarea id="currentAddress" placeholder="Current Address"></textarea>
+          <textarea id="permanentAddress"></textarea>
+          <button id="submit" type="button">Submit</button>
+        </form>
+        <div id="output"></div>
+        """,
+        """
+        document.getElementById("submit").onclick = () => {
+          const value = (id) => document.getElementById(id).value;
+          document.getElementById("output").innerHTML =
+            '<div class="border">' +
+            '<p id="name">Name:' + value("userName") + '</p>' +
+            '<p id="email">Email:' + value("userEmail") + '</p>' +
+            '<p id="currentAddress">Current Address :' + value("currentAddress") + '</p>' +
+            '<p id="permanentAddress">Permananet Address :' + value("permanentAddress") + '</p>' +
+            '</div>';
+        };
+        """,
+    )
+
+
+def practice_form() -> str:
+    return section(
+        "Practice Form",
+        """
+        <form id="userForm" onsubmit="return false">
+          <input id="firstName" placeholder="First Name" type="text">
+          <input id="lastName" placeholder="Last Name" type="text">
+          <input id="userEmail" placeholder="name@example.com" type="text">
+          <div id="genterWrapper">
+            <input type="radio" id="gender-radio-1" name="gender" value="Male"><label for="gender-radio-1">Male</label>
+            <input type="radio" id="gender-radio-2" name="gender" value="Female"><label for="gender-radio-2">Female</label>
+            <input type="radio" id="gender-radio-3" name="gender" value="Other"><label for="gender-radio-3">Other</label>
+          </div>
+          <input id="userNumber" placeholder="Mobile Number" type="text" maxlength="10">
+          <button id="submit" type="button">Submit</button>
+        </form>
+        <div id="modal" style="display: none">
+          <div id="example-modal-sizes-title-lg">Thanks for submitting the form</div>
+          <button id="closeLargeModal" type="button">Close</button>
+        </div>
+        """,
+        """
+        document.getElementById("submit").onclick = () => {
+          const value = (id) => document.getElementById(id).value.trim();
+          const gender = document.querySelector("input[name=gender]:checked");
+          if (value("firstName") && value("lastName") && gender && /^[0-9]{10}$/.test(value("userNumber"))) {
+            document.getElementById("modal").style.display = "block";
+          }
+        };
+        document.getElementById("closeLargeModal").onclick = () => {
+          document.getElementById("modal").style.display = "none";
+        };
+        """,
+    )
+
+
+def alerts() -> str:
+    return section(
+        "Alerts",
+        """
+        <button id="alertButton">Click me</button>
+        <button id="timerAlertButton">Click me</button>
+        <button id="confirmButton">Click me</button>
+        <div id="confirmHost"></div>
+        <button id="promtButton">Click me</button>
+        <div id="promptHost"></div>
+        """,
+        """
+        document.getElementById("alertButton").onclick = () => alert("You clicked a button");
+        document.getElementById("timerAlertButton").onclick = () =>
+          setTimeout(() => alert("This alert appeared after 5 seconds"), 5000);
+        document.getElementById("confirmButton").onclick = () => {
+          const ok = confirm("Do you confirm action?");
+          document.getElementById("confirmHost").innerHTML =
+            '<span id="confirmResult">You selected <span>' + (ok ? "Ok" : "Cancel") + '</span></span>';
+        };
+        document.getElementById("promtButton").onclick = () => {
+          const name = prompt("Please enter your name");
+          if (name) {
+            document.getElementById("promptHost").innerHTML =
+              '<span id="promptResult">You entered <span>' + name + '</span></span>';
+          }
+        };
+        """,
+    )
+
+
+def frames() -> str:
+    return section(
+        "Frames",
+        '<iframe id="frame1" src="/sample" width="500" height="350"></iframe>'
+        '<iframe id="frame2" src="/sample" width="100" height="100"></iframe>',
+    )
+
+
+def sample() -> str:
+    return layout('<h1 id="sampleHeading">This is a sample page</h1>')
+
+
+def dynamic_properties() -> str:
+    return section(
+        "Dynamic Properties",
+        """
+        <p id="randomIdText">This text has random Id</p>
+        <button id="enableAfter" disabled>Will enable 5 seconds</button>
+        <button id="colorChange">Color Change</button>
+        <div id="visibleAfterHost"></div>
+        """,
+        """
+        setTimeout(() => {
+          document.getElementById("enableAfter").disabled = false;
+          document.getElementById("colorChange").classList.add("text-danger");
+          document.getElementById("visibleAfterHost").innerHTML =
+            '<button id="visibleAfter">Visible After 5 Seconds</button>';
+        }, 5000);
+        """,
+    )
+
+
+def browser_windows() -> str:
+    return section(
+        "Browser Windows",
+        """
+        <button id="tabButton">New Tab</button>
+        <button id="windowButton">New Window</button>
+        <button id="messageWindowButton">New Window Message</button>
+        """,
+        """
+        document.getElementById("tabButton").onclick = () => window.open("/sample", "_blank");
+        document.getElementById("windowButton").onclick = () =>
+          window.open("/sample", "_blank", "width=800,height=600");
+        document.getElementById("messageWindowButton").onclick = () => {
+          const popup = window.open("", "_blank", "width=400,height=300");
+          popup.document.write("Knowledge increases by sharing but not by saving.");
+        };
+        """,
+    )
+
+
+PAGES = {
+    "/": home,
+    "/elements": elements,
+    "/text-box": text_box,
+    "/automation-practice-form": practice_form,
+    "/alerts": alerts,
+    "/frames": frames,
+    "/sample": sample,
+    "/dynamic-properties": dynamic_properties,
+    "/browser-windows": browser_windows,
+    "/forms": lambda: placeholder("Forms"),
+    "/alertsWindows": lambda: placeholder("Alerts, Frame &amp; Windows"),
+    "/widgets": lambda: placeholder("Widgets"),
+    "/interaction": lambda: placeholder("Interactions"),
+    "/books": lambda: placeholder("Book Store"),
+}
@@ -0,0 +1,275 @@
+"""
+Local DemoQA HTTP server
+ThreadingHTTPServer with HTTP/1.1 keep-alive, serving pages and the
+/BookStore/v1 and /Account/v1 APIs from an in-memory store
+"""
+import base64
+import hashlib
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from utils.local_demoqa import pages
+from utils.local_demoqa.store import ApiError, DemoQAStore
+
+NOT_AUTHORIZED = ApiError(401, "1200", "User not authorized!")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024  # room for load runs and many xdist workers
+
+    def __init__(self, address, store: DemoQAStore):
+        super().__init__(address, DemoQAHandler)
+        self.store = store
+
+
+class DemoQAHandler(BaseHTTPRequestHandler):
+    """Routes page and API requests; one instance per connection"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "LocalDemoQA/1.0"
+    # Headers and body go out in separate writes: with Nagle on, every reply on a
+    # kept-alive connection waits ~40 ms for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    # (method, path pattern, handler name)
+    API_ROUTES = [
+        ("GET", r"/BookStore/v1/Books", "get_books"),
+        ("POST", r"/BookStore/v1/Books", "add_books"),
+        ("DELETE", r"/BookStore/v1/Books", "clear_books"),
+        ("GET", r"/BookStore/v1/Book", "get_book"),
+        ("DELETE", r"/BookStore/v1/Book", "remove_book"),
+        ("PUT", r"/BookStore/v1/Books/(?P<isbn>[^/]+)", "replace_book"),
+        ("POST", r"/Account/v1/User", "create_user"),
+        ("GET", r"/Account/v1/User/(?P<user_id>[^/]+)", "get_user"),
+        ("DELETE", r"/Account/v1/User/(?P<user_id>[^/]+)", "delete_user"),
+        ("POST", r"/Account/v1/GenerateToken", "generate_token"),
+        ("POST", r"/Account/v1/Authorized", "authorized"),
+        ("POST", r"/Account/v1/Login", "login"),
+    ]
+
+    def log_message(self, format, *args):
+        pass  # keep test output clean
+
+    @property
+    def store(self) -> DemoQAStore:
+        return self.server.store
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_HEAD(self):
+        self._dispatch("HEAD")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    # ---------- dispatch ----------
+
+    def _dispatch(self, method: str):
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip("/") or "/"
+        self.query = {name: values[0] for name, values in parse_qs(parts.query).items()}
+        self.body = self._read_body()
+
+        if path.startswith(("/BookStore/", "/Account/")):
+            self._dispatch_api(method, path)
+        elif path.startswith("/images/"):
+            self._send(200, pages.BANNER_SVG.encode(), "image/svg+xml")
+        elif path in pages.PAGES and method in ("GET", "HEAD"):
+            self._send(200, pages.PAGES[path]().encode(), "text/html; charset=utf-8")
+        else:
+            self._send(404, pages.layout("<h1>Not Found</h1>").encode(), "text/html; charset=utf-8")
+
+    def _dispatch_api(self, method: str, path: str):
+        path_matched = False
+        for route_method, pattern, name in self.API_ROUTES:
+            match = re.fullmatch(pattern, path)
+            if not match:
+                continue
+            path_matched = True
+            if route_method != method:
+                continue
+            try:
+                status, payload = getattr(self, f"api_{name}")(**match.groupdict())
+            except ApiError as error:
+                status, payload = error.status, error.body
+            self._send_json(status, payload)
+            return
+
+        if path_matched:
+            self._send_json(405, {"code": "405", "message": "Method not allowed"})
+        else:
+            self._send_json(404, {"code": "404", "message": "Not found"})
+
+    # ---------- BookStore API ----------
+
+    def api_get_books(self):
+        return 200, {"books": self.store.list_books()}
+
+    def api_get_book(self):
+        return 200, self.store.get_book(self.query.get("ISBN", ""))
+
+    def api_add_books(self):
+        user = self._authorized_user(self.body.get("userId"))
+        isbns = [entry.get("isbn") for entry in self.body.get("collectionOfIsbns", [])]
+        return 201, {"books": self.store.add_books(user["userID"], isbns)}
+
+    def api_clear_books(self):
+        user = self._authorized_user(self.query.get("UserId"))
+        self.store.clear_books(user["userID"])
+        return 204, None
+
+    def api_remove_book(self):
+        user = self._authorized_user(self.body.get("userId"))
+        self.store.remove_book(user["userID"], self.body.get("isbn"))
+        return 204, None
+
+    def api_replace_book(self, isbn):
+        user = self._authorized_user(self.body.get("userId"))
+        return 200, self.store.replace_book(user["userID"], isbn, self.body.get("isbn"))
+
+    # ---------- Account API ----------
+
+    def api_create_user(self):
+        return 201, self.store.create_user(self.body.get("userName"), self.body.get("password"))
+
+    def api_generate_token(self):
+        return 200, self.store.generate_token(self.body.get("userName"), self.body.get("password"))
+
+    def api_authorized(self):
+        return 200, self.store.is_authorized(self.body.get("userName"), self.body.get("password"))
+
+    def api_login(self):
+        user = self.store.check_credentials(self.body.get("userName"), self.body.get("password"))
+        if user is None:
+            raise ApiError(404, "1207", "User not found!")
+        token = self.store.generate_token(self.body.get("userName"), self.body.get("password"))
+        return 200, {
+            "userId": user["userID"],
+            "username": user["username"],
+            "password": user["password"],
+            "token": token["token"],
+            "expires": token["expires"],
+        }
+
+    def api_get_user(self, user_id):
+        user = self._authorized_user(user_id)
+        return 200, self.store.get_user(user["userID"])
+
+    def api_delete_user(self, user_id):
+        user = self._authorized_user(user_id)
+        self.store.delete_user(user["userID"])
+        return 204, None
+
+    # ---------- helpers ----------
+
+    def _authorized_user(self, user_id: str) -> dict:
+        """Resolve the Bearer token / Basic credentials and check they own user_id"""
+        header = self.headers.get("Authorization", "")
+        scheme, _, value = header.partition(" ")
+        user = None
+        if scheme.lower() == "bearer":
+            user = self.store.user_for_token(value.strip())
+        elif scheme.lower() == "basic":
+            try:
+                username, _, password = base64.b64decode(value).decode().partition(":")
+                user = self.store.check_credentials(username, password)
+            except (ValueError, ApiError):
+                user = None
+        if user is None:
+            raise NOT_AUTHORIZED
+        if user_id and user_id != user["userID"]:
+            raise ApiError(401, "1207", "User Id not correct!")
+        return user
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        raw = self.rfile.read(length)
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            return {}
+        return body if isinstance(body, dict) else {}
+
+    def _send_json(self, status: int, payload):
+        body = b"" if payload is None else json.dumps(payload).encode()
+        etag = None
+        if status == 200 and self.command in ("GET", "HEAD"):
+            # Weak ETag like the live (Express) API, so clients can revalidate with If-None-Match
+            etag = f'W/"{hashlib.sha1(body).hexdigest()[:16]}"'
+            if etag in self.headers.get("If-None-Match", ""):
+                self._send(304, b"", "application/json; charset=utf-8", etag)
+                return
+        self._send(status, body, "application/json; charset=utf-8", etag)
+
+    def _send(self, status: int, body: bytes, content_type: str, etag: str = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        if self.command != "HEAD" and body:
+            self.wfile.write(body)
+
+
+class LocalDemoQA:
+    """
+    Start/stop wrapper around the server thread
+
+    Usage:
+        with LocalDemoQA() as server:
+            requests.get(f"{server.url}/BookStore/v1/Books")
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (port 0 picks a free port)
+        Args:
+            host: Interface to bind
+            port: Port to bind
+        """
+        self.store = DemoQAStore()
+        self._server = _Server((host, port), self.store)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-demoqa", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve requests from a background thread"""
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve requests on the calling thread until interrupted"""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
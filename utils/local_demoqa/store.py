@@ -0,0 +1,265 @@
+"""
+In-memory BookStore and Account data
+Thread-safe, so the server can handle many concurrent clients
+"""
+import re
+import secrets
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+BOOKS = [
+    {
+        "isbn": "9781449325862",
+        "title": "Git Pocket Guide",
+        "subTitle": "A Working Introduction",
+        "author": "Richard E. Silverman",
+        "publish_date": "2020-06-04T08:48:39.000Z",
+        "publisher": "O'Reilly Media",
+        "pages": 234,
+        "description": "This pocket guide is the perfect on-the-job companion to Git, the distributed version control system.",
+        "website": "http://chimera.labs.oreilly.com/books/1230000000561/index.html",
+    },
+    {
+        "isbn": "9781449331818",
+        "title": "Learning JavaScript Design Patterns",
+        "subTitle": "A JavaScript and jQuery Developer's Guide",
+        "author": "Addy Osmani",
+        "publish_date": "2020-06-04T09:11:40.000Z",
+        "publisher": "O'Reilly Media",
+        "pages": 254,
+        "description": "With Learning JavaScript Design Patterns, you'll learn how to write beautiful, structured, and maintainable JavaScript.",
+        "website": "http://www.addyosmani.com/resources/essentialjsdesignpatterns/book/",
+    },
+    {
+        "isbn": "9781449337711",
+        "title": "Designing Evolvable Web APIs with ASP.NET",
+        "subTitle": "Harnessing the Power of the Web",
+        "author": "Glenn Block et al.",
+        "publish_date": "2020-06-04T09:12:43.000Z",
+        "publisher": "O'Reilly Media",
+        "pages": 238,
+        "description": "Design and build Web APIs for a broad range of clients with ASP.NET Web API.",
+        "website": "http://chimera.labs.oreilly.com/books/1234000001708/index.html",
+    },
+    {
+        "isbn": "9781449365035",
+        "title": "Speaking JavaScript",
+        "subTitle": "An In-Depth Guide for Programmers",
+        "author": "Axel Rauschmayer",
+        "publish_date": "2014-02-01T00:00:00.000Z",
+        "publisher": "O'Reilly Media",
+        "pages": 460,
+        "description": "Like it or not, JavaScript is everywhere these days, from browser to server to mobile.",
+        "website": "http://speakingjs.com/",
+    },
+    {
+        "isbn": "9781491904244",
+        "title": "You Don't Know JS",
+        "subTitle": "ES6 & Beyond",
+        "author": "Kyle Simpson",
+        "publish_date": "2015-12-27T00:00:00.000Z",
+        "publisher": "O'Reilly Media",
+        "pages": 278,
+        "description": "No matter how much experience you have with JavaScript, odds are you don't fully understand the language.",
+        "website": "https://github.com/getify/You-Dont-Know-JS/tree/master/es6%20&%20beyond",
+    },
+    {
+        "isbn": "9781491950296",
+        "title": "Programming JavaScript Applications",
+        "subTitle": "Robust Web Architecture with Node, HTML5, and Modern JS Libraries",
+        "author": "Eric Elliott",
+        "publish_date": "2014-07-01T00:00:00.000Z",
+        "publisher": "O'Reilly Media",
+        "pages": 254,
+        "description": "Take advantage of JavaScript's power to build robust web-scale or enterprise applications.",
+        "website": "http://chimera.labs.oreilly.com/books/1234000000262/index.html",
+    },
+    {
+        "isbn": "9781593275846",
+        "title": "Eloquent JavaScript, Second Edition",
+        "subTitle": "A Modern Introduction to Programming",
+        "author": "Marijn Haverbeke",
+        "publish_date": "2014-12-14T00:00:00.000Z",
+        "publisher": "No Starch Press",
+        "pages": 472,
+        "description": "JavaScript lies at the heart of almost every modern web application.",
+        "website": "http://eloquentjavascript.net/",
+    },
+    {
+        "isbn": "9781593277574",
+        "title": "Understanding ECMAScript 6",
+        "subTitle": "The Definitive Guide for JavaScript Developers",
+        "author": "Nicholas C. Zakas",
+        "publish_date": "2016-09-03T00:00:00.000Z",
+        "publisher": "No Starch Press",
+        "pages": 352,
+        "description": "ECMAScript 6 represents the biggest update to the core of JavaScript in the history of the language.",
+        "website": "https://leanpub.com/understandinges6/read",
+    },
+]
+
+WEAK_PASSWORD_MESSAGE = (
+    "Passwords must have at least one non alphanumeric character, one digit ('0'-'9'), "
+    "one uppercase ('A'-'Z'), one lowercase ('a'-'z'), one special character and "
+    "Password must be eight characters or longer."
+)
+
+TOKEN_LIFETIME = timedelta(days=7)
+
+
+class ApiError(Exception):
+    """Error answered as {"code": ..., "message": ...} with an HTTP status"""
+
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.body = {"code": code, "message": message}
+
+
+def is_strong_password(password: str) -> bool:
+    return bool(
+        len(password) >= 8
+        and re.search(r"[a-z]", password)
+        and re.search(r"[A-Z]", password)
+        and re.search(r"[0-9]", password)
+        and re.search(r"[^A-Za-z0-9]", password)
+    )
+
+
+class DemoQAStore:
+    """
+    Users, tokens and book collections kept in memory
+    Every public method takes the lock, so handlers can call them from any thread
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._books = {book["isbn"]: book for book in BOOKS}
+        self._users = {}      # userID -> user dict
+        self._by_name = {}    # username -> userID
+        self._tokens = {}     # token -> (userID, expires)
+
+    # ---------- BookStore ----------
+
+    def list_books(self) -> list:
+        return list(self._books.values())
+
+    def get_book(self, isbn: str) -> dict:
+        book = self._books.get(isbn)
+        if book is None:
+            raise ApiError(400, "1205", "ISBN supplied is not available in Books Collection!")
+        return book
+
+    def add_books(self, user_id: str, isbns: list) -> list:
+        with self._lock:
+            user = self._user(user_id)
+            added = []
+            for isbn in isbns:
+                self.get_book(isbn)
+                if isbn in user["books"]:
+                    raise ApiError(400, "1210", "ISBN already present in the User's Collection!")
+                user["books"].append(isbn)
+                added.append({"isbn": isbn})
+            return added
+
+    def replace_book(self, user_id: str, old_isbn: str, new_isbn: str) -> dict:
+        with self._lock:
+            user = self._user(user_id)
+            self.get_book(new_isbn)
+            if old_isbn not in user["books"]:
+                raise ApiError(400, "1206", "ISBN supplied is not available in User's Collection!")
+            user["books"][user["books"].index(old_isbn)] = new_isbn
+            return self._public_user(user)
+
+    def remove_book(self, user_id: str, isbn: str):
+        with self._lock:
+            user = self._user(user_id)
+            if isbn not in user["books"]:
+                raise ApiError(400, "1206", "ISBN supplied is not available in User's Collection!")
+            user["books"].remove(isbn)
+
+    def clear_books(self, user_id: str):
+        with self._lock:
+            self._user(user_id)["books"].clear()
+
+    # ---------- Account ----------
+
+    def create_user(self, username: str, password: str) -> dict:
+        if not username or not password:
+            raise ApiError(400, "1200", "UserName and Password required.")
+        if not is_strong_password(password):
+            raise ApiError(400, "1300", WEAK_PASSWORD_MESSAGE)
+        with self._lock:
+            if username in self._by_name:
+                raise ApiError(406, "1204", "User exists!")
+            user_id = str(uuid.uuid4())
+            user = {"userID": user_id, "username": username, "password": password, "books": []}
+            self._users[user_id] = user
+            self._by_name[username] = user_id
+            return {"userID": user_id, "username": username, "books": []}
+
+    def check_credentials(self, username: str, password: str):
+        """Return the user for valid credentials, None otherwise"""
+        if not username or not password:
+            raise ApiError(400, "1200", "UserName and Password required.")
+        with self._lock:
+            user = self._users.get(self._by_name.get(username))
+            if user is None or user["password"] != password:
+                return None
+            return user
+
+    def generate_token(self, username: str, password: str) -> dict:
+        user = self.check_credentials(username, password)
+        if user is None:
+            return {"token": None, "expires": None, "status": "Failed", "result": "User authorization failed."}
+        token = secrets.token_urlsafe(32)
+        expires = datetime.now(timezone.utc) + TOKEN_LIFETIME
+        with self._lock:
+            self._tokens[token] = (user["userID"], expires)
+        return {
+            "token": token,
+            "expires": expires.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "status": "Success",
+            "result": "User authorized successfully.",
+        }
+
+    def is_authorized(self, username: str, password: str) -> bool:
+        user = self.check_credentials(username, password)
+        if user is None:
+            raise ApiError(404, "1207", "User not found!")
+        with self._lock:
+            return any(user_id == user["userID"] for user_id, _ in self._tokens.values())
+
+    def user_for_token(self, token: str):
+        with self._lock:
+            entry = self._tokens.get(token)
+            if entry is None or entry[1] < datetime.now(timezone.utc):
+                return None
+            return self._users.get(entry[0])
+
+    def get_user(self, user_id: str) -> dict:
+        with self._lock:
+            return self._public_user(self._user(user_id))
+
+    def delete_user(self, user_id: str):
+        with self._lock:
+            user = self._user(user_id)
+            del self._users[user_id]
+            del self._by_name[user["username"]]
+            self._tokens = {token: entry for token, entry in self._tokens.items() if entry[0] != user_id}
+
+    # ---------- helpers (call with the lock held) ----------
+
+    def _user(self, user_id: str) -> dict:
+        user = self._users.get(user_id)
+        if user is None:
+            raise ApiError(401, "1207", "User Id not correct!")
+        return user
+
+    def _public_user(self, user: dict) -> dict:
+        return {
+            "userId": user["userID"],
+            "username": user["username"],
+            "books": [self._books[isbn] for isbn in user["books"]],
+        }
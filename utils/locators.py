@@ -0,0 +1,157 @@
+"""
+Selector Fallback Chains
+Page-object locators declared as ordered candidates, resolved in one DOM round
+trip, with the winning candidate remembered per URL pattern across runs
+"""
+from utils.helpers import url_pattern
+
+CACHE_KEY = "learnnow/locator_winners"
+
+# Ranks every candidate in the page: CSS ones are queried here, anything else
+# (text=, :has-text(), xpath) is reported as not CSS and checked by Playwright
+_RANK_CANDIDATES = """candidates => candidates.map(selector => {
+  let elements;
+  try {
+    elements = document.querySelectorAll(selector);
+  } catch (error) {
+    return {css: false, count: 0, visible: false};
+  }
+  const visible = Array.from(elements).some(el => {
+    const style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden';
+  });
+  return {css: true, count: elements.length, visible};
+})"""
+
+
+class Fallback(str):
+    """
+    Ordered selector candidates for one element.
+    Behaves as its first candidate wherever a plain selector string is expected.
+
+    Usage:
+        MAIN_HEADER = Fallback(".main-header", "h1.text-center", "h1")
+    """
+
+    def __new__(cls, *candidates: str):
+        if not candidates:
+            raise ValueError("Fallback needs at least one selector")
+        chain = super().__new__(cls, candidates[0])
+        chain.candidates = tuple(candidates)
+        return chain
+
+    def __repr__(self):
+        return f"Fallback{self.candidates!r}"
+
+
+class SelectorResolver:
+    """
+    Picks the candidate of a Fallback chain that matches the current page.
+
+    1. One wait for *any* candidate (locator.or_), instead of one timeout per candidate
+    2. The remembered winner for this URL pattern is used if it matches
+    3. Otherwise all candidates are ranked in a single evaluate() and the first
+       visible (else first attached) one wins and is remembered
+    """
+
+    def __init__(self, winners: dict = None):
+        self.winners = dict(winners or {})
+        self._new = {}
+        self.stats = {"cached": 0, "resolved": 0}
+
+    @staticmethod
+    def key(url: str, chain: Fallback) -> str:
+        return f"{url_pattern(url)} {' | '.join(chain.candidates)}"
+
+    def resolve(self, page, selector: str, timeout_ms: int = 0) -> str:
+        """
+        Resolve a selector for a sync Playwright page
+        Args:
+            page: Playwright Page object
+            selector: Fallback chain (plain strings are returned unchanged)
+            timeout_ms: How long to wait for any candidate to attach (0 = no waiting)
+        Returns:
+            str: The selector to use
+        """
+        if not isinstance(selector, Fallback) or len(selector.candidates) == 1:
+            return str(selector)
+
+        if timeout_ms:
+            self._any(page, selector).first.wait_for(state="attached", timeout=timeout_ms)
+
+        key = self.key(page.url, selector)
+        winner = self._winner(key, selector)
+        if winner and page.locator(winner).count():
+            self.stats["cached"] += 1
+            return winner
+
+        ranks = page.evaluate(_RANK_CANDIDATES, list(selector.candidates))
+        for candidate, rank in zip(selector.candidates, ranks):
+            if not rank["css"]:
+                locator = page.locator(candidate)
+                rank.update(count=locator.count())
+                rank.update(visible=bool(rank["count"]) and locator.first.is_visible())
+        return self._pick(key, selector, ranks)
+
+    async def resolve_async(self, page, selector: str, timeout_ms: int = 0) -> str:
+        """Same as resolve() for an async Playwright page"""
+        if not isinstance(selector, Fallback) or len(selector.candidates) == 1:
+            return str(selector)
+
+        if timeout_ms:
+            await self._any(page, selector).first.wait_for(state="attached", timeout=timeout_ms)
+
+        key = self.key(page.url, selector)
+        winner = self._winner(key, selector)
+        if winner and await page.locator(winner).count():
+            self.stats["cached"] += 1
+            return winner
+
+        ranks = await page.evaluate(_RANK_CANDIDATES, list(selector.candidates))
+        for candidate, rank in zip(selector.candidates, ranks):
+            if not rank["css"]:
+                locator = page.locator(candidate)
+                rank.update(count=await locator.count())
+                rank.update(visible=bool(rank["count"]) and await locator.first.is_visible())
+        return self._pick(key, selector, ranks)
+
+    def merged(self, stored: dict) -> dict:
+        """Winners to persist: what is stored now plus what this worker resolved"""
+        return {**stored, **self._new}
+
+    @staticmethod
+    def _any(page, chain: Fallback):
+        locator = page.locator(chain.candidates[0])
+        for candidate in chain.candidates[1:]:
+            locator = locator.or_(page.locator(candidate))
+        return locator
+
+    def _winner(self, key: str, chain: Fallback):
+        winner = self._new.get(key, self.winners.get(key))
+        return winner if winner in chain.candidates else None
+
+    def _pick(self, key: str, chain: Fallback, ranks: list) -> str:
+        self.stats["resolved"] += 1
+        visible = [candidate for candidate, rank in zip(chain.candidates, ranks) if rank["visible"]]
+        attached = [candidate for candidate, rank in zip(chain.candidates, ranks) if rank["count"]]
+        winner = (visible or attached or [None])[0]
+        if winner is None:
+            # Nothing matches (yet): let the caller's own wait report the first candidate
+            return chain.candidates[0]
+        self._new[key] = winner
+        return winner
+
+
+# Active resolver for this process (the locator_winners fixture installs a persisted one)
+_active = SelectorResolver()
+
+
+def install(resolver):
+    """Make a resolver the active one"""
+    global _active
+    _active = resolver
+
+
+def active() -> SelectorResolver:
+    """The active resolver"""
+    return _active
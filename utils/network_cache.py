@@ -0,0 +1,148 @@
+"""
+Network Cache
+Records page responses to disk through page.route() and replays them in later
+runs, so navigation is fast, deterministic and works without network access
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from playwright.sync_api import Error, Page, Route
+
+MODES = ("off", "record", "replay", "refresh")
+
+# Headers that no longer match the stored (already decoded) body
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class NetworkCache:
+    """
+    On-disk response cache keyed by method, URL, selected request headers and body
+
+    Modes:
+        off     - no routing at all
+        record  - serve stored responses, fetch and store anything missing
+        replay  - serve stored responses only, misses go to the network and are reported
+        refresh - always fetch and overwrite the stored response
+    """
+
+    def __init__(self, store_dir: str = ".network_cache", mode: str = "off",
+                 vary_headers: tuple = ("accept", "accept-language")):
+        """
+        Initialize the cache
+        Args:
+            store_dir: Folder holding the recorded responses
+            mode: One of MODES
+            vary_headers: Request headers that are part of the cache key
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unsupported network cache mode: {mode}")
+        self.store_dir = Path(store_dir)
+        self.mode = mode
+        self.vary_headers = vary_headers
+        self.stats = {"hits": 0, "misses": 0, "recorded": 0}
+        self.missed_urls = []
+
+    def install(self, page: Page):
+        """
+        Route every request of a page through the cache
+        Args:
+            page: Playwright Page object
+        """
+        if self.mode != "off":
+            page.route("**/*", self._handle)
+
+    def key(self, method: str, url: str, headers: dict, body: bytes = None) -> str:
+        """
+        Build the cache key for a request
+        Returns:
+            str: Hex digest identifying the request
+        """
+        digest = hashlib.sha1()
+        digest.update(f"{method.upper()} {url}\n".encode())
+        for name in self.vary_headers:
+            digest.update(f"{name}:{headers.get(name, '')}\n".encode())
+        if body:
+            digest.update(body)
+        return digest.hexdigest()
+
+    def _handle(self, route: Route):
+        request = route.request
+        if request.method not in ("GET", "HEAD"):
+            route.fallback()
+            return
+
+        key = self.key(request.method, request.url, request.headers)
+
+        if self.mode in ("record", "replay"):
+            entry = self._load(key)
+            if entry:
+                self.stats["hits"] += 1
+                route.fulfill(**entry)
+                return
+
+        if self.mode == "replay":
+            self.stats["misses"] += 1
+            self.missed_urls.append(f"{request.method} {request.url}")
+            route.fallback()
+            return
+
+        try:
+            response = route.fetch()
+        except Error:
+            self.stats["misses"] += 1
+            self.missed_urls.append(f"{request.method} {request.url}")
+            route.abort()
+            return
+
+        if response.status < 500:
+            self._save(key, request.method, request.url, response.status,
+                       response.headers, response.body())
+            self.stats["recorded"] += 1
+        route.fulfill(response=response)
+
+    def _paths(self, key: str):
+        folder = self.store_dir / key[:2]
+        return folder / f"{key}.json", folder / f"{key}.body"
+
+    def _load(self, key: str):
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        return {"status": meta["status"], "headers": meta["headers"], "body": body}
+
+    def _save(self, key: str, method: str, url: str, status: int, headers: dict, body: bytes):
+        meta_path, body_path = self._paths(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "method": method,
+            "url": url,
+            "status": status,
+            "headers": {name: value for name, value in headers.items()
+                        if name.lower() not in _DROP_HEADERS},
+        }
+        # Write to temp files first so parallel workers never read half a file
+        _atomic_write(body_path, body)
+        _atomic_write(meta_path, json.dumps(meta, indent=2).encode("utf-8"))
+
+    def write_miss_report(self, path: str):
+        """
+        Write the requests that were not found in the cache
+        Args:
+            path: JSON file to write
+        """
+        if not self.missed_urls:
+            return
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        report = {"mode": self.mode, **self.stats, "missed": sorted(set(self.missed_urls))}
+        Path(path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+def _atomic_write(path: Path, data: bytes):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
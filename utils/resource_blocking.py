@@ -0,0 +1,159 @@
+"""
+Resource Blocking Profiles
+Aborts requests a test does not need (ads, analytics, media, fonts, third parties)
+through request interception, and estimates how much was saved
+"""
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Page, Request, Response, Route
+
+CACHE_KEY = "learnnow/resource_sizes"
+
+AD_HOSTS = (
+    "googlesyndication.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "googletagservices.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adsafeprotected.com",
+    "moatads.com",
+    "criteo.com",
+    "pubmatic.com",
+    "rubiconproject.com",
+    "taboola.com",
+    "outbrain.com",
+    "facebook.net",
+    "hotjar.com",
+)
+
+
+@dataclass(frozen=True)
+class BlockingProfile:
+    """
+    What a profile blocks
+    resource_types: Playwright resource types to abort (image, font, ...)
+    block_ads: Abort requests to known ad/analytics hosts
+    first_party_only: Abort requests to any site other than the page's own
+    """
+    name: str
+    resource_types: frozenset = frozenset()
+    block_ads: bool = False
+    first_party_only: bool = False
+
+    @property
+    def blocks_anything(self) -> bool:
+        return bool(self.resource_types or self.block_ads or self.first_party_only)
+
+
+_MEDIA = frozenset({"image", "media", "font"})
+
+PROFILES = {
+    "full": BlockingProfile("full"),
+    "no-ads": BlockingProfile("no-ads", block_ads=True),
+    "no-media": BlockingProfile("no-media", resource_types=_MEDIA, block_ads=True),
+    "minimal": BlockingProfile("minimal", resource_types=_MEDIA, block_ads=True, first_party_only=True),
+}
+
+
+def _site(url: str) -> str:
+    host = urlsplit(url).hostname or ""
+    return ".".join(host.split(".")[-2:])
+
+
+def _size_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+class ResourceSizes:
+    """
+    Response sizes (from Content-Length) remembered across runs,
+    used to estimate the bytes saved by blocked requests
+    """
+
+    def __init__(self, sizes: dict = None):
+        self.sizes = dict(sizes or {})
+        self._new = {}
+
+    def observe(self, response: Response):
+        """Remember the size of a response that was not blocked"""
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self._new[_size_key(response.url)] = int(length)
+
+    def estimate(self, url: str):
+        key = _size_key(url)
+        return self._new.get(key, self.sizes.get(key))
+
+    def merged(self, stored: dict) -> dict:
+        """Sizes to persist: what is stored now plus what this worker learned"""
+        return {**stored, **self._new}
+
+
+class ResourceBlocker:
+    """
+    Per-test request interceptor applying one BlockingProfile
+    """
+
+    def __init__(self, profile: BlockingProfile, sizes: ResourceSizes):
+        self.profile = profile
+        self.sizes = sizes
+        self.blocked_requests = 0
+        self.blocked_bytes = 0
+        self.unknown_sizes = 0
+        self._first_party = None
+
+    def install(self, page: Page):
+        """
+        Attach the blocker (and size learning) to a page
+        Args:
+            page: Playwright Page object
+        """
+        page.on("response", self.sizes.observe)
+        if self.profile.blocks_anything:
+            page.route("**/*", self._handle)
+
+    def summary(self) -> dict:
+        return {
+            "profile": self.profile.name,
+            "blocked_requests": self.blocked_requests,
+            "blocked_bytes": self.blocked_bytes,
+            "unknown_sizes": self.unknown_sizes,
+        }
+
+    def _should_block(self, request: Request) -> bool:
+        if request.is_navigation_request() and request.frame.parent_frame is None:
+            self._first_party = _site(request.url)
+            return False
+
+        if self.profile.block_ads:
+            host = urlsplit(request.url).hostname or ""
+            if any(host == ad_host or host.endswith("." + ad_host) for ad_host in AD_HOSTS):
+                return True
+
+        if request.resource_type in self.profile.resource_types:
+            return True
+
+        return bool(
+            self.profile.first_party_only
+            and self._first_party
+            and _site(request.url) != self._first_party
+        )
+
+    def _handle(self, route: Route):
+        request = route.request
+        if not self._should_block(request):
+            route.fallback()
+            return
+
+        self.blocked_requests += 1
+        size = self.sizes.estimate(request.url)
+        if size is None:
+            self.unknown_sizes += 1
+        else:
+            self.blocked_bytes += size
+        route.abort("blockedbyclient")
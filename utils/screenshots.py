@@ -0,0 +1,101 @@
+"""
+Failure Screenshots
+Captures a viewport screenshot in memory and leaves the disk writes to a
+background thread, so the report hook returns as quickly as possible
+"""
+import hashlib
+import os
+import queue
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from playwright.sync_api import Page
+
+
+class ScreenshotWriter:
+    """
+    Fast failure screenshots
+
+    - viewport only (full_page=False), JPEG by default with a configurable quality
+    - identical consecutive shots of the same test (reruns failing on the same screen) are skipped
+    - optional full-page shot, only when the viewport shot changed
+    - file names carry the xdist worker id, so workers never collide
+    """
+
+    def __init__(self, directory: str = "screenshots", image_type: str = "jpeg",
+                 quality: int = 70, full_page_on_change: bool = False):
+        """
+        Initialize the writer
+        Args:
+            directory: Folder for screenshots
+            image_type: jpeg or png
+            quality: JPEG quality 0-100 (ignored for png)
+            full_page_on_change: Also capture the full page when the viewport shot is new
+        """
+        self.directory = Path(directory)
+        self.image_type = image_type
+        self.quality = quality
+        self.full_page_on_change = full_page_on_change
+        self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self._last_digests = {}
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+
+    def start(self):
+        """Start the background writer"""
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 10.0):
+        """Write everything still queued and stop the writer"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def capture(self, page: Page, name: str, nodeid: str = None):
+        """
+        Capture a failure screenshot
+        Args:
+            page: Playwright Page object
+            name: Test name used in the file name
+            nodeid: Test the shot belongs to (default: name); repeats are only skipped per test
+        Returns:
+            Path of the viewport screenshot, or None if it repeated the test's last one
+        """
+        options = {"type": self.image_type, "full_page": False}
+        if self.image_type == "jpeg":
+            options["quality"] = self.quality
+
+        data = page.screenshot(**options)
+        digest = hashlib.sha1(data).hexdigest()
+        test = nodeid or name
+        if digest == self._last_digests.get(test):
+            return None
+        self._last_digests[test] = digest
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        stem = f"FAILED_{name}_{self.worker}_{timestamp}"
+        path = self.directory / f"{stem}.{self._extension}"
+        self._queue.put((path, data))
+
+        if self.full_page_on_change:
+            options["full_page"] = True
+            self._queue.put((self.directory / f"{stem}_full.{self._extension}", page.screenshot(**options)))
+
+        return path
+
+    @property
+    def _extension(self) -> str:
+        return "jpg" if self.image_type == "jpeg" else "png"
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, data = item
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(data)
+            except OSError:
+                pass
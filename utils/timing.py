@@ -0,0 +1,215 @@
+"""
+Per-Phase Timing
+Breaks every test's wall time down into phases (fixture setup, context creation,
+navigations, locator waits, actions, teardown) and summarizes p50/p95 per phase
+"""
+import functools
+import json
+import math
+import re
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# Page methods that wait for a navigation to settle
+NAVIGATIONS = ("goto", "reload", "go_back", "go_forward", "wait_for_load_state", "wait_for_url")
+
+UNATTRIBUTED = "(unattributed)"
+
+# Timings of the test running in this process, if any
+_active = None
+
+
+class PhaseTimings:
+    """
+    Self time per phase for one test.
+    Nested phases are subtracted from the enclosing one, so phases never overlap
+    and add up to (at most) the test's wall time. A phase entered again while it
+    is open (a locator wait inside a locator wait) belongs to the outer entry.
+    """
+
+    def __init__(self, nodeid: str):
+        self.nodeid = nodeid
+        self.phases = defaultdict(lambda: {"seconds": 0.0, "count": 0})
+        self.wall = defaultdict(float)
+        self._open = []      # names of the phases being timed, outermost first
+        self._children = []  # seconds spent in nested phases, per open phase
+
+    @contextmanager
+    def phase(self, name: str):
+        if name in self._open:
+            yield
+            return
+        self._open.append(name)
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._open.pop()
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            entry = self.phases[name]
+            entry["seconds"] += elapsed - children
+            entry["count"] += 1
+
+    def as_dict(self) -> dict:
+        phases = {name: {"seconds": round(entry["seconds"], 6), "count": entry["count"]}
+                  for name, entry in self.phases.items()}
+        total = sum(self.wall.values())
+        return {
+            "nodeid": self.nodeid,
+            "wall": {**{when: round(seconds, 6) for when, seconds in self.wall.items()},
+                     "total": round(total, 6)},
+            "phases": phases,
+            "unattributed": round(max(0.0, total - sum(entry["seconds"] for entry in self.phases.values())), 6),
+        }
+
+
+@contextmanager
+def phase(name: str):
+    """
+    Time a block as a phase of the running test (no-op outside a test)
+    Args:
+        name: Phase name, e.g. "new_context" or "locator_wait"
+    """
+    timings = _active
+    if timings is None:
+        yield
+        return
+    with timings.phase(name):
+        yield
+
+
+def timed(name: str):
+    """Decorator timing every call of a function as the given phase"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_page(page):
+    """
+    Time the navigation methods of a Playwright page
+    Args:
+        page: Playwright Page object
+    """
+    for name in NAVIGATIONS:
+        setattr(page, name, timed(name)(getattr(page, name)))
+    return page
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def summarize(samples: dict) -> dict:
+    """
+    Aggregate per-test timings into per-phase statistics
+    Args:
+        samples: nodeid -> PhaseTimings.as_dict()
+    Returns:
+        dict: phase -> {tests, p50, p95, total} in seconds
+    """
+    per_phase = defaultdict(list)
+    for sample in samples.values():
+        for when in ("setup", "call", "teardown"):
+            if when in sample["wall"]:
+                per_phase[f"pytest:{when}"].append(sample["wall"][when])
+        for name, entry in sample["phases"].items():
+            per_phase[name].append(entry["seconds"])
+        per_phase[UNATTRIBUTED].append(sample["unattributed"])
+
+    return {
+        name: {
+            "tests": len(values),
+            "p50": round(percentile(values, 50), 6),
+            "p95": round(percentile(values, 95), 6),
+            "total": round(sum(values), 6),
+        }
+        for name, values in per_phase.items()
+    }
+
+
+def _file_name(nodeid: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", nodeid).strip("_") + ".json"
+
+
+class TimingPlugin:
+    """
+    Records phase timings for every test, writes one JSON file per test and
+    a session summary (merged from all xdist workers on the controller)
+    """
+
+    def __init__(self, config, output_dir: str = "reports/timings"):
+        self.config = config
+        self.output_dir = Path(output_dir)
+        self.samples = {}
+        self._current = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        global _active
+        self._current = _active = PhaseTimings(item.nodeid)
+        try:
+            yield
+        finally:
+            timings, self._current, _active = self._current, None, None
+            sample = timings.as_dict()
+            self.samples[item.nodeid] = sample
+            self._write(self.output_dir / _file_name(item.nodeid), sample)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        with phase(f"fixture:{fixturedef.argname}"):
+            yield
+
+    def pytest_runtest_logreport(self, report):
+        if self._current is not None and report.nodeid == self._current.nodeid:
+            self._current.wall[report.when] += report.duration
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self.samples.update(getattr(node, "workeroutput", {}).get("phase_timing", {}))
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(self.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["phase_timing"] = self.samples
+        elif self.samples:
+            self._write(self.output_dir.parent / "timing_summary.json", {
+                "tests": len(self.samples),
+                "phases": summarize(self.samples),
+            })
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.samples or hasattr(self.config, "workerinput"):
+            return
+        summary = summarize(self.samples)
+        terminalreporter.write_sep("-", f"phase timing ({len(self.samples)} tests)")
+        terminalreporter.write_line(f"{'phase':<32}{'tests':>7}{'p50 ms':>10}{'p95 ms':>10}{'total s':>10}")
+        for name, stats in sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True):
+            terminalreporter.write_line(
+                f"{name:<32}{stats['tests']:>7}{stats['p50'] * 1000:>10.1f}"
+                f"{stats['p95'] * 1000:>10.1f}{stats['total']:>10.2f}"
+            )
+        terminalreporter.write_line(f"per-test breakdowns: {self.output_dir}/")
+
+    @staticmethod
+    def _write(path: Path, data: dict):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
@@ -0,0 +1,105 @@
+"""
+Playwright Trace Chunks
+Tracing is started once per (pooled) browser context; every test records its
+own chunk, which is written to disk only when the test failed or is a retry
+"""
+import re
+import weakref
+from pathlib import Path
+
+from utils import event_log
+from utils.timing import phase
+
+MODES = ("off", "on", "retain-on-failure", "on-first-retry")
+CAPTURE = ("screenshots", "snapshots", "sources")
+
+
+class TraceRecorder:
+    """
+    Per-worker trace chunk recorder
+
+    Modes:
+        off               - no tracing
+        on                - every test's chunk is saved
+        retain-on-failure - chunks are recorded for every test, saved for failures and retries
+        on-first-retry    - chunks are recorded (and saved) only for the first retry of a test
+    """
+
+    def __init__(self, mode: str = "off", output_dir: str = "reports/traces",
+                 capture: tuple = ("screenshots", "snapshots")):
+        """
+        Initialize the recorder
+        Args:
+            mode: One of MODES
+            output_dir: Folder for saved trace zips
+            capture: Subset of CAPTURE (DOM snapshots, screencast frames, test sources)
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unsupported trace mode: {mode}")
+        unknown = set(capture) - set(CAPTURE)
+        if unknown:
+            raise ValueError(f"Unknown trace capture option(s): {', '.join(sorted(unknown))}")
+        self.mode = mode
+        self.output_dir = Path(output_dir)
+        self.capture = tuple(capture)
+        self.stats = {"chunks": 0, "saved": 0, "discarded": 0}
+        self._tracing = weakref.WeakSet()
+
+    def wants_chunk(self, attempt: int) -> bool:
+        """Whether a test on its given attempt (1 = first run) records a chunk"""
+        if self.mode == "off":
+            return False
+        if self.mode == "on-first-retry":
+            return attempt == 2
+        return True
+
+    def start(self, context, title: str) -> bool:
+        """
+        Start a chunk for a test, starting tracing on the context first if needed
+        Returns:
+            bool: Whether a chunk is being recorded
+        """
+        try:
+            if context in self._tracing:
+                with phase("trace_chunk"):
+                    context.tracing.start_chunk(title=title)
+            else:
+                # start() opens the first chunk itself
+                with phase("trace_start"):
+                    context.tracing.start(title=title, **{option: option in self.capture for option in CAPTURE})
+                self._tracing.add(context)
+        except Exception as error:
+            event_log.warning("trace_start_failed", error=str(error))
+            return False
+        self.stats["chunks"] += 1
+        return True
+
+    def stop(self, context, nodeid: str, keep: bool, attempt: int = 1):
+        """
+        End the test's chunk, writing it only if it is kept
+        Returns:
+            Path: Saved trace, or None when discarded
+        """
+        path = self.path_for(nodeid, attempt) if keep else None
+        try:
+            with phase("trace_chunk"):
+                if path:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    context.tracing.stop_chunk(path=path)
+                else:
+                    context.tracing.stop_chunk()
+        except Exception as error:
+            event_log.warning("trace_stop_failed", error=str(error))
+            return None
+        self.stats["saved" if path else "discarded"] += 1
+        return path
+
+    def keep(self, failed: bool, attempt: int) -> bool:
+        if self.mode in ("on", "on-first-retry"):
+            return True
+        return failed or attempt > 1
+
+    def path_for(self, nodeid: str, attempt: int = 1) -> Path:
+        name = re.sub(r"[^\w.-]+", "_", nodeid).strip("_")
+        suffix = f"-retry{attempt - 1}" if attempt > 1 else ""
+        return self.output_dir / f"{name}{suffix}.zip"
@@ -0,0 +1,147 @@
+"""
+Account User Pool
+Provisions a set of DemoQA users with tokens up front (in parallel), hands them
+out per test, refreshes tokens close to expiry and deletes the users at the end
+"""
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+
+@dataclass
+class PooledUser:
+    """A provisioned account and its current token"""
+    username: str
+    password: str
+    user_id: str
+    token: str = None
+    expires: datetime = None
+
+    @property
+    def auth_headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"}
+
+    @property
+    def credentials(self) -> dict:
+        return {"userName": self.username, "password": self.password}
+
+
+def _parse_expires(value: str):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+class UserPool:
+    """
+    Per-process pool of ready-to-use accounts.
+    Usernames and passwords come from the worker's DataFactory, so xdist
+    workers (and parallel CI jobs) never collide.
+    """
+
+    def __init__(self, client, factory, size: int = 2,
+                 refresh_margin: timedelta = timedelta(minutes=5), acquire_timeout: float = 60.0):
+        """
+        Initialize the pool (nothing is created until provision())
+        Args:
+            client: API client with post/delete methods (see api_request)
+            factory: utils.data_factory.DataFactory for usernames and passwords
+            size: Users to provision
+            refresh_margin: Tokens expiring sooner than this are regenerated on acquire
+            acquire_timeout: Seconds to wait for a free user
+        """
+        self.client = client
+        self.factory = factory
+        self.size = size
+        self.refresh_margin = refresh_margin
+        self.acquire_timeout = acquire_timeout
+        self.users = []
+        self.errors = []
+        self._free = queue.Queue()
+
+    def provision(self):
+        """Create all users and their tokens in parallel"""
+        with ThreadPoolExecutor(max_workers=max(1, self.size)) as executor:
+            results = list(executor.map(self._create, range(self.size)))
+        for user in results:
+            if isinstance(user, PooledUser):
+                self.users.append(user)
+                self._free.put(user)
+            else:
+                self.errors.append(user)
+        return self
+
+    def acquire(self) -> PooledUser:
+        """
+        Take a user for one test (its token is refreshed if close to expiry)
+        Returns:
+            PooledUser: A user nobody else holds
+        """
+        if not self.users:
+            raise RuntimeError(f"User pool is empty: {'; '.join(self.errors) or 'not provisioned'}")
+        user = self._free.get(timeout=self.acquire_timeout)
+        if self._needs_refresh(user):
+            try:
+                self.refresh(user)
+            except Exception:
+                self._free.put(user)  # still provisioned: the next acquire retries the token
+                raise
+        return user
+
+    def release(self, user: PooledUser):
+        self._free.put(user)
+
+    def refresh(self, user: PooledUser):
+        """Generate a new token for a user"""
+        response = self.client.post("/Account/v1/GenerateToken", json=user.credentials)
+        body = response.json() if response.status_code == 200 else {}
+        if not body.get("token"):
+            raise RuntimeError(f"Token refresh failed for {user.username}: {response.status_code} {response.text}")
+        user.token = body["token"]
+        user.expires = _parse_expires(body.get("expires"))
+
+    def close(self):
+        """Delete every provisioned user (in parallel)"""
+        if not self.users:
+            return
+        with ThreadPoolExecutor(max_workers=len(self.users)) as executor:
+            list(executor.map(self._delete, self.users))
+        self.users = []
+
+    def _needs_refresh(self, user: PooledUser) -> bool:
+        if not user.token:
+            return True
+        if user.expires is None:
+            return False
+        return user.expires - datetime.now(timezone.utc) < self.refresh_margin
+
+    def _create(self, index: int):
+        user = PooledUser(
+            username=self.factory.username("pool"),
+            password=self.factory.password(),
+            user_id="",
+        )
+        try:
+            response = self.client.post("/Account/v1/User", json=user.credentials)
+            if response.status_code != 201:
+                return f"{user.username}: create returned {response.status_code}"
+            user.user_id = response.json()["userID"]
+        except Exception as error:
+            return f"{user.username}: {error}"
+        try:
+            self.refresh(user)
+        except Exception:
+            pass  # the user exists (and must be cleaned up); acquire() retries the token
+        return user
+
+    def _delete(self, user: PooledUser):
+        try:
+            if self._needs_refresh(user):
+                self.refresh(user)
+            self.client.delete(f"/Account/v1/User/{user.user_id}", headers=user.auth_headers)
+        except Exception:
+            pass  # best effort: the account is throwaway